@@ -12,4 +12,5 @@ Adapter Organization:
 - scheduler/: Adapters for driving the poll loop (daemon, cron, etc.)
 - cli/: Command-line interface and management commands
 - webhook/: HTTP webhook receiver for external triggers
+- tracing.py: Optional OpenTelemetry spans around adapter calls
 """
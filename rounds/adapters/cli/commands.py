@@ -234,7 +234,7 @@ class CLICommandHandler:
         lines.append("")
 
         # Status and counts
-        lines.append(f"Status: {sig.status.value}")
+        lines.append(f"Status: {sig.status}")
         lines.append(f"Occurrences: {sig.occurrence_count}")
         lines.append(f"First Seen: {sig.first_seen.isoformat()}")
         lines.append(f"Last Seen: {sig.last_seen.isoformat()}")
@@ -301,7 +301,7 @@ class CLICommandHandler:
                             "fingerprint": sig.fingerprint,
                             "error_type": sig.error_type,
                             "service": sig.service,
-                            "status": sig.status.value,
+                            "status": sig.status,
                             "occurrence_count": sig.occurrence_count,
                             "first_seen": sig.first_seen.isoformat(),
                             "last_seen": sig.last_seen.isoformat(),
@@ -402,7 +402,7 @@ class CLICommandHandler:
             lines.append(f"Fingerprint: {sig.fingerprint}")
             lines.append(f"Service:     {sig.service}")
             lines.append(f"Error Type:  {sig.error_type}")
-            lines.append(f"Status:      {sig.status.value}")
+            lines.append(f"Status:      {sig.status}")
             lines.append(f"Occurrences: {sig.occurrence_count}")
             lines.append(f"First Seen:  {sig.first_seen.isoformat()}")
             lines.append(f"Last Seen:   {sig.last_seen.isoformat()}")
@@ -4,4 +4,6 @@ Implementations support multiple LLM providers:
 - Claude Code (headless CLI mode)
 - OpenAI API
 - Local LLMs (future)
+
+CachingDiagnosisAdapter wraps any of these to reuse recent diagnoses.
 """
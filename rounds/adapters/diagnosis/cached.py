@@ -0,0 +1,120 @@
+"""Caching diagnosis adapter.
+
+Implements DiagnosisPort by wrapping another DiagnosisPort and reusing
+diagnoses for investigation contexts that have already been diagnosed.
+LLM calls dominate the cost and latency of an investigation, and a
+recurring signature often produces the same context on every cycle.
+"""
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import replace
+
+from rounds.core.models import Diagnosis, InvestigationContext
+from rounds.core.ports import DiagnosisPort
+
+logger = logging.getLogger(__name__)
+
+
+class CachingDiagnosisAdapter(DiagnosisPort):
+    """In-memory, TTL-bounded diagnosis cache around another DiagnosisPort."""
+
+    def __init__(
+        self,
+        inner: DiagnosisPort,
+        ttl_seconds: float,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the caching adapter.
+
+        Args:
+            inner: DiagnosisPort that performs diagnoses on a cache miss.
+            ttl_seconds: How long a cached diagnosis may be reused.
+            max_entries: Maximum cached diagnoses; least recently used
+                entries are evicted first.
+            clock: Monotonic time source, injectable for tests.
+        """
+        self.inner = inner
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, Diagnosis]] = OrderedDict()
+
+    async def diagnose(self, context: InvestigationContext) -> Diagnosis:
+        """Return a cached diagnosis for this context, or delegate and cache.
+
+        A cached diagnosis is returned with cost_usd set to 0.0 so budget
+        tracking only counts spend that actually happened.
+        """
+        key = self._context_key(context)
+        cached = self._lookup(key)
+        if cached is not None:
+            logger.info(
+                f"Reusing cached diagnosis for signature {context.signature.fingerprint}",
+                extra={"fingerprint": context.signature.fingerprint},
+            )
+            return replace(cached, cost_usd=0.0)
+
+        diagnosis = await self.inner.diagnose(context)
+
+        self._entries[key] = (self._clock() + self.ttl_seconds, diagnosis)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+        return diagnosis
+
+    async def estimate_cost(self, context: InvestigationContext) -> float:
+        """Estimate cost, which is zero when a cached diagnosis will be reused."""
+        if self._lookup(self._context_key(context)) is not None:
+            return 0.0
+        return await self.inner.estimate_cost(context)
+
+    async def close(self) -> None:
+        """Close the wrapped adapter."""
+        await self.inner.close()
+
+    def _lookup(self, key: str) -> Diagnosis | None:
+        """Return the unexpired diagnosis for a key, dropping it if expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, diagnosis = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return diagnosis
+
+    @staticmethod
+    def _context_key(context: InvestigationContext) -> str:
+        """Hash the parts of a context that determine its diagnosis.
+
+        Trace IDs and timestamps are left out: they differ on every
+        occurrence of the same failure without changing what the LLM sees
+        as evidence.
+        """
+        parts = [
+            context.signature.fingerprint,
+            context.codebase_path,
+        ]
+        for event in context.recent_events:
+            parts.append(event.error_type)
+            parts.append(event.error_message)
+            parts.extend(f"{f.module}:{f.function}" for f in event.stack_frames)
+        for trace in context.trace_data:
+            parts.extend(
+                f"{span.service}:{span.operation}:{span.status}"
+                for span in trace.error_spans
+            )
+        for log in context.related_logs:
+            parts.append(f"{log.severity}:{log.body}")
+        parts.extend(similar.fingerprint for similar in context.historical_context)
+
+        return hashlib.blake2b(
+            "\x1f".join(parts).encode(), digest_size=32
+        ).hexdigest()
@@ -13,6 +13,7 @@ import subprocess
 from datetime import UTC, datetime
 from typing import Any
 
+from rounds.adapters.diagnosis.limits import check_prompt_size
 from rounds.core.models import Diagnosis, InvestigationContext
 from rounds.core.ports import DiagnosisPort
 
@@ -26,15 +27,22 @@ class ClaudeCodeDiagnosisAdapter(DiagnosisPort):
         self,
         model: str = "claude-opus",
         budget_usd: float = 2.0,
+        timeout_seconds: float = 60.0,
+        max_prompt_tokens: int | None = None,
     ):
         """Initialize Claude Code diagnosis adapter.
 
         Args:
             model: Claude model to use (e.g., 'claude-opus', 'claude-sonnet')
             budget_usd: Budget per diagnosis in USD
+            timeout_seconds: Timeout for the CLI invocation
+            max_prompt_tokens: Refuse prompts estimated above this many
+                tokens without invoking the CLI (None for no limit)
         """
         self.model = model
         self.budget_usd = budget_usd
+        self.timeout_seconds = timeout_seconds
+        self.max_prompt_tokens = max_prompt_tokens
 
     async def diagnose(
         self, context: InvestigationContext
@@ -51,6 +59,7 @@ class ClaudeCodeDiagnosisAdapter(DiagnosisPort):
 
             # Build the investigation prompt
             prompt = self._build_investigation_prompt(context)
+            check_prompt_size(prompt, self.max_prompt_tokens)
 
             # Invoke Claude Code
             result = await self._invoke_claude_code(prompt)
@@ -130,7 +139,7 @@ class ClaudeCodeDiagnosisAdapter(DiagnosisPort):
 Error Type: {context.signature.error_type}
 Service: {context.signature.service}
 Message Template: {context.signature.message_template}
-Status: {context.signature.status.value}
+Status: {context.signature.status}
 Occurrence Count: {context.signature.occurrence_count}
 First Seen: {context.signature.first_seen}
 Last Seen: {context.signature.last_seen}
@@ -159,7 +168,7 @@ Last Seen: {context.signature.last_seen}
         if context.related_logs:
             prompt += f"\n## Related Logs ({len(context.related_logs)} logs)\n"
             for log in context.related_logs[:10]:
-                prompt += f"- [{log.severity.value}] {log.timestamp}: {log.body}\n"
+                prompt += f"- [{log.severity}] {log.timestamp}: {log.body}\n"
 
         # Add codebase context
         prompt += f"\n## Codebase Path: {context.codebase_path}\n"
@@ -207,7 +216,7 @@ Respond with a JSON object in exactly this format:
                         ["claude", "-p", prompt, "--output-format", "json"],
                         capture_output=True,
                         text=True,
-                        timeout=60,
+                        timeout=self.timeout_seconds,
                     )
 
                     if result.returncode != 0:
@@ -217,7 +226,9 @@ Respond with a JSON object in exactly this format:
                     return result.stdout.strip()
 
                 except subprocess.TimeoutExpired:
-                    raise TimeoutError("Claude Code CLI timed out after 60 seconds")
+                    raise TimeoutError(
+                        f"Claude Code CLI timed out after {self.timeout_seconds} seconds"
+                    )
 
             # Run in executor to avoid blocking
             output = await asyncio.to_thread(_run_claude_code)
@@ -0,0 +1,23 @@
+"""Prompt size limits shared by the diagnosis adapters."""
+
+# Rough characters per token for English prose and code, used to size
+# prompts without a model-specific tokenizer
+CHARS_PER_TOKEN = 4
+
+
+def check_prompt_size(prompt: str, max_prompt_tokens: int | None) -> None:
+    """Refuse a prompt whose estimated token count exceeds the limit.
+
+    Args:
+        prompt: The full prompt about to be sent to the model.
+        max_prompt_tokens: Largest allowed estimate (None for no limit).
+
+    Raises:
+        ValueError: If the prompt is estimated to be over the limit.
+    """
+    prompt_tokens = len(prompt) // CHARS_PER_TOKEN
+    if max_prompt_tokens is not None and prompt_tokens > max_prompt_tokens:
+        raise ValueError(
+            f"Diagnosis prompt of ~{prompt_tokens} tokens exceeds "
+            f"limit of {max_prompt_tokens}"
+        )
@@ -10,6 +10,7 @@ import logging
 from datetime import UTC, datetime
 from typing import Any
 
+from rounds.adapters.diagnosis.limits import check_prompt_size
 from rounds.core.models import Diagnosis, InvestigationContext
 from rounds.core.ports import DiagnosisPort
 
@@ -24,6 +25,9 @@ class OpenAIDiagnosisAdapter(DiagnosisPort):
         api_key: str,
         model: str = "gpt-4",
         budget_usd: float = 2.0,
+        max_output_tokens: int = 2048,
+        timeout_seconds: float = 60.0,
+        max_prompt_tokens: int | None = None,
     ):
         """Initialize OpenAI diagnosis adapter.
 
@@ -31,6 +35,10 @@ class OpenAIDiagnosisAdapter(DiagnosisPort):
             api_key: OpenAI API key.
             model: OpenAI model to use (e.g., 'gpt-4', 'gpt-4o').
             budget_usd: Budget per diagnosis in USD.
+            max_output_tokens: Maximum tokens the model may generate.
+            timeout_seconds: Timeout for the API request.
+            max_prompt_tokens: Refuse prompts estimated above this many
+                tokens without calling the API (None for no limit).
 
         Raises:
             ValueError: If API key is empty or not provided.
@@ -43,6 +51,9 @@ class OpenAIDiagnosisAdapter(DiagnosisPort):
         self.api_key = api_key
         self.model = model
         self.budget_usd = budget_usd
+        self.max_output_tokens = max_output_tokens
+        self.timeout_seconds = timeout_seconds
+        self.max_prompt_tokens = max_prompt_tokens
 
         # Lazy import to avoid requiring openai if not used
         self._client: Any | None = None
@@ -60,6 +71,12 @@ class OpenAIDiagnosisAdapter(DiagnosisPort):
                 )
         return self._client
 
+    async def close(self) -> None:
+        """Close the OpenAI client's connection pool, if one was created."""
+        if self._client is not None:
+            self._client.close()
+            self._client = None
+
     async def diagnose(
         self, context: InvestigationContext
     ) -> Diagnosis:
@@ -75,6 +92,7 @@ class OpenAIDiagnosisAdapter(DiagnosisPort):
 
             # Build the investigation prompt
             prompt = self._build_investigation_prompt(context)
+            check_prompt_size(prompt, self.max_prompt_tokens)
 
             # Invoke OpenAI
             result = await self._invoke_openai(prompt)
@@ -142,7 +160,7 @@ class OpenAIDiagnosisAdapter(DiagnosisPort):
 Error Type: {context.signature.error_type}
 Service: {context.signature.service}
 Message Template: {context.signature.message_template}
-Status: {context.signature.status.value}
+Status: {context.signature.status}
 Occurrence Count: {context.signature.occurrence_count}
 First Seen: {context.signature.first_seen}
 Last Seen: {context.signature.last_seen}
@@ -171,7 +189,7 @@ Last Seen: {context.signature.last_seen}
         if context.related_logs:
             prompt += f"\n## Related Logs ({len(context.related_logs)} logs)\n"
             for log in context.related_logs[:10]:
-                prompt += f"- [{log.severity.value}] {log.timestamp}: {log.body}\n"
+                prompt += f"- [{log.severity}] {log.timestamp}: {log.body}\n"
 
         # Add codebase context
         prompt += f"\n## Codebase Path: {context.codebase_path}\n"
@@ -230,7 +248,8 @@ Respond with a JSON object in exactly this format:
                         },
                     ],
                     temperature=0.7,
-                    timeout=60,
+                    max_tokens=self.max_output_tokens,
+                    timeout=self.timeout_seconds,
                 )
 
                 # Extract response text
@@ -45,14 +45,6 @@ class GitHubIssueNotificationAdapter(NotificationPort):
         self.assignees = assignees or []
         self._client: httpx.AsyncClient | None = None
 
-    async def __aenter__(self) -> "GitHubIssueNotificationAdapter":
-        """Async context manager entry."""
-        return self
-
-    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Async context manager exit."""
-        await self.close()
-
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create async HTTP client.
 
@@ -200,7 +192,7 @@ class GitHubIssueNotificationAdapter(NotificationPort):
         lines.append("## Error Information")
         lines.append(f"- **Error Type**: {signature.error_type}")
         lines.append(f"- **Service**: {signature.service}")
-        lines.append(f"- **Status**: {signature.status.value}")
+        lines.append(f"- **Status**: {signature.status}")
         lines.append(f"- **Occurrences**: {signature.occurrence_count}")
         lines.append("")
 
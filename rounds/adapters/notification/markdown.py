@@ -252,7 +252,7 @@ class MarkdownNotificationAdapter(NotificationPort):
         lines.append(f"- **Service**: {signature.service}")
         lines.append(f"- **Signature ID**: {signature.id}")
         lines.append(f"- **Fingerprint**: `{signature.fingerprint}`")
-        lines.append(f"- **Status**: {signature.status.value}")
+        lines.append(f"- **Status**: {signature.status}")
         lines.append("")
 
         # Failure pattern
@@ -264,7 +264,7 @@ class MarkdownNotificationAdapter(NotificationPort):
         lines.append(f"- **Last Seen**: {signature.last_seen.isoformat()}")
 
         if signature.tags:
-            tags_str = ", ".join(f"`{tag}`" for tag in sorted(signature.tags))
+            tags_str = ", ".join(f"`{tag}`" for tag in signature.tags)
             lines.append(f"- **Tags**: {tags_str}")
 
         lines.append("")
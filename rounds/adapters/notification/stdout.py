@@ -58,7 +58,7 @@ class StdoutNotificationAdapter(NotificationPort):
             "=" * 80,
             f"Error Type: {signature.error_type}",
             f"Service: {signature.service}",
-            f"Status: {signature.status.value.upper()}",
+            f"Status: {signature.status.upper()}",
         ]
         return "\n".join(lines)
 
@@ -80,7 +80,7 @@ class StdoutNotificationAdapter(NotificationPort):
         ]
 
         if signature.tags:
-            tags_str = ", ".join(sorted(signature.tags))
+            tags_str = ", ".join(signature.tags)
             lines.append(f"Tags: {tags_str}")
 
         return "\n".join(lines)
@@ -36,6 +36,8 @@ class DaemonScheduler:
         self.budget_limit = budget_limit
         self.running = False
         self._task: asyncio.Task[None] | None = None
+        # Set by stop() to cut short the wait between poll cycles
+        self._stop_event = asyncio.Event()
         self._daily_cost_usd = 0.0
         self._budget_date = datetime.now(UTC).date()
         self._budget_lock = asyncio.Lock()
@@ -55,6 +57,7 @@ class DaemonScheduler:
             return
 
         self.running = True
+        self._stop_event.clear()
         logger.info(
             f"Starting daemon scheduler with {self.poll_interval_seconds}s interval"
         )
@@ -80,6 +83,7 @@ class DaemonScheduler:
 
         logger.info("Stopping daemon scheduler...")
         self.running = False
+        self._stop_event.set()
 
         if self._task:
             self._task.cancel()
@@ -203,12 +207,14 @@ class DaemonScheduler:
                     f"Error in poll cycle #{cycle_number}: {e}", exc_info=True
                 )
 
-            # Wait before next cycle
+            # Wait before next cycle; stop() ends the wait immediately
             if self.running:
                 try:
-                    await asyncio.sleep(self.poll_interval_seconds)
-                except asyncio.CancelledError:
-                    raise
+                    await asyncio.wait_for(
+                        self._stop_event.wait(), timeout=self.poll_interval_seconds
+                    )
+                except TimeoutError:
+                    pass
 
     async def _is_budget_exceeded(self) -> bool:
         """Check if daily budget limit has been exceeded.
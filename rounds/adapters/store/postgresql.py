@@ -7,6 +7,8 @@ Provides ACID guarantees for signature state with scalability for production use
 import asyncio
 import json
 import logging
+import sys
+from collections.abc import AsyncIterator, Sequence
 from datetime import datetime
 from typing import Any
 
@@ -136,6 +138,14 @@ class PostgreSQLSignatureStore(SignatureStorePort):
                 await conn.execute(
                     "CREATE INDEX IF NOT EXISTS idx_status ON signatures(status)"
                 )
+                # Serves get_all/get_pending_investigation status filters in
+                # their ORDER BY order, avoiding a sort of the matching rows
+                await conn.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_status_last_seen
+                    ON signatures(status, last_seen DESC, occurrence_count DESC)
+                    """
+                )
                 await conn.execute(
                     "CREATE INDEX IF NOT EXISTS idx_service ON signatures(service)"
                 )
@@ -184,8 +194,10 @@ class PostgreSQLSignatureStore(SignatureStorePort):
                 return None
             return self._row_to_signature(row)
 
-    async def save(self, signature: Signature) -> None:
-        """Create or update a signature."""
+    async def get_by_fingerprints(
+        self, fingerprints: Sequence[str]
+    ) -> dict[str, Signature]:
+        """Look up several signatures by fingerprint in a single query."""
         await self._init_schema()
         await self._init_pool()
         if self._pool is None:
@@ -194,15 +206,38 @@ class PostgreSQLSignatureStore(SignatureStorePort):
                 "Check PostgreSQL connection and configuration."
             )
 
+        unique = list(dict.fromkeys(fingerprints))
+        if not unique:
+            return {}
+
         async with self._pool.acquire() as conn:
-            diagnosis_json = None
-            if signature.diagnosis is not None:
-                diagnosis_json = self._serialize_diagnosis(signature.diagnosis)
+            rows = await conn.fetch(
+                "SELECT * FROM signatures WHERE fingerprint = ANY($1::text[])",
+                unique,
+            )
+            signatures = (self._row_to_signature(row) for row in rows)
+            return {s.fingerprint: s for s in signatures}
+
+    async def save(self, signature: Signature) -> None:
+        """Create or update a signature."""
+        await self.save_many([signature])
+
+    async def save_many(self, signatures: Sequence[Signature]) -> None:
+        """Create or update several signatures with one prepared statement."""
+        await self._init_schema()
+        await self._init_pool()
+        if self._pool is None:
+            raise RuntimeError(
+                "Database pool not initialized. "
+                "Check PostgreSQL connection and configuration."
+            )
 
-            tags_list = sorted(list(signature.tags))
+        if not signatures:
+            return
 
+        async with self._pool.acquire() as conn:
             # Use INSERT ... ON CONFLICT for upsert
-            await conn.execute(
+            await conn.executemany(
                 """
                 INSERT INTO signatures
                 (id, fingerprint, error_type, service, message_template,
@@ -222,25 +257,59 @@ class PostgreSQLSignatureStore(SignatureStorePort):
                     diagnosis_json = $11,
                     tags = $12
                 """,
-                signature.id,
-                signature.fingerprint,
-                signature.error_type,
-                signature.service,
-                signature.message_template,
-                signature.stack_hash,
-                signature.first_seen,
-                signature.last_seen,
-                signature.occurrence_count,
-                signature.status.value,
-                diagnosis_json,
-                tags_list,
+                [self._signature_to_args(signature) for signature in signatures],
             )
 
+    def _signature_to_args(self, signature: Signature) -> tuple[Any, ...]:
+        """Convert a signature to INSERT arguments."""
+        diagnosis_json = None
+        if signature.diagnosis is not None:
+            diagnosis_json = self._serialize_diagnosis(signature.diagnosis)
+
+        return (
+            signature.id,
+            signature.fingerprint,
+            signature.error_type,
+            signature.service,
+            signature.message_template,
+            signature.stack_hash,
+            signature.first_seen,
+            signature.last_seen,
+            signature.occurrence_count,
+            signature.status,
+            diagnosis_json,
+            list(signature.tags),
+        )
+
     async def update(self, signature: Signature) -> None:
         """Update an existing signature."""
         # PostgreSQL upsert is idempotent, so save and update are the same
         await self.save(signature)
 
+    async def set_status(
+        self, signature_id: str, status: SignatureStatus
+    ) -> str | None:
+        """Set a signature's status in a single conditional UPDATE."""
+        await self._init_schema()
+        await self._init_pool()
+        if self._pool is None:
+            raise RuntimeError(
+                "Database pool not initialized. "
+                "Check PostgreSQL connection and configuration."
+            )
+
+        async with self._pool.acquire() as conn:
+            fingerprint: str | None = await conn.fetchval(
+                """
+                UPDATE signatures SET status = $2
+                WHERE id = $1 AND status != $2
+                RETURNING fingerprint
+                """,
+                signature_id,
+                status,
+            )
+            return fingerprint
+
     async def get_pending_investigation(self) -> list[Signature]:
         """Return signatures with status NEW, ordered by priority."""
         await self._init_schema()
@@ -258,7 +327,7 @@ class PostgreSQLSignatureStore(SignatureStorePort):
                 WHERE status = $1
                 ORDER BY last_seen DESC, occurrence_count DESC
                 """,
-                SignatureStatus.NEW.value,
+                SignatureStatus.NEW,
             )
             return [self._row_to_signature(row) for row in rows]
 
@@ -289,10 +358,52 @@ class PostgreSQLSignatureStore(SignatureStorePort):
                     WHERE status = $1
                     ORDER BY last_seen DESC, occurrence_count DESC
                     """,
-                    status.value,
+                    status,
                 )
             return [self._row_to_signature(row) for row in rows]
 
+    async def iter_all(
+        self, status: SignatureStatus | None = None, batch_size: int = 500
+    ) -> AsyncIterator[Signature]:
+        """Stream all signatures through a server-side cursor.
+
+        Rows are prefetched ``batch_size`` at a time.
+
+        The pooled connection and its read transaction are held until the
+        iteration finishes or the generator is closed.
+        """
+        await self._init_schema()
+        await self._init_pool()
+        if self._pool is None:
+            raise RuntimeError(
+                "Database pool not initialized. "
+                "Check PostgreSQL connection and configuration."
+            )
+
+        async with self._pool.acquire() as conn:
+            # asyncpg cursors are only valid inside a transaction
+            async with conn.transaction():
+                if status is None:
+                    cursor = conn.cursor(
+                        """
+                        SELECT * FROM signatures
+                        ORDER BY last_seen DESC, occurrence_count DESC
+                        """,
+                        prefetch=batch_size,
+                    )
+                else:
+                    cursor = conn.cursor(
+                        """
+                        SELECT * FROM signatures
+                        WHERE status = $1
+                        ORDER BY last_seen DESC, occurrence_count DESC
+                        """,
+                        status,
+                        prefetch=batch_size,
+                    )
+                async for row in cursor:
+                    yield self._row_to_signature(row)
+
     async def get_similar(
         self, signature: Signature, limit: int = 5
     ) -> list[Signature]:
@@ -423,13 +534,13 @@ class PostgreSQLSignatureStore(SignatureStorePort):
                     diagnosis = None
 
             # Convert tags array
-            tags_set = frozenset(tags) if tags else frozenset()
+            tags_tuple = tuple(tags) if tags else ()
 
             return Signature(
                 id=sig_id,
                 fingerprint=fingerprint,
-                error_type=error_type,
-                service=service,
+                error_type=sys.intern(error_type),
+                service=sys.intern(service),
                 message_template=message_template,
                 stack_hash=stack_hash,
                 first_seen=first_seen,
@@ -437,7 +548,7 @@ class PostgreSQLSignatureStore(SignatureStorePort):
                 occurrence_count=occurrence_count,
                 status=SignatureStatus(status),
                 diagnosis=diagnosis,
-                tags=tags_set,
+                tags=tags_tuple,
             )
 
         except ValueError as e:
@@ -7,6 +7,8 @@ Provides ACID guarantees for signature state with zero operational overhead.
 import asyncio
 import json
 import logging
+import sys
+from collections.abc import AsyncIterator, Sequence
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -22,6 +24,9 @@ logger = logging.getLogger(__name__)
 class SQLiteSignatureStore(SignatureStorePort):
     """SQLite-backed signature store with connection pooling and async access."""
 
+    # Fingerprints per IN (...) query in get_by_fingerprints
+    _FINGERPRINT_BATCH_SIZE = 500
+
     def __init__(self, db_path: str, pool_size: int = 5):
         """Initialize SQLite store with connection pooling.
 
@@ -103,6 +108,14 @@ class SQLiteSignatureStore(SignatureStorePort):
                 await conn.execute(
                     "CREATE INDEX IF NOT EXISTS idx_status ON signatures(status)"
                 )
+                # Serves get_all/get_pending_investigation status filters in
+                # their ORDER BY order, avoiding a sort of the matching rows
+                await conn.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_status_last_seen
+                    ON signatures(status, last_seen DESC, occurrence_count DESC)
+                    """
+                )
                 await conn.execute(
                     "CREATE INDEX IF NOT EXISTS idx_service ON signatures(service)"
                 )
@@ -146,20 +159,49 @@ class SQLiteSignatureStore(SignatureStorePort):
         finally:
             await self._return_connection(conn)
 
-    async def save(self, signature: Signature) -> None:
-        """Create or update a signature."""
+    async def get_by_fingerprints(
+        self, fingerprints: Sequence[str]
+    ) -> dict[str, Signature]:
+        """Look up several signatures by fingerprint with batched IN queries."""
         await self._init_schema()
 
+        unique = list(dict.fromkeys(fingerprints))
+        found: dict[str, Signature] = {}
+        if not unique:
+            return found
+
         conn = await self._get_connection()
         try:
-            diagnosis_json = None
-            if signature.diagnosis is not None:
-                diagnosis_json = self._serialize_diagnosis(signature.diagnosis)
+            # Chunk to stay under SQLite's bound-parameter limit
+            for start in range(0, len(unique), self._FINGERPRINT_BATCH_SIZE):
+                chunk = unique[start : start + self._FINGERPRINT_BATCH_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                cursor = await conn.execute(
+                    f"SELECT * FROM signatures WHERE fingerprint IN ({placeholders})",
+                    chunk,
+                )
+                for row in await cursor.fetchall():
+                    signature = self._row_to_signature(row)
+                    found[signature.fingerprint] = signature
+            return found
+        finally:
+            await self._return_connection(conn)
+
+    async def save(self, signature: Signature) -> None:
+        """Create or update a signature."""
+        await self.save_many([signature])
 
-            tags_json = json.dumps(sorted(signature.tags))
+    async def save_many(self, signatures: Sequence[Signature]) -> None:
+        """Create or update several signatures in one transaction."""
+        await self._init_schema()
+
+        if not signatures:
+            return
 
+        conn = await self._get_connection()
+        try:
             # Try insert, fall back to update if exists
-            await conn.execute(
+            await conn.executemany(
                 """
                 INSERT OR REPLACE INTO signatures
                 (id, fingerprint, error_type, service, message_template,
@@ -167,30 +209,60 @@ class SQLiteSignatureStore(SignatureStorePort):
                  diagnosis_json, tags)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """,
-                (
-                    signature.id,
-                    signature.fingerprint,
-                    signature.error_type,
-                    signature.service,
-                    signature.message_template,
-                    signature.stack_hash,
-                    signature.first_seen.isoformat(),
-                    signature.last_seen.isoformat(),
-                    signature.occurrence_count,
-                    signature.status.value,
-                    diagnosis_json,
-                    tags_json,
-                ),
+                [self._signature_to_row(signature) for signature in signatures],
             )
             await conn.commit()
         finally:
             await self._return_connection(conn)
 
+    def _signature_to_row(self, signature: Signature) -> tuple[Any, ...]:
+        """Convert a signature to INSERT parameters."""
+        diagnosis_json = None
+        if signature.diagnosis is not None:
+            diagnosis_json = self._serialize_diagnosis(signature.diagnosis)
+
+        return (
+            signature.id,
+            signature.fingerprint,
+            signature.error_type,
+            signature.service,
+            signature.message_template,
+            signature.stack_hash,
+            signature.first_seen.isoformat(),
+            signature.last_seen.isoformat(),
+            signature.occurrence_count,
+            signature.status,
+            diagnosis_json,
+            json.dumps(signature.tags),
+        )
+
     async def update(self, signature: Signature) -> None:
         """Update an existing signature."""
         # SQLite doesn't distinguish between insert and update with INSERT OR REPLACE
         await self.save(signature)
 
+    async def set_status(
+        self, signature_id: str, status: SignatureStatus
+    ) -> str | None:
+        """Set a signature's status in a single conditional UPDATE."""
+        await self._init_schema()
+
+        conn = await self._get_connection()
+        try:
+            cursor = await conn.execute(
+                """
+                UPDATE signatures SET status = ?
+                WHERE id = ? AND status != ?
+                RETURNING fingerprint
+                """,
+                (status, signature_id, status),
+            )
+            row = await cursor.fetchone()
+            await conn.commit()
+            return row[0] if row is not None else None
+        finally:
+            await self._return_connection(conn)
+
     async def get_pending_investigation(self) -> list[Signature]:
         """Return signatures with status NEW, ordered by priority."""
         await self._init_schema()
@@ -203,7 +275,7 @@ class SQLiteSignatureStore(SignatureStorePort):
                 WHERE status = ?
                 ORDER BY last_seen DESC, occurrence_count DESC
                 """,
-                (SignatureStatus.NEW.value,),
+                (SignatureStatus.NEW,),
             )
             rows = await cursor.fetchall()
             return [self._row_to_signature(row) for row in rows]
@@ -232,13 +304,49 @@ class SQLiteSignatureStore(SignatureStorePort):
                     WHERE status = ?
                     ORDER BY last_seen DESC, occurrence_count DESC
                     """,
-                    (status.value,),
+                    (status,),
                 )
             rows = await cursor.fetchall()
             return [self._row_to_signature(row) for row in rows]
         finally:
             await self._return_connection(conn)
 
+    async def iter_all(
+        self, status: SignatureStatus | None = None, batch_size: int = 500
+    ) -> AsyncIterator[Signature]:
+        """Stream all signatures, optionally filtered by status.
+
+        Rows are read from the cursor ``batch_size`` at a time, and the pooled
+        connection is held until the iteration finishes or the generator is
+        closed.
+        """
+        await self._init_schema()
+
+        conn = await self._get_connection()
+        try:
+            if status is None:
+                cursor = await conn.execute(
+                    """
+                    SELECT * FROM signatures
+                    ORDER BY last_seen DESC, occurrence_count DESC
+                    """
+                )
+            else:
+                cursor = await conn.execute(
+                    """
+                    SELECT * FROM signatures
+                    WHERE status = ?
+                    ORDER BY last_seen DESC, occurrence_count DESC
+                    """,
+                    (status,),
+                )
+            cursor.iter_chunk_size = batch_size
+            async with cursor:
+                async for row in cursor:
+                    yield self._row_to_signature(row)
+        finally:
+            await self._return_connection(conn)
+
     async def get_similar(
         self, signature: Signature, limit: int = 5
     ) -> list[Signature]:
@@ -380,7 +488,7 @@ class SQLiteSignatureStore(SignatureStorePort):
 
             # Parse tags
             try:
-                tags = frozenset(json.loads(tags_json))
+                tags = tuple(json.loads(tags_json))
             except (json.JSONDecodeError, TypeError) as e:
                 # Data corruption is a critical error - raise to surface the issue
                 logger.error(
@@ -396,8 +504,8 @@ class SQLiteSignatureStore(SignatureStorePort):
             return Signature(
                 id=sig_id,
                 fingerprint=fingerprint,
-                error_type=error_type,
-                service=service,
+                error_type=sys.intern(error_type),
+                service=sys.intern(service),
                 message_template=message_template,
                 stack_hash=stack_hash,
                 first_seen=first_seen_dt,
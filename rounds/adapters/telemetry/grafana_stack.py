@@ -15,12 +15,15 @@ view of errors, traces, and logs.
 
 import json
 import logging
-from collections.abc import Callable
+import sys
+from collections.abc import Callable, Sequence
 from datetime import UTC, datetime, timedelta
+from types import MappingProxyType
 from typing import Any
 
 import httpx
 
+from rounds.adapters.telemetry.transport import retrying_transport
 from rounds.core.models import (
     ErrorEvent,
     LogEntry,
@@ -73,6 +76,8 @@ class GrafanaStackTelemetryAdapter(TelemetryPort):
         loki_url: str,
         prometheus_url: str = "",
         fingerprinter: Callable[[ErrorEvent], str] | None = None,
+        timeout: float = 30.0,
+        max_retries: int = 2,
     ):
         """Initialize Grafana Stack adapter.
 
@@ -82,19 +87,31 @@ class GrafanaStackTelemetryAdapter(TelemetryPort):
             prometheus_url: Optional base URL for Prometheus (e.g., http://localhost:9090)
             fingerprinter: Function to compute fingerprints from ErrorEvent.
                 If None, imported from core.fingerprint at runtime.
+            timeout: Timeout in seconds for each API request.
+            max_retries: Retries for requests that fail to connect.
         """
         self.tempo_url = tempo_url.rstrip("/")
         self.loki_url = loki_url.rstrip("/")
         self.prometheus_url = prometheus_url.rstrip("/") if prometheus_url else ""
         self._fingerprinter = fingerprinter
 
-        self.tempo_client = httpx.AsyncClient(base_url=self.tempo_url, timeout=30.0)
-        self.loki_client = httpx.AsyncClient(base_url=self.loki_url, timeout=30.0)
+        self.tempo_client = httpx.AsyncClient(
+            base_url=self.tempo_url,
+            timeout=timeout,
+            transport=retrying_transport(self.tempo_url, max_retries),
+        )
+        self.loki_client = httpx.AsyncClient(
+            base_url=self.loki_url,
+            timeout=timeout,
+            transport=retrying_transport(self.loki_url, max_retries),
+        )
         self.prometheus_client: httpx.AsyncClient | None = None
 
         if self.prometheus_url:
             self.prometheus_client = httpx.AsyncClient(
-                base_url=self.prometheus_url, timeout=30.0
+                base_url=self.prometheus_url,
+                timeout=timeout,
+                transport=retrying_transport(self.prometheus_url, max_retries),
             )
 
     def _get_fingerprinter(self) -> Callable[[ErrorEvent], str]:
@@ -109,14 +126,6 @@ class GrafanaStackTelemetryAdapter(TelemetryPort):
         from rounds.core.fingerprint import Fingerprinter
         return Fingerprinter().fingerprint
 
-    async def __aenter__(self) -> "GrafanaStackTelemetryAdapter":
-        """Async context manager entry."""
-        return self
-
-    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Async context manager exit."""
-        await self.close()
-
     async def close(self) -> None:
         """Close all HTTP clients and clean up resources."""
         await self.tempo_client.aclose()
@@ -239,12 +248,12 @@ class GrafanaStackTelemetryAdapter(TelemetryPort):
             return ErrorEvent(
                 trace_id=log_data.get("trace_id", ""),
                 span_id=log_data.get("span_id", ""),
-                service=service,
-                error_type=error_type,
+                service=sys.intern(service),
+                error_type=sys.intern(error_type),
                 error_message=error_message,
                 stack_frames=tuple(stack_frames),
                 timestamp=timestamp,
-                attributes=log_data,
+                attributes=MappingProxyType(log_data),
                 severity=Severity.ERROR,
             )
 
@@ -292,10 +301,12 @@ class GrafanaStackTelemetryAdapter(TelemetryPort):
                         )
                         module = filename.replace(".py", "").replace("/", ".")
 
+                        # Frame strings repeat across events; intern them so every
+                        # frame shares one copy
                         frame = StackFrame(
-                            module=module,
-                            function=function,
-                            filename=filename,
+                            module=sys.intern(module),
+                            function=sys.intern(function),
+                            filename=sys.intern(filename),
                             lineno=None,
                         )
                         frames.append(frame)
@@ -402,7 +413,7 @@ class GrafanaStackTelemetryAdapter(TelemetryPort):
                          span_data.get("startTimeUnixNano", 0)) / 1e6
                     ),
                     status=status,
-                    attributes=attributes,
+                    attributes=MappingProxyType(attributes),
                     events=tuple(),
                     children=children,
                 )
@@ -438,9 +449,14 @@ class GrafanaStackTelemetryAdapter(TelemetryPort):
             logger.error(f"Unexpected error fetching trace: {e}", exc_info=True)
             raise
 
-    async def get_traces(self, trace_ids: list[str]) -> tuple[list[TraceTree], PartialResultsInfo]:
+    async def get_traces(
+        self, trace_ids: list[str]
+    ) -> tuple[Sequence[TraceTree], PartialResultsInfo]:
         """Batch retrieve multiple traces.
 
+        Validates every trace ID, then fetches them concurrently through
+        the port's bounded fan-out over get_trace().
+
         Args:
             trace_ids: List of trace IDs to retrieve.
 
@@ -451,34 +467,12 @@ class GrafanaStackTelemetryAdapter(TelemetryPort):
         Raises:
             ValueError: If any trace ID format is invalid.
         """
-        from rounds.core.models import PartialResultsInfo
-
         # Validate all trace IDs upfront
         for trace_id in trace_ids:
             if not _is_valid_trace_id(trace_id):
                 raise ValueError(f"Invalid trace ID format: {trace_id}")
 
-        traces: list[TraceTree] = []
-        failed_count = 0
-
-        for trace_id in trace_ids:
-            try:
-                trace = await self.get_trace(trace_id)
-                traces.append(trace)
-            except Exception as e:
-                logger.warning(f"Failed to fetch trace {trace_id}: {e}")
-                failed_count += 1
-                continue
-
-        is_partial = failed_count > 0
-        partial_info = PartialResultsInfo(
-            total_requested=len(trace_ids),
-            total_returned=len(traces),
-            is_partial=is_partial,
-            reason=f"Failed to retrieve {failed_count} traces" if is_partial else None
-        )
-
-        return traces, partial_info
+        return await super().get_traces(trace_ids)
 
     async def get_correlated_logs(
         self, trace_ids: list[str], window_minutes: int = 5
@@ -526,7 +520,7 @@ class GrafanaStackTelemetryAdapter(TelemetryPort):
                             timestamp=datetime.fromtimestamp(int(timestamp) / 1e9, tz=UTC),
                             severity=Severity.INFO,
                             body=log_line,
-                            attributes={},
+                            attributes=MappingProxyType({}),
                             trace_id=None,
                             span_id=None,
                         )
@@ -543,7 +537,7 @@ class GrafanaStackTelemetryAdapter(TelemetryPort):
         return logs
 
     async def get_events_for_signature(
-        self, fingerprint: str, limit: int = 5
+        self, fingerprint: str, limit: int = 5, services: list[str] | None = None
     ) -> list[ErrorEvent]:
         """Retrieve recent errors matching a fingerprint.
 
@@ -554,6 +548,7 @@ class GrafanaStackTelemetryAdapter(TelemetryPort):
         Args:
             fingerprint: Signature fingerprint to match against.
             limit: Maximum number of matching events to return.
+            services: Only search these services (optional).
 
         Returns:
             List of ErrorEvent objects with matching fingerprints.
@@ -564,7 +559,7 @@ class GrafanaStackTelemetryAdapter(TelemetryPort):
         """
         # Fetch recent errors from last 24 hours
         since = datetime.now(UTC) - timedelta(hours=24)
-        all_errors = await self.get_recent_errors(since)
+        all_errors = await self.get_recent_errors(since, services)
 
         # Filter by fingerprint using injected fingerprinter
         matching_errors = []
@@ -7,13 +7,18 @@ Jaeger provides distributed tracing and can integrate with various backends
 (Elasticsearch, Cassandra, Badger, etc.).
 """
 
+import asyncio
 import json
 import logging
+import sys
+from collections.abc import Sequence
 from datetime import UTC, datetime, timedelta
+from types import MappingProxyType
 from typing import Any
 
 import httpx
 
+from rounds.adapters.telemetry.transport import retrying_transport
 from rounds.core.models import (
     ErrorEvent,
     LogEntry,
@@ -60,28 +65,29 @@ def _is_valid_identifier(identifier: str) -> bool:
 class JaegerTelemetryAdapter(TelemetryPort):
     """Jaeger-backed telemetry adapter via Query API."""
 
-    def __init__(self, api_url: str, service_name: str = ""):
+    def __init__(
+        self,
+        api_url: str,
+        service_name: str = "",
+        timeout: float = 30.0,
+        max_retries: int = 2,
+    ):
         """Initialize Jaeger adapter.
 
         Args:
             api_url: Base URL for Jaeger Query API (e.g., http://localhost:16686)
             service_name: Optional default service name for queries.
+            timeout: Timeout in seconds for each API request.
+            max_retries: Retries for requests that fail to connect.
         """
         self.api_url = api_url.rstrip("/")
         self.service_name = service_name
         self.client = httpx.AsyncClient(
             base_url=self.api_url,
-            timeout=30.0,
+            timeout=timeout,
+            transport=retrying_transport(self.api_url, max_retries),
         )
 
-    async def __aenter__(self) -> "JaegerTelemetryAdapter":
-        """Async context manager entry."""
-        return self
-
-    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Async context manager exit."""
-        await self.client.aclose()
-
     async def close(self) -> None:
         """Close the httpx client and clean up resources."""
         await self.client.aclose()
@@ -221,14 +227,15 @@ class JaegerTelemetryAdapter(TelemetryPort):
             event = ErrorEvent(
                 trace_id=trace.get("traceID", ""),
                 span_id=span.get("spanID", ""),
-                service=span.get("process", {}).get("serviceName", ""),
-                error_type=error_type,
+                service=sys.intern(span.get("process", {}).get("serviceName", "")),
+                # Tag values are not guaranteed to be strings
+                error_type=sys.intern(str(error_type)),
                 error_message=error_message,
                 stack_frames=stack_frames,
                 timestamp=datetime.fromtimestamp(
                     span.get("startTime", 0) / 1e6, tz=UTC
                 ),
-                attributes=tags,
+                attributes=MappingProxyType(tags),
                 severity=Severity.ERROR,
             )
 
@@ -321,10 +328,11 @@ class JaegerTelemetryAdapter(TelemetryPort):
                             )
                             module = filename.replace(".py", "").replace("/", ".")
 
+                            # The same few modules recur in every trace; share one copy
                             frame = StackFrame(
-                                module=module,
-                                function=function,
-                                filename=filename,
+                                module=sys.intern(module),
+                                function=sys.intern(function),
+                                filename=sys.intern(filename),
                                 lineno=None,
                             )
                             frames.append(frame)
@@ -423,7 +431,7 @@ class JaegerTelemetryAdapter(TelemetryPort):
                     operation=span_data.get("operationName", ""),
                     duration_ms=span_data.get("duration", 0) / 1000,
                     status="error" if attributes.get("error") else "ok",
-                    attributes=attributes,
+                    attributes=MappingProxyType(attributes),
                     events=tuple(),  # Jaeger doesn't have events like OTel
                     children=children,
                 )
@@ -479,9 +487,14 @@ class JaegerTelemetryAdapter(TelemetryPort):
             logger.error(f"Unexpected error fetching trace: {e}", exc_info=True)
             raise
 
-    async def get_traces(self, trace_ids: list[str]) -> tuple[list[TraceTree], PartialResultsInfo]:
+    async def get_traces(
+        self, trace_ids: list[str]
+    ) -> tuple[Sequence[TraceTree], PartialResultsInfo]:
         """Batch retrieve multiple traces.
 
+        Validates every trace ID, then fetches them concurrently through
+        the port's bounded fan-out over get_trace().
+
         Args:
             trace_ids: List of trace IDs to retrieve.
 
@@ -492,34 +505,12 @@ class JaegerTelemetryAdapter(TelemetryPort):
         Raises:
             ValueError: If any trace ID format is invalid.
         """
-        from rounds.core.models import PartialResultsInfo
-
         # Validate all trace IDs upfront
         for trace_id in trace_ids:
             if not _is_valid_trace_id(trace_id):
                 raise ValueError(f"Invalid trace ID format: {trace_id}")
 
-        traces: list[TraceTree] = []
-        failed_count = 0
-
-        for trace_id in trace_ids:
-            try:
-                trace = await self.get_trace(trace_id)
-                traces.append(trace)
-            except Exception as e:
-                logger.warning(f"Failed to fetch trace {trace_id}: {e}")
-                failed_count += 1
-                continue
-
-        is_partial = failed_count > 0
-        partial_info = PartialResultsInfo(
-            total_requested=len(trace_ids),
-            total_returned=len(traces),
-            is_partial=is_partial,
-            reason=f"Failed to retrieve {failed_count} traces" if is_partial else None
-        )
-
-        return traces, partial_info
+        return await super().get_traces(trace_ids)
 
     async def get_correlated_logs(
         self, trace_ids: list[str], window_minutes: int = 5
@@ -546,15 +537,25 @@ class JaegerTelemetryAdapter(TelemetryPort):
                 raise ValueError(f"Invalid trace ID format: {trace_id}")
 
         logs: list[LogEntry] = []
+        semaphore = asyncio.Semaphore(self.trace_fetch_concurrency)
+
+        async def extract(trace_id: str) -> list[LogEntry]:
+            async with semaphore:
+                return await self._extract_logs_from_raw_trace(trace_id)
 
-        # Fetch raw trace data to extract logs
+        # Fetch raw trace data to extract logs, one bounded request per trace
         try:
-            for trace_id in trace_ids:
-                try:
-                    logs.extend(await self._extract_logs_from_raw_trace(trace_id))
-                except Exception as e:
-                    logger.warning(f"Failed to extract logs from trace {trace_id}: {e}")
+            results = await asyncio.gather(
+                *(extract(trace_id) for trace_id in trace_ids),
+                return_exceptions=True,
+            )
+            for trace_id, result in zip(trace_ids, results):
+                if isinstance(result, BaseException):
+                    if not isinstance(result, Exception):
+                        raise result
+                    logger.warning(f"Failed to extract logs from trace {trace_id}: {result}")
                     continue
+                logs.extend(result)
 
             logger.debug(f"Extracted {len(logs)} log entries from {len(trace_ids)} traces")
 
@@ -621,7 +622,7 @@ class JaegerTelemetryAdapter(TelemetryPort):
                                 timestamp=timestamp,
                                 severity=Severity.INFO,
                                 body=message,
-                                attributes=log_attrs,
+                                attributes=MappingProxyType(log_attrs),
                                 trace_id=trace_id,
                                 span_id=span_id,
                             )
@@ -634,15 +635,17 @@ class JaegerTelemetryAdapter(TelemetryPort):
         return log_entries
 
     async def get_events_for_signature(
-        self, fingerprint: str, limit: int = 5
+        self, fingerprint: str, limit: int = 5, services: list[str] | None = None
     ) -> list[ErrorEvent]:
         """Retrieve recent errors matching a fingerprint.
 
-        Queries all services for error spans and filters by fingerprint tag.
+        Queries each service for error spans and filters by fingerprint tag.
 
         Args:
             fingerprint: The fingerprint to search for.
             limit: Maximum number of events to return.
+            services: Only search these services (optional). Defaults to
+                every service Jaeger knows about.
 
         Returns:
             List of ErrorEvent objects matching the fingerprint.
@@ -651,8 +654,8 @@ class JaegerTelemetryAdapter(TelemetryPort):
             Exception: If Jaeger API is unavailable.
         """
         try:
-            # Get all services
-            services = await self._get_services()
+            if not services:
+                services = await self._get_services()
             if not services:
                 logger.warning("No services available for fingerprint search")
                 return []
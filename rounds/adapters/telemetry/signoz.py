@@ -5,16 +5,18 @@ Normalizes SigNoz-specific data structures into core domain models.
 """
 
 import logging
+import sys
 from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
+from types import MappingProxyType
 from typing import Any
 
 import httpx
 
+from rounds.adapters.telemetry.transport import retrying_transport
 from rounds.core.models import (
     ErrorEvent,
     LogEntry,
-    PartialResultsInfo,
     Severity,
     SpanNode,
     StackFrame,
@@ -33,6 +35,8 @@ class SigNozTelemetryAdapter(TelemetryPort):
         api_url: str,
         api_key: str = "",
         fingerprinter: Callable[[ErrorEvent], str] | None = None,
+        timeout: float = 30.0,
+        max_retries: int = 2,
     ):
         """Initialize SigNoz adapter.
 
@@ -41,6 +45,8 @@ class SigNozTelemetryAdapter(TelemetryPort):
             api_key: Optional API key for authentication
             fingerprinter: Function to compute fingerprints from ErrorEvent.
                 If None, imported from core.fingerprint at runtime.
+            timeout: Timeout in seconds for each API request.
+            max_retries: Retries for requests that fail to connect.
         """
         self.api_url = api_url.rstrip("/")
         self.api_key = api_key
@@ -48,7 +54,8 @@ class SigNozTelemetryAdapter(TelemetryPort):
         self.client = httpx.AsyncClient(
             base_url=self.api_url,
             headers=self._get_headers(),
-            timeout=30.0,
+            timeout=timeout,
+            transport=retrying_transport(self.api_url, max_retries),
         )
 
     def _get_fingerprinter(self) -> Callable[[ErrorEvent], str]:
@@ -70,14 +77,6 @@ class SigNozTelemetryAdapter(TelemetryPort):
             headers["Authorization"] = f"Bearer {self.api_key}"
         return headers
 
-    async def __aenter__(self) -> "SigNozTelemetryAdapter":
-        """Async context manager entry."""
-        return self
-
-    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Async context manager exit."""
-        await self.client.aclose()
-
     async def close(self) -> None:
         """Close the httpx client and clean up resources.
 
@@ -224,8 +223,10 @@ class SigNozTelemetryAdapter(TelemetryPort):
                     operation=span_data.get("operationName", ""),
                     duration_ms=span_data.get("duration", 0) / 1e6,
                     status=span_data.get("status", "unset"),
-                    attributes=span_data.get("attributes", {}),
-                    events=tuple(span_data.get("events", [])),
+                    attributes=MappingProxyType(span_data.get("attributes", {})),
+                    events=tuple(
+                        MappingProxyType(e) for e in span_data.get("events", [])
+                    ),
                     children=children,
                 )
                 span_node_map[span_id] = node
@@ -267,50 +268,6 @@ class SigNozTelemetryAdapter(TelemetryPort):
             logger.error(f"Unexpected error fetching trace: {e}", exc_info=True)
             raise
 
-    async def get_traces(self, trace_ids: list[str]) -> tuple[list[TraceTree], PartialResultsInfo]:
-        """Batch trace retrieval.
-
-        Attempts to fetch all traces. If any traces fail to fetch, logs warnings
-        for each failure and returns partial results metadata.
-
-        Args:
-            trace_ids: List of trace IDs to retrieve.
-
-        Returns:
-            Tuple of (traces, partial_info) where traces is the list of successfully
-            retrieved TraceTree objects and partial_info indicates if results are complete.
-        """
-        from rounds.core.models import PartialResultsInfo
-
-        traces = []
-        failed_trace_ids = []
-
-        for trace_id in trace_ids:
-            try:
-                trace = await self.get_trace(trace_id)
-                traces.append(trace)
-            except Exception as e:
-                logger.warning(f"Failed to fetch trace {trace_id}: {e}")
-                failed_trace_ids.append(trace_id)
-
-        # Log summary if there were failures
-        is_partial = len(failed_trace_ids) > 0
-        if is_partial:
-            logger.warning(
-                f"Batch trace retrieval incomplete: "
-                f"retrieved {len(traces)}/{len(trace_ids)} traces. "
-                f"Failed trace IDs: {failed_trace_ids}"
-            )
-
-        partial_info = PartialResultsInfo(
-            total_requested=len(trace_ids),
-            total_returned=len(traces),
-            is_partial=is_partial,
-            reason=f"Failed to retrieve {len(failed_trace_ids)} traces" if is_partial else None
-        )
-
-        return traces, partial_info
-
     async def get_correlated_logs(
         self, trace_ids: list[str], window_minutes: int = 5
     ) -> list[LogEntry]:
@@ -368,7 +325,7 @@ class SigNozTelemetryAdapter(TelemetryPort):
             raise
 
     async def get_events_for_signature(
-        self, fingerprint: str, limit: int = 5
+        self, fingerprint: str, limit: int = 5, services: list[str] | None = None
     ) -> list[ErrorEvent]:
         """Return recent events matching a known fingerprint.
 
@@ -379,6 +336,7 @@ class SigNozTelemetryAdapter(TelemetryPort):
         Args:
             fingerprint: Signature fingerprint to match against.
             limit: Maximum number of matching events to return.
+            services: Only search these services (optional).
 
         Returns:
             List of ErrorEvent objects with matching fingerprints.
@@ -386,7 +344,7 @@ class SigNozTelemetryAdapter(TelemetryPort):
         """
         # Fetch recent errors from last 24 hours
         since = datetime.now(UTC) - timedelta(hours=24)
-        all_errors = await self.get_recent_errors(since)
+        all_errors = await self.get_recent_errors(since, services)
 
         # Filter by fingerprint using injected fingerprinter
         matching_errors = []
@@ -429,12 +387,14 @@ class SigNozTelemetryAdapter(TelemetryPort):
             return ErrorEvent(
                 trace_id=trace_id,
                 span_id=span_id,
-                service=service,
-                error_type=error_type,
+                service=sys.intern(service),
+                error_type=sys.intern(error_type),
                 error_message=error_message,
                 stack_frames=stack_frames,
                 timestamp=timestamp,
-                attributes=attributes if isinstance(attributes, dict) else {},
+                attributes=MappingProxyType(
+                    attributes if isinstance(attributes, dict) else {}
+                ),
                 severity=self._parse_severity(severity_text),
             )
 
@@ -456,8 +416,10 @@ class SigNozTelemetryAdapter(TelemetryPort):
             operation=span_data.get("operationName", ""),
             duration_ms=span_data.get("duration", 0) / 1e6,  # Convert to ms
             status=span_data.get("status", "unset"),
-            attributes=span_data.get("attributes", {}),
-            events=tuple(span_data.get("events", [])),
+            attributes=MappingProxyType(span_data.get("attributes", {})),
+            events=tuple(
+                MappingProxyType(e) for e in span_data.get("events", [])
+            ),
         )
 
     def _parse_log_entry(self, log_data: dict[str, Any]) -> LogEntry | None:
@@ -469,7 +431,7 @@ class SigNozTelemetryAdapter(TelemetryPort):
                 timestamp=datetime.fromtimestamp(timestamp_ns / 1e9, tz=UTC),
                 severity=self._parse_severity(log_data.get("severityText", "INFO")),
                 body=log_data.get("body", ""),
-                attributes=log_data.get("attributes", {}),
+                attributes=MappingProxyType(log_data.get("attributes", {})),
                 trace_id=log_data.get("traceID"),
                 span_id=log_data.get("spanID"),
             )
@@ -502,9 +464,9 @@ class SigNozTelemetryAdapter(TelemetryPort):
                     function = "unknown"
 
                     frame = StackFrame(
-                        module=module,
-                        function=function,
-                        filename=filename,
+                        module=sys.intern(module),
+                        function=sys.intern(function),
+                        filename=sys.intern(filename),
                         lineno=lineno,
                     )
                     frames.append(frame)
@@ -0,0 +1,29 @@
+"""HTTP transport shared by the telemetry adapters.
+
+Each adapter client talks to a single backend URL, so its proxy can be
+resolved once when the client is built.
+"""
+
+import urllib.parse
+import urllib.request
+
+import httpx
+
+
+def retrying_transport(url: str, retries: int) -> httpx.AsyncHTTPTransport:
+    """Build a transport for ``url`` that retries failed connection attempts.
+
+    httpx stops reading HTTP_PROXY, HTTPS_PROXY, ALL_PROXY and NO_PROXY once
+    a client is given an explicit transport, so the proxy for ``url`` is
+    looked up from the environment here and passed in directly.
+
+    Args:
+        url: Base URL of the backend the client will call.
+        retries: Retries for requests that fail to connect.
+    """
+    parts = urllib.parse.urlsplit(url)
+    proxies = urllib.request.getproxies()
+    proxy = proxies.get(parts.scheme) or proxies.get("all")
+    if proxy and parts.hostname and urllib.request.proxy_bypass(parts.hostname):
+        proxy = None
+    return httpx.AsyncHTTPTransport(retries=retries, proxy=proxy)
@@ -0,0 +1,87 @@
+"""OpenTelemetry instrumentation for port adapters.
+
+Wraps an adapter's public coroutine methods in OpenTelemetry spans, so a
+slow poll or investigation cycle can be attributed to the telemetry
+backend, the signature store, the LLM or the notification channel.
+
+Requires the optional ``opentelemetry-api`` package. Span export is
+configured through the OpenTelemetry SDK as usual (for example with
+``opentelemetry-instrument`` and the standard OTEL_* variables); without
+an SDK the API's tracer is a no-op.
+"""
+
+import functools
+import inspect
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+P = TypeVar("P")
+
+# Lifecycle methods are not interesting as spans
+_UNTRACED_METHODS = frozenset({"close", "close_pool"})
+
+
+def instrument_port(port: P, port_name: str, tracer: Any | None = None) -> P:
+    """Trace every public coroutine method of an adapter instance.
+
+    The adapter is instrumented in place and returned, so it still
+    satisfies isinstance() checks against its port. Async generator
+    methods (iter_*) are left untraced.
+
+    Args:
+        port: Adapter instance to instrument.
+        port_name: Port name recorded on each span, e.g. "telemetry".
+        tracer: OpenTelemetry tracer; defaults to the global tracer for
+            this package.
+
+    Returns:
+        The same adapter instance. If opentelemetry-api is not installed
+        the adapter is returned unchanged and a warning is logged.
+    """
+    if tracer is None:
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            logger.warning(
+                "opentelemetry-api not installed; port tracing disabled. "
+                "Install with: pip install opentelemetry-api"
+            )
+            return port
+        tracer = trace.get_tracer("rounds")
+
+    adapter_type = type(port)
+    for name in dir(adapter_type):
+        if name.startswith("_") or name in _UNTRACED_METHODS:
+            continue
+        if not inspect.iscoroutinefunction(getattr(adapter_type, name)):
+            continue
+        method = getattr(port, name)
+        setattr(
+            port,
+            name,
+            _traced(method, tracer, port_name, adapter_type.__name__, name),
+        )
+    return port
+
+
+def _traced(
+    method: Callable[..., Awaitable[Any]],
+    tracer: Any,
+    port_name: str,
+    adapter_name: str,
+    method_name: str,
+) -> Callable[..., Awaitable[Any]]:
+    """Wrap a bound coroutine method in a span named Adapter.method."""
+    span_name = f"{adapter_name}.{method_name}"
+    attributes = {"port.name": port_name, "port.method": method_name}
+
+    @functools.wraps(method)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        # The span records and re-raises exceptions raised inside it
+        with tracer.start_as_current_span(span_name, attributes=attributes):
+            return await method(*args, **kwargs)
+
+    return wrapper
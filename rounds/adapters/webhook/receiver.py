@@ -224,34 +224,36 @@ class WebhookReceiver:
         )
 
         # Serialize SignatureDetails dataclass to dict for JSON response
+        signature = details.signature
+        diagnosis = signature.diagnosis
         return {
             "status": "success",
             "operation": "get_details",
             "signature_id": signature_id,
             "data": {
                 "signature": {
-                    "id": details.signature.id,
-                    "fingerprint": details.signature.fingerprint,
-                    "error_type": details.signature.error_type,
-                    "service": details.signature.service,
-                    "message_template": details.signature.message_template,
-                    "stack_hash": details.signature.stack_hash,
-                    "first_seen": details.signature.first_seen.isoformat(),
-                    "last_seen": details.signature.last_seen.isoformat(),
-                    "occurrence_count": details.signature.occurrence_count,
-                    "status": details.signature.status.value,
-                    "tags": sorted(details.signature.tags),
+                    "id": signature.id,
+                    "fingerprint": signature.fingerprint,
+                    "error_type": signature.error_type,
+                    "service": signature.service,
+                    "message_template": signature.message_template,
+                    "stack_hash": signature.stack_hash,
+                    "first_seen": signature.first_seen.isoformat(),
+                    "last_seen": signature.last_seen.isoformat(),
+                    "occurrence_count": signature.occurrence_count,
+                    "status": signature.status,
+                    "tags": list(signature.tags),
                     "diagnosis": (
                         {
-                            "root_cause": details.signature.diagnosis.root_cause,
-                            "evidence": details.signature.diagnosis.evidence,
-                            "suggested_fix": details.signature.diagnosis.suggested_fix,
-                            "confidence": details.signature.diagnosis.confidence,
-                            "diagnosed_at": details.signature.diagnosis.diagnosed_at.isoformat(),
-                            "model": details.signature.diagnosis.model,
-                            "cost_usd": details.signature.diagnosis.cost_usd,
+                            "root_cause": diagnosis.root_cause,
+                            "evidence": diagnosis.evidence,
+                            "suggested_fix": diagnosis.suggested_fix,
+                            "confidence": diagnosis.confidence,
+                            "diagnosed_at": diagnosis.diagnosed_at.isoformat(),
+                            "model": diagnosis.model,
+                            "cost_usd": diagnosis.cost_usd,
                         }
-                        if details.signature.diagnosis
+                        if diagnosis
                         else None
                     ),
                 },
@@ -263,7 +265,7 @@ class WebhookReceiver:
                         "error_type": event.error_type,
                         "error_message": event.error_message,
                         "timestamp": event.timestamp.isoformat(),
-                        "severity": event.severity.value,
+                        "severity": event.severity,
                     }
                     for event in details.recent_events
                 ],
@@ -274,7 +276,7 @@ class WebhookReceiver:
                         "error_type": s.error_type,
                         "service": s.service,
                         "occurrence_count": s.occurrence_count,
-                        "status": s.status.value,
+                        "status": s.status,
                     }
                     for s in details.related_signatures
                 ],
@@ -312,7 +314,7 @@ class WebhookReceiver:
                     "fingerprint": sig.fingerprint,
                     "error_type": sig.error_type,
                     "service": sig.service,
-                    "status": sig.status.value,
+                    "status": sig.status,
                     "occurrence_count": sig.occurrence_count,
                     "first_seen": sig.first_seen.isoformat(),
                     "last_seen": sig.last_seen.isoformat(),
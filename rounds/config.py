@@ -59,6 +59,14 @@ class Settings(BaseSettings):
         default="http://localhost:9090",
         description="Grafana Prometheus API endpoint URL",
     )
+    telemetry_timeout_seconds: float = Field(
+        default=30.0,
+        description="Timeout in seconds for each telemetry backend request",
+    )
+    telemetry_max_retries: int = Field(
+        default=2,
+        description="Retries for telemetry requests that fail to connect",
+    )
 
     # Signature store configuration
     store_backend: Literal["sqlite", "postgresql"] = Field(
@@ -99,6 +107,28 @@ class Settings(BaseSettings):
         default=2.0,
         description="Budget per diagnosis for OpenAI in USD",
     )
+    openai_max_output_tokens: int = Field(
+        default=2048,
+        description="Maximum tokens OpenAI may generate per diagnosis",
+    )
+    diagnosis_timeout_seconds: float = Field(
+        default=60.0,
+        description="Timeout for a single diagnosis call in seconds",
+    )
+    diagnosis_max_prompt_tokens: int = Field(
+        default=0,
+        description=(
+            "Reject diagnoses whose estimated prompt size exceeds this many "
+            "tokens without calling the LLM (0 disables the limit)"
+        ),
+    )
+    diagnosis_cache_ttl_seconds: int = Field(
+        default=0,
+        description=(
+            "Seconds to reuse a diagnosis for an identical investigation "
+            "context (0 disables caching)"
+        ),
+    )
 
     # Notification configuration
     notification_backend: Literal["stdout", "markdown", "github_issue"] = Field(
@@ -139,6 +169,28 @@ class Settings(BaseSettings):
         default=15,
         description="Lookback window in minutes for error queries",
     )
+    investigation_batch_size: int | None = Field(
+        default=None,
+        description=(
+            "Maximum signatures to investigate per cycle, highest priority "
+            "first (None for all eligible signatures)"
+        ),
+    )
+    max_concurrent_investigations: int = Field(
+        default=4,
+        description="Maximum diagnoses run concurrently within an investigation cycle",
+    )
+    circuit_breaker_failure_threshold: int = Field(
+        default=3,
+        description=(
+            "Consecutive telemetry or diagnosis failures before calls to that "
+            "backend are refused"
+        ),
+    )
+    circuit_breaker_reset_seconds: float = Field(
+        default=30.0,
+        description="Seconds a backend's calls are refused before a trial call",
+    )
 
     # Budget controls
     daily_budget_limit: float = Field(
@@ -155,6 +207,13 @@ class Settings(BaseSettings):
         default="text",
         description="Log format",
     )
+    tracing_enabled: bool = Field(
+        default=False,
+        description=(
+            "Record an OpenTelemetry span for every adapter call "
+            "(requires opentelemetry-api)"
+        ),
+    )
 
     # Run mode
     run_mode: Literal["daemon", "cli", "webhook"] = Field(
@@ -192,6 +251,22 @@ class Settings(BaseSettings):
         description="Enable debug mode with verbose logging",
     )
 
+    @field_validator("telemetry_timeout_seconds")
+    @classmethod
+    def validate_telemetry_timeout(cls, v: float) -> float:
+        """Ensure telemetry request timeout is positive."""
+        if v <= 0:
+            raise ValueError("telemetry_timeout_seconds must be positive")
+        return v
+
+    @field_validator("telemetry_max_retries")
+    @classmethod
+    def validate_telemetry_max_retries(cls, v: int) -> int:
+        """Ensure telemetry retry count is non-negative."""
+        if v < 0:
+            raise ValueError("telemetry_max_retries must be non-negative")
+        return v
+
     @field_validator("poll_interval_seconds")
     @classmethod
     def validate_poll_interval(cls, v: int) -> int:
@@ -200,6 +275,38 @@ class Settings(BaseSettings):
             raise ValueError("poll_interval_seconds must be positive")
         return v
 
+    @field_validator("investigation_batch_size")
+    @classmethod
+    def validate_investigation_batch_size(cls, v: int | None) -> int | None:
+        """Ensure investigation batch size is positive when set."""
+        if v is not None and v <= 0:
+            raise ValueError("investigation_batch_size must be positive")
+        return v
+
+    @field_validator("max_concurrent_investigations")
+    @classmethod
+    def validate_max_concurrent_investigations(cls, v: int) -> int:
+        """Ensure investigation concurrency is positive."""
+        if v <= 0:
+            raise ValueError("max_concurrent_investigations must be positive")
+        return v
+
+    @field_validator("circuit_breaker_failure_threshold")
+    @classmethod
+    def validate_circuit_breaker_failure_threshold(cls, v: int) -> int:
+        """Ensure the circuit breaker threshold is positive."""
+        if v <= 0:
+            raise ValueError("circuit_breaker_failure_threshold must be positive")
+        return v
+
+    @field_validator("circuit_breaker_reset_seconds")
+    @classmethod
+    def validate_circuit_breaker_reset(cls, v: float) -> float:
+        """Ensure the circuit breaker cool-down is non-negative."""
+        if v < 0:
+            raise ValueError("circuit_breaker_reset_seconds must be non-negative")
+        return v
+
     @field_validator("poll_batch_size")
     @classmethod
     def validate_batch_size(cls, v: int) -> int:
@@ -224,6 +331,38 @@ class Settings(BaseSettings):
             raise ValueError("openai_budget_usd must be non-negative")
         return v
 
+    @field_validator("openai_max_output_tokens")
+    @classmethod
+    def validate_openai_max_output_tokens(cls, v: int) -> int:
+        """Ensure the output token cap is positive."""
+        if v <= 0:
+            raise ValueError("openai_max_output_tokens must be positive")
+        return v
+
+    @field_validator("diagnosis_timeout_seconds")
+    @classmethod
+    def validate_diagnosis_timeout(cls, v: float) -> float:
+        """Ensure diagnosis timeout is positive."""
+        if v <= 0:
+            raise ValueError("diagnosis_timeout_seconds must be positive")
+        return v
+
+    @field_validator("diagnosis_max_prompt_tokens")
+    @classmethod
+    def validate_diagnosis_max_prompt_tokens(cls, v: int) -> int:
+        """Ensure prompt token limit is non-negative."""
+        if v < 0:
+            raise ValueError("diagnosis_max_prompt_tokens must be non-negative")
+        return v
+
+    @field_validator("diagnosis_cache_ttl_seconds")
+    @classmethod
+    def validate_diagnosis_cache_ttl(cls, v: int) -> int:
+        """Ensure diagnosis cache TTL is non-negative."""
+        if v < 0:
+            raise ValueError("diagnosis_cache_ttl_seconds must be non-negative")
+        return v
+
     @field_validator("daily_budget_limit")
     @classmethod
     def validate_budget_limit(cls, v: float) -> float:
@@ -0,0 +1,113 @@
+"""Circuit breaker for calls into driven ports.
+
+When a backend is down every call waits out its full timeout before
+failing. A circuit breaker notices consecutive failures and refuses
+further calls for a cool-down period, so the caller fails immediately
+instead, then lets a single trial call through to probe for recovery.
+"""
+
+import logging
+import time
+from collections.abc import Callable
+from typing import Literal, TypeAlias
+
+logger = logging.getLogger(__name__)
+
+CircuitState: TypeAlias = Literal["closed", "open", "half_open"]
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    States:
+    - closed: calls are allowed; failures are counted.
+    - open: calls are refused until reset_timeout_seconds have passed.
+    - half_open: one trial call is allowed; success closes the circuit,
+      failure opens it again.
+
+    Every allowed call must end in record_success(), record_failure() or
+    release(); otherwise a half-open trial stays in flight for good.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 3,
+        reset_timeout_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize the breaker.
+
+        Args:
+            name: Name of the guarded backend, used in log messages.
+            failure_threshold: Consecutive failures that open the circuit.
+            reset_timeout_seconds: How long the circuit stays open before
+                a trial call is allowed.
+            clock: Monotonic time source, injectable for tests.
+        """
+        if failure_threshold <= 0:
+            raise ValueError("failure_threshold must be positive")
+        if reset_timeout_seconds < 0:
+            raise ValueError("reset_timeout_seconds must be non-negative")
+
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout_seconds = reset_timeout_seconds
+        self._clock = clock
+        self._consecutive_failures = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state of the circuit."""
+        if self._opened_at is None:
+            return "closed"
+        if self._clock() - self._opened_at >= self.reset_timeout_seconds:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        """Return whether a call may proceed now.
+
+        In the half-open state only the first caller is allowed through,
+        as the trial; others are refused until its outcome is recorded.
+        """
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        """Record a successful call, closing the circuit."""
+        if self._opened_at is not None:
+            logger.info(f"Circuit for {self.name} closed after successful call")
+        self._consecutive_failures = 0
+        self._opened_at = None
+        self._trial_in_flight = False
+
+    def release(self) -> None:
+        """End an allowed call without recording an outcome.
+
+        For calls that were cancelled, or refused locally before reaching
+        the backend. The circuit state is unchanged; a half-open trial slot
+        is freed for the next caller.
+        """
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit at the threshold."""
+        self._consecutive_failures += 1
+        reopen = self._trial_in_flight
+        self._trial_in_flight = False
+        if reopen or self._consecutive_failures >= self.failure_threshold:
+            if self._opened_at is None or reopen:
+                logger.warning(
+                    f"Circuit for {self.name} opened after "
+                    f"{self._consecutive_failures} consecutive failures; "
+                    f"refusing calls for {self.reset_timeout_seconds}s"
+                )
+            self._opened_at = self._clock()
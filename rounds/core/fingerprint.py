@@ -7,9 +7,33 @@ occurrences.
 
 import hashlib
 import re
+from collections.abc import Sequence
 
 from .models import ErrorEvent, StackFrame
 
+# Message templatization patterns, applied in order. Compiled once at import
+# rather than looked up in re's pattern cache on every call.
+_MESSAGE_PATTERNS: tuple[tuple[re.Pattern[str], str], ...] = (
+    # IP addresses
+    (re.compile(r"\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b"), "*"),
+    # Ports
+    (re.compile(r":\d+\b"), ":*"),
+    # Numeric IDs
+    (re.compile(r"\b\d{3,}\b"), "*"),
+    # Timestamps (YYYY-MM-DD format)
+    (re.compile(r"\d{4}-\d{2}-\d{2}"), "*"),
+    # Timestamps (HH:MM:SS format)
+    (re.compile(r"\d{2}:\d{2}:\d{2}"), "*"),
+    # UUIDs
+    (
+        re.compile(
+            r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",
+            re.IGNORECASE,
+        ),
+        "*",
+    ),
+)
+
 
 class Fingerprinter:
     """Produces stable fingerprints from error events.
@@ -31,8 +55,9 @@ class Fingerprinter:
         - Normalized stack hash
         """
         message_template = Fingerprinter.templatize_message(event.error_message)
-        normalized_stack = Fingerprinter.normalize_stack(event.stack_frames)
-        stack_hash = Fingerprinter.hash_stack(normalized_stack)
+        # hash_stack only reads module and function, so the raw frames hash
+        # identically to normalize_stack() output without building new frames
+        stack_hash = Fingerprinter.hash_stack(event.stack_frames)
 
         # Combine components for final fingerprint
         components = [
@@ -72,28 +97,17 @@ class Fingerprinter:
         'User ID 12345 not found'
         → 'User ID * not found'
         """
-        # Replace IP addresses
-        message = re.sub(r"\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b", "*", message)
-        # Replace ports
-        message = re.sub(r":\d+\b", ":*", message)
-        # Replace numeric IDs
-        message = re.sub(r"\b\d{3,}\b", "*", message)
-        # Replace timestamps (YYYY-MM-DD format)
-        message = re.sub(r"\d{4}-\d{2}-\d{2}", "*", message)
-        # Replace timestamps (HH:MM:SS format)
-        message = re.sub(r"\d{2}:\d{2}:\d{2}", "*", message)
-        # Replace UUIDs
-        message = re.sub(
-            r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",
-            "*",
-            message,
-            flags=re.IGNORECASE,
-        )
+        for pattern, replacement in _MESSAGE_PATTERNS:
+            message = pattern.sub(replacement, message)
 
         return message
 
     @staticmethod
-    def hash_stack(frames: list[StackFrame]) -> str:
-        """Create a hash of the normalized stack structure."""
+    def hash_stack(frames: Sequence[StackFrame]) -> str:
+        """Create a hash of the normalized stack structure.
+
+        Only module and function names contribute, so raw and normalized
+        frames produce the same hash.
+        """
         stack_repr = "|".join(f"{frame.module}::{frame.function}" for frame in frames)
         return hashlib.sha256(stack_repr.encode()).hexdigest()[:16]
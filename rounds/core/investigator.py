@@ -5,7 +5,9 @@ orchestrating interactions between the core domain logic and
 external diagnosis services.
 """
 
+import asyncio
 import logging
+from collections.abc import Sequence
 from typing import Protocol
 
 from .models import Diagnosis, InvestigationContext, Signature
@@ -47,7 +49,11 @@ class Investigator:
         self.codebase_path = codebase_path
         self.budget_tracker = budget_tracker
 
-    async def investigate(self, signature: Signature) -> Diagnosis:
+    async def investigate(
+        self,
+        signature: Signature,
+        deferred_notifications: list[tuple[Signature, Diagnosis]] | None = None,
+    ) -> Diagnosis:
         """Assemble context, request diagnosis, store result, notify.
 
         Steps:
@@ -60,16 +66,23 @@ class Investigator:
         If diagnosis fails, the signature status is reverted to NEW
         and an error is logged.
 
+        If deferred_notifications is given, a warranted notification is
+        appended to it instead of being sent, so the caller can deliver a
+        whole cycle's findings with notify_many().
+
         Raises:
             Any exception from diagnosis_engine.diagnose() is re-raised
             after reverting signature status and logging.
         """
-        # 1. Gather evidence via telemetry port
-        events = await self.telemetry.get_events_for_signature(
-            signature.fingerprint, limit=5
+        # 1. Gather evidence via telemetry port, alongside the store's
+        # similar-signature lookup, which does not depend on it
+        evidence, historical_context = await asyncio.gather(
+            self.telemetry.get_signature_evidence(
+                signature, event_limit=5, window_minutes=5
+            ),
+            self.store.get_similar(signature),
         )
-        trace_ids = [e.trace_id for e in events]
-        traces, partial_info = await self.telemetry.get_traces(trace_ids)
+        partial_info = evidence.trace_results
 
         # Log if trace retrieval was incomplete
         if partial_info.is_partial:
@@ -79,18 +92,14 @@ class Investigator:
                 f"Reason: {partial_info.reason}. Proceeding with partial context."
             )
 
-        logs = await self.telemetry.get_correlated_logs(
-            trace_ids, window_minutes=5
-        )
-
         # 2. Build investigation context
         context = InvestigationContext(
             signature=signature,
-            recent_events=tuple(events),
-            trace_data=tuple(traces),
-            related_logs=tuple(logs),
+            recent_events=evidence.events,
+            trace_data=evidence.traces,
+            related_logs=evidence.logs,
             codebase_path=self.codebase_path,
-            historical_context=tuple(await self.store.get_similar(signature)),
+            historical_context=historical_context,
         )
 
         # Save original status before mutation for notification logic
@@ -142,7 +151,10 @@ class Investigator:
         notification_error: Exception | None = None
         try:
             if self.triage.should_notify(signature, diagnosis, original_status=original_status):
-                await self.notification.report(signature, diagnosis)
+                if deferred_notifications is not None:
+                    deferred_notifications.append((signature, diagnosis))
+                else:
+                    await self.notification.report(signature, diagnosis)
         except Exception as e:
             # Log notification failure but don't revert the successful diagnosis
             logger.error(
@@ -156,3 +168,15 @@ class Investigator:
             raise notification_error
 
         return diagnosis
+
+    async def notify_many(
+        self, items: Sequence[tuple[Signature, Diagnosis]]
+    ) -> None:
+        """Deliver notifications collected with deferred_notifications.
+
+        Each failed delivery is logged by the notification port.
+
+        Raises:
+            Exception: If any notification could not be delivered.
+        """
+        await self.notification.report_many(items)
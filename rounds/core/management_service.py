@@ -6,8 +6,9 @@ and invoking investigations. It ensures all state changes are properly logged
 and auditable.
 """
 
+import asyncio
 import logging
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Callable, Sequence
 
 from .models import (
     Diagnosis,
@@ -75,24 +76,16 @@ class ManagementService(ManagementPort):
             ValueError: If signature doesn't exist.
             Exception: If database error occurs.
         """
-        signature = await self.store.get_by_id(signature_id)
-        if signature is None:
-            raise ValueError(f"Signature {signature_id} not found")
-
-        # Update signature status using domain guard clause
-        try:
-            signature.mark_muted()
-        except ValueError as e:
-            raise ValueError(f"Cannot mute signature: {e}") from e
-
-        await self.store.update(signature)
+        fingerprint = await self._transition_status(
+            signature_id, SignatureStatus.MUTED, Signature.mark_muted, "mute"
+        )
 
         logger.info(
             f"Signature {signature_id} muted",
             extra={
                 "signature_id": signature_id,
                 "reason": reason,
-                "fingerprint": signature.fingerprint,
+                "fingerprint": fingerprint,
             },
         )
 
@@ -109,26 +102,64 @@ class ManagementService(ManagementPort):
             ValueError: If signature doesn't exist.
             Exception: If database error occurs.
         """
+        fingerprint = await self._transition_status(
+            signature_id,
+            SignatureStatus.RESOLVED,
+            Signature.mark_resolved,
+            "resolve",
+        )
+
+        logger.info(
+            f"Signature {signature_id} resolved",
+            extra={
+                "signature_id": signature_id,
+                "fix_applied": fix_applied,
+                "fingerprint": fingerprint,
+            },
+        )
+
+    async def _transition_status(
+        self,
+        signature_id: str,
+        status: SignatureStatus,
+        transition: Callable[[Signature], None],
+        action: str,
+    ) -> str:
+        """Apply a status change with one conditional store update.
+
+        The store is only read back when the conditional update matches
+        nothing, to tell a missing signature apart from one the domain
+        guard clause rejects.
+
+        Args:
+            signature_id: UUID of the signature.
+            status: Target status.
+            transition: Signature method enforcing the guard clause.
+            action: Verb used in error messages.
+
+        Returns:
+            Fingerprint of the updated signature.
+
+        Raises:
+            ValueError: If signature doesn't exist or the transition is invalid.
+        """
+        fingerprint = await self.store.set_status(signature_id, status)
+        if fingerprint is not None:
+            return fingerprint
+
         signature = await self.store.get_by_id(signature_id)
         if signature is None:
             raise ValueError(f"Signature {signature_id} not found")
 
         # Update signature status using domain guard clause
         try:
-            signature.mark_resolved()
+            transition(signature)
         except ValueError as e:
-            raise ValueError(f"Cannot resolve signature: {e}") from e
+            raise ValueError(f"Cannot {action} signature: {e}") from e
 
+        # Guard passed, so the row changed since the conditional update
         await self.store.update(signature)
-
-        logger.info(
-            f"Signature {signature_id} resolved",
-            extra={
-                "signature_id": signature_id,
-                "fix_applied": fix_applied,
-                "fingerprint": signature.fingerprint,
-            },
-        )
+        return signature.fingerprint
 
     async def retriage_signature(self, signature_id: str) -> None:
         """Reset a signature to NEW status for re-investigation.
@@ -181,14 +212,13 @@ class ManagementService(ManagementPort):
         if signature is None:
             raise ValueError(f"Signature {signature_id} not found")
 
-        # Get recent error events for this signature
-        recent_events = await self.telemetry.get_events_for_signature(
-            signature.fingerprint, limit=5
+        # Recent error events come from telemetry and related signatures from
+        # the store; neither depends on the other, so look both up at once
+        recent_events, related = await asyncio.gather(
+            self.telemetry.get_events_for_signature(signature.fingerprint, limit=5),
+            self.store.get_similar(signature, limit=5),
         )
 
-        # Get related/similar signatures
-        related = await self.store.get_similar(signature, limit=5)
-
         logger.debug(
             f"Retrieved signature details for {signature_id}",
             extra={"signature_id": signature_id},
@@ -218,7 +248,7 @@ class ManagementService(ManagementPort):
         signatures = await self.store.get_all(status=status)
 
         logger.debug(
-            "Listed signatures" + (f" with status={status.value}" if status else ""),
+            "Listed signatures" + (f" with status={status}" if status else ""),
             extra={
                 "count": len(signatures),
             },
@@ -226,11 +256,29 @@ class ManagementService(ManagementPort):
 
         return signatures
 
+    async def iter_signatures(
+        self, status: SignatureStatus | None = None
+    ) -> AsyncIterator[Signature]:
+        """Stream all signatures from the store, optionally filtered by status.
+
+        Args:
+            status: Filter to signatures with this status. If None, yield all.
+
+        Yields:
+            Signature objects matching the criteria.
+
+        Raises:
+            Exception: If database error occurs.
+        """
+        async for signature in self.store.iter_all(status=status):
+            yield signature
+
     async def reinvestigate(self, signature_id: str) -> Diagnosis:
         """Trigger immediate investigation/re-investigation of a signature.
 
         Resets the signature to NEW status, retrieves recent events,
-        performs diagnosis, and returns the diagnosis result.
+        performs diagnosis, and returns the diagnosis result. Only the
+        final DIAGNOSED state is written to the store.
 
         Used when a user wants an immediate re-diagnosis of a signature.
 
@@ -252,12 +300,13 @@ class ManagementService(ManagementPort):
         original_diagnosis = signature.diagnosis
         original_status = signature.status
 
-        # Reset to NEW status using domain methods for management operations
+        # Reset to NEW status using domain methods for management operations.
+        # The reset is only held in memory: the store is written once, with
+        # the terminal DIAGNOSED state, so a failed diagnosis leaves the
+        # persisted signature untouched.
         signature.reset_to_new()
         signature.clear_diagnosis()
 
-        await self.store.update(signature)
-
         logger.info(
             f"Started reinvestigation for signature {signature_id}",
             extra={"signature_id": signature_id, "fingerprint": signature.fingerprint},
@@ -281,27 +330,19 @@ class ManagementService(ManagementPort):
         # Build investigation context with complete data
         context = InvestigationContext(
             signature=signature,
-            recent_events=tuple(recent_events),
-            trace_data=tuple(traces),
-            related_logs=tuple(logs),
+            recent_events=recent_events,
+            trace_data=traces,
+            related_logs=logs,
             codebase_path=self.codebase_path,
-            historical_context=tuple(similar),
+            historical_context=similar,
         )
 
         # Invoke diagnosis
         try:
             diagnosis = await self.diagnosis_engine.diagnose(context)
         except Exception as e:
-            # Diagnosis failed - restore original diagnosis and status using domain method
+            # Diagnosis failed - restore the in-memory signature; nothing was persisted
             signature.restore_state(original_status, original_diagnosis)
-            try:
-                await self.store.update(signature)
-            except Exception as store_error:
-                logger.error(
-                    f"Failed to restore signature state after diagnosis failure: "
-                    f"{store_error}",
-                    exc_info=True,
-                )
             # Log the original diagnosis error and re-raise
             logger.error(
                 f"Diagnosis failed during reinvestigation for signature {signature_id}: {e}",
@@ -4,15 +4,15 @@ All models in this module use only Python standard library types,
 ensuring zero external dependencies in the core domain.
 """
 
-from collections.abc import Mapping
+import bisect
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
-from enum import Enum
-from types import MappingProxyType
+from enum import StrEnum
 from typing import Any, Literal, TypeAlias
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StackFrame:
     """A single frame in a stack trace."""
 
@@ -31,7 +31,7 @@ class StackFrame:
             raise ValueError("filename must be a non-empty string")
 
 
-class Severity(Enum):
+class Severity(StrEnum):
     """Log severity levels from OpenTelemetry."""
 
     TRACE = "TRACE"
@@ -42,7 +42,7 @@ class Severity(Enum):
     FATAL = "FATAL"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ErrorEvent:
     """A single error occurrence from telemetry.
 
@@ -57,20 +57,13 @@ class ErrorEvent:
     error_message: str  # raw message
     stack_frames: tuple[StackFrame, ...]  # immutable for frozen dataclass
     timestamp: datetime
-    # Union type accepts both dict and MappingProxyType for initialization flexibility.
-    # Runtime type is always MappingProxyType after __post_init__ conversion.
-    attributes: dict[str, Any] | MappingProxyType[str, Any]
+    # Telemetry adapters wrap attributes in MappingProxyType once at ingestion;
+    # the model does not re-wrap them on every construction.
+    attributes: Mapping[str, Any]
     severity: Severity
 
-    def __post_init__(self) -> None:
-        """Convert attributes dict to read-only proxy."""
-        if isinstance(self.attributes, dict):
-            object.__setattr__(
-                self, "attributes", MappingProxyType(self.attributes)
-            )
-
 
-class SignatureStatus(Enum):
+class SignatureStatus(StrEnum):
     """Lifecycle states for a failure signature.
 
     State transitions follow a directed workflow:
@@ -94,10 +87,41 @@ class SignatureStatus(Enum):
     MUTED = "muted"
 
 
+# Statuses each guarded transition may start from, keyed by target status.
+# Built once at import instead of as a set literal on every transition.
+# reset_to_new() and revert_to_new() are not listed: the former is allowed
+# from any status, the latter only from INVESTIGATING.
+_ALLOWED_TRANSITIONS: dict[SignatureStatus, frozenset[SignatureStatus]] = {
+    SignatureStatus.INVESTIGATING: frozenset(
+        {SignatureStatus.NEW, SignatureStatus.INVESTIGATING}
+    ),
+    SignatureStatus.DIAGNOSED: frozenset(SignatureStatus)
+    - {SignatureStatus.RESOLVED, SignatureStatus.MUTED},
+    SignatureStatus.RESOLVED: frozenset(SignatureStatus) - {SignatureStatus.RESOLVED},
+    SignatureStatus.MUTED: frozenset(SignatureStatus) - {SignatureStatus.MUTED},
+}
+
+
+# Bits in Signature.tag_flags for the tags triage rules check on every
+# signature, so those checks are a bitwise AND instead of a tuple scan.
+TAG_CRITICAL = 1 << 0
+TAG_FLAKY = 1 << 1
+
+_TAG_FLAGS: dict[str, int] = {"critical": TAG_CRITICAL, "flaky-test": TAG_FLAKY}
+
+
+def _tag_flags(tags: Sequence[str]) -> int:
+    """Bitmask of the well-known tags present in ``tags``."""
+    flags = 0
+    for tag in tags:
+        flags |= _TAG_FLAGS.get(tag, 0)
+    return flags
+
+
 Confidence: TypeAlias = Literal["high", "medium", "low"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Diagnosis:
     """LLM-generated root cause analysis for a signature."""
 
@@ -117,7 +141,7 @@ class Diagnosis:
             )
 
 
-@dataclass
+@dataclass(slots=True)
 class Signature:
     """A fingerprinted failure pattern.
 
@@ -149,7 +173,13 @@ class Signature:
     occurrence_count: int
     status: SignatureStatus
     diagnosis: Diagnosis | None = None
-    tags: frozenset[str] = field(default_factory=frozenset)  # immutable set
+    # Sorted and unique; any iterable of tags is normalized in __post_init__
+    tags: tuple[str, ...] = ()
+    # Cache for tag_flags: the tags tuple the bits were computed from
+    _flags_source: tuple[str, ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _flags: int = field(default=0, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         """Validate signature invariants on creation or deserialization."""
@@ -157,17 +187,43 @@ class Signature:
             raise ValueError(
                 f"occurrence_count must be >= 1, got {self.occurrence_count}"
             )
-        if self.last_seen < self.first_seen:
+        # New signatures are created with the same datetime for both fields;
+        # skip the rich comparison in that case.
+        if self.last_seen is not self.first_seen and self.last_seen < self.first_seen:
             raise ValueError(
                 f"last_seen ({self.last_seen}) cannot be before "
                 f"first_seen ({self.first_seen})"
             )
+        tags = self.tags
+        if not isinstance(tags, tuple) or any(
+            a >= b for a, b in zip(tags, tags[1:])
+        ):
+            self.tags = tuple(sorted(set(tags)))
+
+    @property
+    def tag_flags(self) -> int:
+        """TAG_* bits for the well-known tags in ``tags``.
+
+        Computed once per tags tuple; assigning tags, directly or through
+        add_tag(), invalidates the cached bits.
+        """
+        if self._flags_source is not self.tags:
+            self._flags = _tag_flags(self.tags)
+            self._flags_source = self.tags
+        return self._flags
+
+    def add_tag(self, tag: str) -> None:
+        """Add a tag, keeping tags sorted and unique."""
+        index = bisect.bisect_left(self.tags, tag)
+        if index < len(self.tags) and self.tags[index] == tag:
+            return
+        self.tags = (*self.tags[:index], tag, *self.tags[index:])
 
     def mark_investigating(self) -> None:
         """Transition signature to investigating status."""
-        if self.status not in {SignatureStatus.NEW, SignatureStatus.INVESTIGATING}:
+        if self.status not in _ALLOWED_TRANSITIONS[SignatureStatus.INVESTIGATING]:
             raise ValueError(
-                f"Cannot investigate signature in {self.status} status"
+                f"Cannot investigate signature in {self.status.name} status"
             )
         self.status = SignatureStatus.INVESTIGATING
 
@@ -178,12 +234,12 @@ class Signature:
             ValueError: If signature is already RESOLVED or MUTED, as these are
                 terminal states that should not transition to DIAGNOSED.
         """
-        if self.status == SignatureStatus.RESOLVED:
-            raise ValueError(
-                f"Cannot diagnose a resolved signature (id={self.id}). "
-                "Use reset_to_new() first if re-diagnosis is needed."
-            )
-        if self.status == SignatureStatus.MUTED:
+        if self.status not in _ALLOWED_TRANSITIONS[SignatureStatus.DIAGNOSED]:
+            if self.status == SignatureStatus.RESOLVED:
+                raise ValueError(
+                    f"Cannot diagnose a resolved signature (id={self.id}). "
+                    "Use reset_to_new() first if re-diagnosis is needed."
+                )
             raise ValueError(
                 f"Cannot diagnose a muted signature (id={self.id}). "
                 "Unmute the signature first if diagnosis is needed."
@@ -193,24 +249,26 @@ class Signature:
 
     def mark_resolved(self) -> None:
         """Transition signature to resolved status."""
-        if self.status == SignatureStatus.RESOLVED:
+        if self.status not in _ALLOWED_TRANSITIONS[SignatureStatus.RESOLVED]:
             raise ValueError("Signature is already resolved")
         self.status = SignatureStatus.RESOLVED
 
     def mark_muted(self) -> None:
         """Transition signature to muted status."""
-        if self.status == SignatureStatus.MUTED:
+        if self.status not in _ALLOWED_TRANSITIONS[SignatureStatus.MUTED]:
             raise ValueError("Signature is already muted")
         self.status = SignatureStatus.MUTED
 
     def record_occurrence(self, timestamp: datetime) -> None:
-        """Record a new occurrence and update last_seen."""
-        if timestamp < self.first_seen:
-            raise ValueError(
-                f"Occurrence timestamp {timestamp} cannot be before first_seen {self.first_seen}"
-            )
+        """Record a new occurrence and widen first_seen/last_seen to cover it.
+
+        Telemetry backends can ingest events late, so an occurrence may be
+        older than last_seen or even first_seen; the count still goes up
+        and neither bound moves inward.
+        """
         self.occurrence_count += 1
-        self.last_seen = timestamp
+        self.first_seen = min(self.first_seen, timestamp)
+        self.last_seen = max(self.last_seen, timestamp)
 
     def revert_to_new(self) -> None:
         """Revert signature from INVESTIGATING back to NEW status.
@@ -219,7 +277,7 @@ class Signature:
         """
         if self.status != SignatureStatus.INVESTIGATING:
             raise ValueError(
-                f"Can only revert from INVESTIGATING status, current status: {self.status}"
+                f"Can only revert from INVESTIGATING status, current status: {self.status.name}"
             )
         self.status = SignatureStatus.NEW
 
@@ -253,11 +311,11 @@ class Signature:
         self.diagnosis = diagnosis
 
 
-# Type alias for event tuples in SpanNode (runtime type after __post_init__ conversion)
-EventTuple: TypeAlias = tuple[MappingProxyType[str, Any], ...]
+# Type alias for event tuples in SpanNode (adapters pass read-only mappings)
+EventTuple: TypeAlias = tuple[Mapping[str, Any], ...]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SpanNode:
     """A single span in a distributed trace."""
 
@@ -267,26 +325,12 @@ class SpanNode:
     operation: str
     duration_ms: float
     status: str
-    attributes: dict[str, Any] | MappingProxyType[str, Any]  # converted to proxy in __post_init__
-    events: EventTuple  # converted to proxies in __post_init__
+    attributes: Mapping[str, Any]  # read-only mapping from the adapter
+    events: EventTuple  # read-only mappings from the adapter
     children: tuple["SpanNode", ...] = ()  # immutable for frozen dataclass
 
-    def __post_init__(self) -> None:
-        """Convert attributes and event dicts to read-only proxies."""
-        if isinstance(self.attributes, dict):
-            object.__setattr__(
-                self, "attributes", MappingProxyType(self.attributes)
-            )
-        # Convert mutable dicts in events tuple to immutable proxies
-        if self.events and any(isinstance(e, dict) for e in self.events):
-            events_proxies = tuple(
-                MappingProxyType(event) if isinstance(event, dict) else event
-                for event in self.events
-            )
-            object.__setattr__(self, "events", events_proxies)
-
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TraceTree:
     """A hierarchical view of spans in a single trace."""
 
@@ -295,26 +339,19 @@ class TraceTree:
     error_spans: tuple[SpanNode, ...]  # immutable for frozen dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LogEntry:
     """A single log entry from telemetry."""
 
     timestamp: datetime
     severity: Severity
     body: str
-    attributes: dict[str, Any] | MappingProxyType[str, Any]  # converted to proxy in __post_init__
+    attributes: Mapping[str, Any]  # read-only mapping from the adapter
     trace_id: str | None
     span_id: str | None
 
-    def __post_init__(self) -> None:
-        """Convert attributes dict to read-only proxy."""
-        if isinstance(self.attributes, dict):
-            object.__setattr__(
-                self, "attributes", MappingProxyType(self.attributes)
-            )
 
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PartialResultsInfo:
     """Metadata about partial results returned from telemetry queries.
 
@@ -333,7 +370,17 @@ class PartialResultsInfo:
     reason: str | None = None  # Optional explanation for partial results
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class SignatureEvidence:
+    """Telemetry gathered for investigating one signature."""
+
+    events: Sequence[ErrorEvent]  # Recent occurrences of the signature
+    traces: Sequence[TraceTree]  # Traces of those occurrences
+    trace_results: PartialResultsInfo  # Whether any traces were missing
+    logs: Sequence[LogEntry]  # Logs correlated with those traces
+
+
+@dataclass(frozen=True, slots=True)
 class InvestigationContext:
     """Everything the diagnosis engine needs to analyze a signature.
 
@@ -346,14 +393,29 @@ class InvestigationContext:
     """
 
     signature: Signature
-    recent_events: tuple[ErrorEvent, ...]  # immutable for frozen dataclass
-    trace_data: tuple[TraceTree, ...]  # immutable for frozen dataclass
-    related_logs: tuple[LogEntry, ...]  # immutable for frozen dataclass
+    # Sequence fields accept any sequence for initialization flexibility.
+    # Runtime type is always tuple after __post_init__ conversion; inputs that
+    # are already tuples are kept as-is rather than copied.
+    recent_events: Sequence[ErrorEvent]
+    trace_data: Sequence[TraceTree]
+    related_logs: Sequence[LogEntry]
     codebase_path: str
-    historical_context: tuple[Signature, ...]  # immutable for frozen dataclass
+    historical_context: Sequence[Signature]
 
-
-@dataclass(frozen=True)
+    def __post_init__(self) -> None:
+        """Convert sequence fields to tuples without copying existing tuples."""
+        for name in (
+            "recent_events",
+            "trace_data",
+            "related_logs",
+            "historical_context",
+        ):
+            value = getattr(self, name)
+            if not isinstance(value, tuple):
+                object.__setattr__(self, name, tuple(value))
+
+
+@dataclass(frozen=True, slots=True)
 class PollResult:
     """Summary of a poll cycle execution."""
 
@@ -365,7 +427,7 @@ class PollResult:
     errors_failed_to_process: int = 0  # Number of errors that failed during processing
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InvestigationResult:
     """Summary of an investigation cycle execution."""
 
@@ -374,29 +436,19 @@ class InvestigationResult:
     investigations_failed: int = 0  # Number of investigations that failed
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StoreStats:
     """Statistics about the signature store."""
 
     total_signatures: int
-    by_status: Mapping[str, int]  # status -> count (immutable at runtime)
-    by_service: Mapping[str, int]  # service -> count (immutable at runtime)
+    # Plain dicts built fresh by the store; read-only by contract (Mapping)
+    by_status: Mapping[str, int]  # status -> count
+    by_service: Mapping[str, int]  # service -> count
     oldest_signature_age_hours: float | None  # None if no signatures
     avg_occurrence_count: float
 
-    def __post_init__(self) -> None:
-        """Convert mutable dicts to immutable proxies.
-
-        Checks isinstance() before wrapping to prevent double-wrapping when
-        deserializing or reconstructing StoreStats instances.
-        """
-        if not isinstance(self.by_status, MappingProxyType):
-            object.__setattr__(self, "by_status", MappingProxyType(self.by_status))
-        if not isinstance(self.by_service, MappingProxyType):
-            object.__setattr__(self, "by_service", MappingProxyType(self.by_service))
-
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SignatureDetails:
     """Detailed information about a signature.
 
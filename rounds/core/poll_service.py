@@ -5,17 +5,26 @@ retrieves errors from telemetry, fingerprints them, and coordinates
 investigations.
 """
 
+import asyncio
+import heapq
 import logging
+import os
 import uuid
+from collections.abc import Iterator, Sequence
 from datetime import UTC, datetime, timedelta
+from operator import itemgetter
 
+from .circuit_breaker import CircuitBreaker
 from .fingerprint import Fingerprinter
 from .investigator import Investigator
 from .models import (
+    Diagnosis,
+    ErrorEvent,
     InvestigationResult,
     PollResult,
     Signature,
     SignatureStatus,
+    StackFrame,
 )
 from .ports import PollPort, SignatureStorePort, TelemetryPort
 from .triage import TriageEngine
@@ -23,6 +32,19 @@ from .triage import TriageEngine
 logger = logging.getLogger(__name__)
 
 
+def _uuid4_strings(count: int) -> Iterator[str]:
+    """Yield random UUID4 strings, the first ``count`` from one os.urandom() call.
+
+    Equivalent to ``str(uuid.uuid4())`` per ID, without a syscall per ID. If
+    more IDs are requested, falls back to uuid.uuid4().
+    """
+    randomness = os.urandom(16 * count)
+    for offset in range(0, len(randomness), 16):
+        yield str(uuid.UUID(bytes=randomness[offset : offset + 16], version=4))
+    while True:
+        yield str(uuid.uuid4())
+
+
 class PollService(PollPort):
     """Implements the poll cycle logic.
 
@@ -43,6 +65,10 @@ class PollService(PollPort):
         lookback_minutes: int = 15,
         services: list[str] | None = None,
         batch_size: int | None = None,
+        investigation_batch_size: int | None = None,
+        max_concurrent_investigations: int = 1,
+        telemetry_breaker: CircuitBreaker | None = None,
+        investigation_breaker: CircuitBreaker | None = None,
     ):
         self.telemetry = telemetry
         self.store = store
@@ -52,6 +78,20 @@ class PollService(PollPort):
         self.lookback_minutes = lookback_minutes
         self.services = services
         self.batch_size = batch_size
+        self.investigation_batch_size = investigation_batch_size
+        self.max_concurrent_investigations = max_concurrent_investigations
+        # Fail fast while a backend is down instead of waiting out a timeout
+        # on every call
+        self.telemetry_breaker = telemetry_breaker or CircuitBreaker("telemetry")
+        self.investigation_breaker = investigation_breaker or CircuitBreaker(
+            "diagnosis"
+        )
+        # (trace_id, span_id) -> timestamp of every event already recorded
+        # whose timestamp is still inside the lookback window. Each poll
+        # re-reads the whole window so that events ingested late by the
+        # backend are still picked up; these keys keep the rest from being
+        # counted twice. Held in memory, so a restart re-reads one window.
+        self._seen_events: dict[tuple[str, str], datetime] = {}
 
     async def execute_poll_cycle(self) -> PollResult:
         """Check for new errors, fingerprint, dedup, and queue investigations.
@@ -59,22 +99,50 @@ class PollService(PollPort):
         Returns a summary of what was found.
 
         Raises:
+            RuntimeError: If the telemetry circuit is open after repeated
+                failures; the backend is not called.
             Exception: If telemetry fetch fails. Errors are not silenced.
         """
         now = datetime.now(UTC)
         since = now - timedelta(minutes=self.lookback_minutes)
 
+        if not self.telemetry_breaker.allow():
+            raise RuntimeError(
+                "Telemetry backend unavailable after repeated failures; skipping poll"
+            )
+
+        # Forget events that have aged out of the window; the backend will
+        # not return them again.
+        self._seen_events = {
+            key: timestamp
+            for key, timestamp in self._seen_events.items()
+            if timestamp >= since
+        }
+
         try:
-            errors = await self.telemetry.get_recent_errors(since, self.services)
+            errors = [
+                error
+                async for error in self.telemetry.iter_recent_errors(
+                    since, self.services
+                )
+                if (error.trace_id, error.span_id) not in self._seen_events
+            ]
         except Exception as e:
+            self.telemetry_breaker.record_failure()
             logger.error(f"Failed to fetch recent errors from telemetry: {e}", exc_info=True)
             raise
+        except BaseException:
+            # Cancelled before the backend answered
+            self.telemetry_breaker.release()
+            raise
+        self.telemetry_breaker.record_success()
 
-        # Limit errors to batch_size if configured
+        # Limit errors to batch_size if configured. Errors arrive oldest
+        # first, and the remainder is still unseen on the next poll.
         if self.batch_size is not None and len(errors) > self.batch_size:
             logger.info(
                 f"Limiting poll to {self.batch_size} errors "
-                f"(found {len(errors)}, taking first {self.batch_size})"
+                f"(found {len(errors)}, taking oldest {self.batch_size})"
             )
             errors = errors[: self.batch_size]
 
@@ -83,56 +151,139 @@ class PollService(PollPort):
         investigations_queued = 0
         errors_failed_to_process = 0
 
-        for error in errors:
-            try:
-                # Fingerprint the error
-                fingerprint = self.fingerprinter.fingerprint(error)
+        # Fingerprint every error up front so known signatures can be fetched
+        # in one batched store lookup instead of one query per error. The
+        # hashing is pure CPU work, so it runs in a worker thread to keep the
+        # event loop free for webhook and scheduler tasks.
+        fingerprinted, fingerprint_failures = await asyncio.to_thread(
+            self._fingerprint_errors, errors
+        )
+        errors_failed_to_process += fingerprint_failures
 
-                # Check if we've seen this signature before
-                signature = await self.store.get_by_fingerprint(fingerprint)
+        store_failed = False
+        failed_fingerprints: set[str] = set()
+        try:
+            known = await self.store.get_by_fingerprints(
+                [fingerprint for _, fingerprint in fingerprinted]
+            )
+        except (MemoryError, SystemExit, KeyboardInterrupt):
+            raise
+        except Exception as e:
+            logger.error(
+                f"Failed to look up signatures for {len(fingerprinted)} errors: {e}",
+                exc_info=True,
+            )
+            errors_failed_to_process += len(fingerprinted)
+            fingerprinted = []
+            known = {}
+            store_failed = True
+
+        # Group the batch by fingerprint. Telemetry is bursty: an outage can
+        # produce thousands of identical errors per poll window, and grouping
+        # turns them into one store write per signature instead of per error.
+        groups: dict[str, list[ErrorEvent]] = {}
+        for error, fingerprint in fingerprinted:
+            groups.setdefault(fingerprint, []).append(error)
 
+        # Draw randomness for all new signature IDs with a single urandom call
+        signature_ids = _uuid4_strings(len(groups.keys() - known.keys()))
+
+        # (signature, is_new, occurrences recorded) for each signature to write
+        writes: list[tuple[Signature, bool, int]] = []
+        for fingerprint, group in groups.items():
+            # Check if we've seen this signature before
+            signature = known.get(fingerprint)
+            is_new = signature is None
+            occurrences = group
+
+            try:
                 if signature is None:
-                    # New signature - create it
+                    # New signature - create it from the first error
+                    first = group[0]
                     normalized_stack = self.fingerprinter.normalize_stack(
-                        error.stack_frames
+                        first.stack_frames
                     )
                     signature = Signature(
-                        id=str(uuid.uuid4()),
+                        id=next(signature_ids),
                         fingerprint=fingerprint,
-                        error_type=error.error_type,
-                        service=error.service,
+                        error_type=first.error_type,
+                        service=first.service,
                         message_template=self.fingerprinter.templatize_message(
-                            error.error_message
+                            first.error_message
                         ),
                         stack_hash=self.fingerprinter.hash_stack(normalized_stack),
-                        first_seen=error.timestamp,
-                        last_seen=error.timestamp,
+                        first_seen=first.timestamp,
+                        last_seen=first.timestamp,
                         occurrence_count=1,
                         status=SignatureStatus.NEW,
                         diagnosis=None,
-                        tags=frozenset(),
                     )
-                    await self.store.save(signature)
-                    new_signatures += 1
-                else:
-                    # Update existing signature
+                    occurrences = group[1:]
+            except (MemoryError, SystemExit, KeyboardInterrupt):
+                # Don't catch system errors - let them propagate
+                raise
+            except Exception as e:
+                logger.error(
+                    f"Failed to process error event {group[0].trace_id}: {e}",
+                    exc_info=True,
+                )
+                errors_failed_to_process += len(group)
+                continue
+
+            # Apply the remaining errors in batch order
+            recorded = 0
+            for error in occurrences:
+                try:
                     signature.record_occurrence(error.timestamp)
-                    await self.store.update(signature)
-                    updated_signatures += 1
+                    recorded += 1
+                except ValueError as e:
+                    logger.error(
+                        f"Failed to process error event {error.trace_id}: {e}",
+                        exc_info=True,
+                    )
+                    errors_failed_to_process += 1
 
-                # Check if we should investigate
-                if self.triage.should_investigate(signature):
-                    investigations_queued += 1
+            if is_new or recorded:
+                writes.append((signature, is_new, recorded))
 
+        # Persist every touched signature in one batched store call
+        if writes:
+            try:
+                await self.store.save_many([signature for signature, _, _ in writes])
             except (MemoryError, SystemExit, KeyboardInterrupt):
                 # Don't catch system errors - let them propagate
                 raise
             except Exception as e:
-                logger.error(
-                    f"Failed to process error event {error.trace_id}: {e}",
-                    exc_info=True,
+                logger.warning(
+                    f"Batched save of {len(writes)} signatures failed, "
+                    f"saving one at a time: {e}"
                 )
-                errors_failed_to_process += 1
+                writes, failed_fingerprints, failed = await self._save_each(writes)
+                errors_failed_to_process += failed
+
+        # Mark this batch as recorded unless the store was unavailable, in
+        # which case the same events are retried on the next poll. So are the
+        # events of any signature that could not be saved.
+        if not store_failed:
+            retry = {
+                (error.trace_id, error.span_id)
+                for fingerprint in failed_fingerprints
+                for error in groups[fingerprint]
+            }
+            self._seen_events.update(
+                ((error.trace_id, error.span_id), error.timestamp)
+                for error in errors
+                if (error.trace_id, error.span_id) not in retry
+            )
+
+        for signature, is_new, recorded in writes:
+            # Every error after the one that created a signature is an update
+            new_signatures += is_new
+            updated_signatures += recorded
+
+            # Check if we should investigate
+            if self.triage.should_investigate(signature, now):
+                investigations_queued += 1
 
         return PollResult(
             errors_found=len(errors),
@@ -143,6 +294,76 @@ class PollService(PollPort):
             errors_failed_to_process=errors_failed_to_process,
         )
 
+    async def _save_each(
+        self, writes: list[tuple[Signature, bool, int]]
+    ) -> tuple[list[tuple[Signature, bool, int]], set[str], int]:
+        """Save signatures one by one after a batched save failed.
+
+        Keeps one bad row from failing the whole poll. Returns the writes
+        that were saved, the fingerprints that were not, and the number of
+        error events those lost.
+        """
+        saved: list[tuple[Signature, bool, int]] = []
+        failed_fingerprints: set[str] = set()
+        failed = 0
+        for signature, is_new, recorded in writes:
+            try:
+                await self.store.save(signature)
+            except (MemoryError, SystemExit, KeyboardInterrupt):
+                raise
+            except Exception as e:
+                logger.error(
+                    f"Failed to store signature {signature.fingerprint} "
+                    f"for {recorded + is_new} error events: {e}",
+                    exc_info=True,
+                )
+                failed_fingerprints.add(signature.fingerprint)
+                failed += recorded + is_new
+            else:
+                saved.append((signature, is_new, recorded))
+        return saved, failed_fingerprints, failed
+
+    def _fingerprint_errors(
+        self, errors: Sequence[ErrorEvent]
+    ) -> tuple[list[tuple[ErrorEvent, str]], int]:
+        """Fingerprint errors, skipping any that fail.
+
+        Errors with the same type, service, message and stack are only
+        fingerprinted once per batch.
+
+        Returns:
+            The (error, fingerprint) pairs that succeeded and the failure count.
+        """
+        fingerprinted: list[tuple[ErrorEvent, str]] = []
+        cache: dict[tuple[str, str, str, tuple[StackFrame, ...]], str] = {}
+        failures = 0
+        # Bind per-error callables once; the loop runs for every event
+        compute_fingerprint = self.fingerprinter.fingerprint
+        cached_fingerprint = cache.get
+        append = fingerprinted.append
+        for error in errors:
+            try:
+                key = (
+                    error.error_type,
+                    error.service,
+                    error.error_message,
+                    error.stack_frames,
+                )
+                fingerprint = cached_fingerprint(key)
+                if fingerprint is None:
+                    fingerprint = cache[key] = compute_fingerprint(error)
+                append((error, fingerprint))
+            except (MemoryError, SystemExit, KeyboardInterrupt):
+                # Don't catch system errors - let them propagate
+                raise
+            except Exception as e:
+                logger.error(
+                    f"Failed to process error event {error.trace_id}: {e}",
+                    exc_info=True,
+                )
+                failures += 1
+        return fingerprinted, failures
+
     async def execute_investigation_cycle(self) -> InvestigationResult:
         """Investigate pending signatures. Returns result with diagnoses and failure count.
 
@@ -155,43 +376,128 @@ class PollService(PollPort):
             logger.error(f"Failed to fetch pending signatures: {e}", exc_info=True)
             raise
 
-        # Convert to list and sort by priority
-        pending = list(pending_seq)
-        pending.sort(
-            key=lambda s: self.triage.calculate_priority(s), reverse=True
-        )
+        # Drop signatures triage won't investigate, then order by priority.
+        # With an investigation batch size only the top entries are selected,
+        # which is O(n log k) instead of a full sort.
+        # Filtering and scoring share a single clock reading.
+        now = datetime.now(UTC)
+        eligible = [s for s in pending_seq if self.triage.should_investigate(s, now)]
+        scored = list(zip(self.triage.calculate_priorities(eligible, now), eligible))
+        if (
+            self.investigation_batch_size is not None
+            and len(scored) > self.investigation_batch_size
+        ):
+            logger.info(
+                f"Limiting investigation cycle to {self.investigation_batch_size} "
+                f"signatures (found {len(scored)} eligible)"
+            )
+            scored = heapq.nlargest(
+                self.investigation_batch_size, scored, key=itemgetter(0)
+            )
+        else:
+            scored.sort(key=itemgetter(0), reverse=True)
+        pending = [signature for _, signature in scored]
 
-        diagnoses = []
-        investigations_attempted = 0
-        investigations_failed = 0
+        # Diagnoses are dominated by LLM latency, so run several at once.
+        # The semaphore is FIFO, so investigations still start in priority order.
+        semaphore = asyncio.Semaphore(self.max_concurrent_investigations)
 
-        for signature in pending:
-            if self.triage.should_investigate(signature):
-                investigations_attempted += 1
-                try:
-                    diagnosis = await self.investigator.investigate(signature)
-                    diagnoses.append(diagnosis)
-                except Exception as e:
-                    # Check if diagnosis was persisted despite the error
-                    # (e.g., notification failure after successful diagnosis)
-                    if signature.status == SignatureStatus.DIAGNOSED and signature.diagnosis is not None:
-                        # Diagnosis succeeded, only notification failed
-                        logger.warning(
-                            f"Investigation succeeded for signature {signature.fingerprint} "
-                            f"but post-diagnosis step failed: {e}",
-                            exc_info=True,
-                        )
-                        diagnoses.append(signature.diagnosis)
-                    else:
-                        # Actual investigation failure
-                        logger.error(
-                            f"Failed to investigate signature {signature.fingerprint}: {e}",
-                            exc_info=True,
-                        )
-                        investigations_failed += 1
+        # Notifications are collected and delivered together once every
+        # investigation has finished, so adapters can send a single digest.
+        notifications: list[tuple[Signature, Diagnosis]] = []
+
+        async def investigate(signature: Signature) -> Diagnosis | None:
+            async with semaphore:
+                return await self._investigate_one(signature, notifications)
+
+        try:
+            results = await asyncio.gather(*(investigate(s) for s in pending))
+        finally:
+            # Also runs on cancellation, so diagnoses that were already
+            # persisted are still reported
+            await self._flush_notifications(notifications)
+
+        diagnoses = [diagnosis for diagnosis in results if diagnosis is not None]
+        investigations_attempted = len(results)
+        investigations_failed = investigations_attempted - len(diagnoses)
 
         return InvestigationResult(
             diagnoses_produced=tuple(diagnoses),
             investigations_attempted=investigations_attempted,
             investigations_failed=investigations_failed,
         )
+
+    async def _flush_notifications(
+        self, notifications: list[tuple[Signature, Diagnosis]]
+    ) -> None:
+        """Deliver and clear the queued notifications.
+
+        A delivery failure is not raised: the diagnoses are already
+        persisted and the notification port has logged each failure.
+        """
+        if not notifications:
+            return
+        batch = notifications.copy()
+        notifications.clear()
+        try:
+            await self.investigator.notify_many(batch)
+        except Exception as e:
+            logger.debug(
+                f"Notification delivery failed for {len(batch)} diagnoses: {e}"
+            )
+
+    async def _investigate_one(
+        self,
+        signature: Signature,
+        notifications: list[tuple[Signature, Diagnosis]],
+    ) -> Diagnosis | None:
+        """Investigate a signature, returning None if the investigation failed.
+
+        While the diagnosis circuit is open the signature is left pending
+        and counted as failed without contacting any backend.
+        """
+        if not self.investigation_breaker.allow():
+            logger.warning(
+                f"Skipping investigation of signature {signature.fingerprint}: "
+                f"diagnosis backend unavailable after repeated failures"
+            )
+            return None
+
+        try:
+            diagnosis = await self.investigator.investigate(
+                signature, deferred_notifications=notifications
+            )
+        except Exception as e:
+            # Check if diagnosis was persisted despite the error
+            # (e.g., notification failure after successful diagnosis)
+            if signature.status == SignatureStatus.DIAGNOSED and signature.diagnosis is not None:
+                # Diagnosis succeeded, only notification failed
+                self.investigation_breaker.record_success()
+                logger.warning(
+                    f"Investigation succeeded for signature {signature.fingerprint} "
+                    f"but post-diagnosis step failed: {e}",
+                    exc_info=True,
+                )
+                return signature.diagnosis
+
+            if isinstance(e, ValueError):
+                # Budget, prompt-size and response validation refusals say
+                # nothing about backend health, so they neither close nor
+                # open the circuit
+                self.investigation_breaker.release()
+            else:
+                self.investigation_breaker.record_failure()
+
+            # Actual investigation failure
+            logger.error(
+                f"Failed to investigate signature {signature.fingerprint}: {e}",
+                exc_info=True,
+            )
+            return None
+        except BaseException:
+            # Cancelled mid-investigation; nothing was learned about the backend
+            self.investigation_breaker.release()
+            raise
+
+        self.investigation_breaker.record_success()
+        return diagnosis
@@ -17,10 +17,13 @@ Port Interface Categories:
    - ManagementPort: Human-initiated actions (mute, resolve, etc.)
 """
 
+import asyncio
+import logging
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
+from collections.abc import AsyncIterator, Sequence
 from datetime import datetime
-from typing import Any
+from types import TracebackType
+from typing import Any, Self
 
 from .models import (
     Diagnosis,
@@ -32,11 +35,15 @@ from .models import (
     PollResult,
     Signature,
     SignatureDetails,
+    SignatureEvidence,
     SignatureStatus,
     StoreStats,
     TraceTree,
 )
 
+logger = logging.getLogger(__name__)
+
+
 # ============================================================================
 # DRIVEN PORTS (Core calls out to adapters)
 # ============================================================================
@@ -81,6 +88,32 @@ class TelemetryPort(ABC):
                 Caller should handle gracefully (e.g., backoff retry).
         """
 
+    async def iter_recent_errors(
+        self, since: datetime, services: list[str] | None = None
+    ) -> AsyncIterator[ErrorEvent]:
+        """Yield error events since a timestamp, oldest first.
+
+        Events sharing a timestamp are ordered by trace and span ID, so a
+        caller that stops part-way through can pick up the rest on its
+        next call over the same window.
+
+        The default implementation sorts the result of get_recent_errors().
+        Adapters that can page through their backend may override this to
+        stream results instead.
+
+        Args:
+            since: Return errors after this timestamp.
+            services: Filter to specific services (optional).
+
+        Raises:
+            Exception: If telemetry backend is unreachable or returns error.
+        """
+        errors = await self.get_recent_errors(since, services)
+        for error in sorted(
+            errors, key=lambda e: (e.timestamp, e.trace_id, e.span_id)
+        ):
+            yield error
+
     @abstractmethod
     async def get_trace(self, trace_id: str) -> TraceTree:
         """Return the full span tree for a trace.
@@ -95,10 +128,17 @@ class TelemetryPort(ABC):
             Exception: If telemetry backend is unreachable or trace not found.
         """
 
-    @abstractmethod
+    # Upper bound on concurrent get_trace() calls in the default get_traces()
+    trace_fetch_concurrency: int = 16
+
     async def get_traces(self, trace_ids: list[str]) -> tuple[Sequence[TraceTree], PartialResultsInfo]:
         """Batch trace retrieval.
 
+        The default implementation fans out to get_trace() concurrently,
+        with at most ``trace_fetch_concurrency`` requests in flight, so a
+        batch costs roughly one round trip instead of one per trace.
+        Adapters whose backend has a native batch endpoint should override.
+
         Args:
             trace_ids: List of OpenTelemetry trace IDs.
 
@@ -113,6 +153,42 @@ class TelemetryPort(ABC):
             ValueError: If trace ID format validation fails (adapter-specific).
             Exception: If telemetry backend is unreachable.
         """
+        semaphore = asyncio.Semaphore(self.trace_fetch_concurrency)
+
+        async def fetch(trace_id: str) -> TraceTree:
+            async with semaphore:
+                return await self.get_trace(trace_id)
+
+        results = await asyncio.gather(
+            *(fetch(trace_id) for trace_id in trace_ids), return_exceptions=True
+        )
+
+        traces: list[TraceTree] = []
+        failed_trace_ids: list[str] = []
+        for trace_id, result in zip(trace_ids, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                logger.warning(f"Failed to fetch trace {trace_id}: {result}")
+                failed_trace_ids.append(trace_id)
+            else:
+                traces.append(result)
+
+        is_partial = len(failed_trace_ids) > 0
+        if is_partial:
+            logger.warning(
+                f"Batch trace retrieval incomplete: "
+                f"retrieved {len(traces)}/{len(trace_ids)} traces. "
+                f"Failed trace IDs: {failed_trace_ids}"
+            )
+
+        partial_info = PartialResultsInfo(
+            total_requested=len(trace_ids),
+            total_returned=len(traces),
+            is_partial=is_partial,
+            reason=f"Failed to retrieve {len(failed_trace_ids)} traces" if is_partial else None,
+        )
+        return traces, partial_info
 
     @abstractmethod
     async def get_correlated_logs(
@@ -136,7 +212,7 @@ class TelemetryPort(ABC):
 
     @abstractmethod
     async def get_events_for_signature(
-        self, fingerprint: str, limit: int = 5
+        self, fingerprint: str, limit: int = 5, services: list[str] | None = None
     ) -> Sequence[ErrorEvent]:
         """Return recent events matching a known fingerprint.
 
@@ -146,6 +222,9 @@ class TelemetryPort(ABC):
         Args:
             fingerprint: Signature fingerprint hash.
             limit: Maximum number of events to return.
+            services: Only search errors from these services (optional).
+                A fingerprint belongs to a single service, so passing it
+                narrows the search without losing matches.
 
         Returns:
             List of ErrorEvent objects matching the fingerprint.
@@ -154,6 +233,39 @@ class TelemetryPort(ABC):
             Exception: If telemetry backend is unreachable.
         """
 
+    async def get_signature_evidence(
+        self,
+        signature: Signature,
+        *,
+        event_limit: int = 5,
+        window_minutes: int = 5,
+    ) -> SignatureEvidence:
+        """Gather the events, traces and logs needed to investigate a signature.
+
+        The default looks up events from the signature's service with
+        get_events_for_signature(), then fetches their traces and
+        correlated logs concurrently.
+
+        Args:
+            signature: The signature under investigation.
+            event_limit: Maximum recent events to gather.
+            window_minutes: Time window for log correlation.
+
+        Raises:
+            Exception: If telemetry backend is unreachable.
+        """
+        events = await self.get_events_for_signature(
+            signature.fingerprint, limit=event_limit, services=[signature.service]
+        )
+        trace_ids = [e.trace_id for e in events]
+        (traces, trace_results), logs = await asyncio.gather(
+            self.get_traces(trace_ids),
+            self.get_correlated_logs(trace_ids, window_minutes=window_minutes),
+        )
+        return SignatureEvidence(
+            events=events, traces=traces, trace_results=trace_results, logs=logs
+        )
+
     async def close(self) -> None:
         """Close connections and clean up resources.
 
@@ -165,6 +277,19 @@ class TelemetryPort(ABC):
         """
         pass
 
+    async def __aenter__(self) -> Self:
+        """Enter an ``async with`` block that owns the adapter's HTTP clients."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Release the adapter's HTTP clients via close()."""
+        await self.close()
+
 
 class SignatureStorePort(ABC):
     """Port for persisting and querying failure signatures.
@@ -209,6 +334,31 @@ class SignatureStorePort(ABC):
             Exception: If database is unavailable.
         """
 
+    async def get_by_fingerprints(
+        self, fingerprints: Sequence[str]
+    ) -> dict[str, Signature]:
+        """Look up several signatures by fingerprint in one call.
+
+        Adapters should override this with a single batched query.
+        The default implementation calls get_by_fingerprint() per fingerprint.
+
+        Args:
+            fingerprints: Hex digests of normalized errors. Duplicates allowed.
+
+        Returns:
+            Mapping of fingerprint to Signature for every fingerprint found;
+            unknown fingerprints are omitted.
+
+        Raises:
+            Exception: If database is unavailable.
+        """
+        found: dict[str, Signature] = {}
+        for fingerprint in dict.fromkeys(fingerprints):
+            signature = await self.get_by_fingerprint(fingerprint)
+            if signature is not None:
+                found[fingerprint] = signature
+        return found
+
     @abstractmethod
     async def save(self, signature: Signature) -> None:
         """Create or update a signature.
@@ -231,6 +381,21 @@ class SignatureStorePort(ABC):
             Exception: If signature doesn't exist or database is unavailable.
         """
 
+    async def save_many(self, signatures: Sequence[Signature]) -> None:
+        """Create or update several signatures in one call.
+
+        Adapters should override this with a single batched write.
+        The default implementation calls save() per signature.
+
+        Args:
+            signatures: Signature objects to persist.
+
+        Raises:
+            Exception: If database is unavailable.
+        """
+        for signature in signatures:
+            await self.save(signature)
+
     @abstractmethod
     async def get_pending_investigation(self) -> Sequence[Signature]:
         """Return signatures with status NEW, ordered by priority.
@@ -258,6 +423,30 @@ class SignatureStorePort(ABC):
             Exception: If database is unavailable.
         """
 
+    async def iter_all(
+        self, status: SignatureStatus | None = None, batch_size: int = 500
+    ) -> AsyncIterator[Signature]:
+        """Stream all signatures, optionally filtered by status.
+
+        Same ordering and filtering as get_all(), but yields signatures one
+        at a time so callers iterating once need not hold the full result.
+        Adapters with cursor support should override this; the default
+        implementation iterates over get_all().
+
+        Args:
+            status: Filter to signatures with this status. If None, yield all.
+            batch_size: Rows fetched from the database per round trip, for
+                adapters that stream from a cursor.
+
+        Yields:
+            Signature objects matching the criteria.
+
+        Raises:
+            Exception: If database is unavailable.
+        """
+        for signature in await self.get_all(status):
+            yield signature
+
     @abstractmethod
     async def get_similar(
         self, signature: Signature, limit: int = 5
@@ -286,6 +475,32 @@ class SignatureStorePort(ABC):
             Exception: If database is unavailable.
         """
 
+    async def set_status(
+        self, signature_id: str, status: SignatureStatus
+    ) -> str | None:
+        """Set a signature's status unless it already has that status.
+
+        Adapters should override this with a single conditional UPDATE.
+        The default implementation reads and rewrites the whole signature.
+
+        Args:
+            signature_id: UUID of the signature.
+            status: New status to apply.
+
+        Returns:
+            Fingerprint of the updated signature, or None if no signature
+            with that ID exists or it already has the requested status.
+
+        Raises:
+            Exception: If database is unavailable.
+        """
+        signature = await self.get_by_id(signature_id)
+        if signature is None or signature.status == status:
+            return None
+        signature.status = status
+        await self.update(signature)
+        return signature.fingerprint
+
     async def close_pool(self) -> None:
         """Close database connections and clean up resources.
 
@@ -297,6 +512,19 @@ class SignatureStorePort(ABC):
         """
         pass
 
+    async def __aenter__(self) -> Self:
+        """Enter an ``async with`` block that owns the connection pool."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Release the connection pool via close_pool()."""
+        await self.close_pool()
+
 
 class DiagnosisPort(ABC):
     """Port for invoking LLM-powered root cause analysis.
@@ -349,6 +577,30 @@ class DiagnosisPort(ABC):
             Exception: If cost estimation fails.
         """
 
+    async def close(self) -> None:
+        """Close connections and clean up resources.
+
+        Optional lifecycle method for adapters that hold an API client.
+        Default implementation does nothing.
+
+        Raises:
+            Exception: If resource cleanup fails.
+        """
+        pass
+
+    async def __aenter__(self) -> Self:
+        """Enter an ``async with`` block that owns the adapter's API client."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Release the adapter's API client via close()."""
+        await self.close()
+
 
 class NotificationPort(ABC):
     """Port for reporting findings to developers.
@@ -380,6 +632,43 @@ class NotificationPort(ABC):
                 Caller may choose to queue for retry or log error.
         """
 
+    async def report_many(
+        self, items: Sequence[tuple[Signature, Diagnosis]]
+    ) -> None:
+        """Report a batch of diagnosed signatures, such as one poll cycle's findings.
+
+        Items are deduplicated by fingerprint, keeping the latest diagnosis.
+        The default reports each remaining item with report(); adapters
+        that can deliver a digest in one request should override this.
+        Implementations log delivery failures themselves; callers only
+        see the raised exception.
+
+        Args:
+            items: (signature, diagnosis) pairs to report.
+
+        Raises:
+            Exception: The first delivery failure, after every item has
+                been attempted.
+        """
+        latest: dict[str, tuple[Signature, Diagnosis]] = {}
+        for signature, diagnosis in items:
+            latest[signature.fingerprint] = (signature, diagnosis)
+
+        first_error: Exception | None = None
+        for signature, diagnosis in latest.values():
+            try:
+                await self.report(signature, diagnosis)
+            except Exception as e:
+                logger.error(
+                    f"Failed to report signature {signature.fingerprint}: {e}",
+                    exc_info=True,
+                )
+                if first_error is None:
+                    first_error = e
+
+        if first_error is not None:
+            raise first_error
+
     @abstractmethod
     async def report_summary(self, stats: dict[str, Any]) -> None:
         """Periodic summary report.
@@ -403,6 +692,19 @@ class NotificationPort(ABC):
         """
         pass
 
+    async def __aenter__(self) -> Self:
+        """Enter an ``async with`` block that owns the notification channel."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        """Release the notification channel via close()."""
+        await self.close()
+
 
 # ============================================================================
 # DRIVING PORTS (Adapters/external systems call into core)
@@ -459,6 +761,8 @@ class PollPort(ABC):
         """Investigate pending signatures.
 
         Returns result with diagnoses produced and failure count.
+        Implementations may run investigations concurrently but should
+        bound how many diagnoses are in flight at once.
 
         Returns:
             InvestigationResult containing diagnoses, attempt count, and failure count.
@@ -556,6 +860,26 @@ class ManagementPort(ABC):
             Exception: If database error occurs.
         """
 
+    async def iter_signatures(
+        self, status: SignatureStatus | None = None
+    ) -> AsyncIterator[Signature]:
+        """Stream all signatures, optionally filtered by status.
+
+        Streaming counterpart of list_signatures(). The default
+        implementation iterates over list_signatures().
+
+        Args:
+            status: Filter to signatures with this status. If None, yield all.
+
+        Yields:
+            Signature objects matching the criteria.
+
+        Raises:
+            Exception: If database error occurs.
+        """
+        for signature in await self.list_signatures(status):
+            yield signature
+
     @abstractmethod
     async def reinvestigate(self, signature_id: str) -> Diagnosis:
         """Trigger immediate investigation/re-investigation of a signature.
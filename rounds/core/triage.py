@@ -5,9 +5,18 @@ signatures should be investigated, in what order, and under what
 conditions.
 """
 
-from datetime import UTC, datetime, timedelta
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from typing import get_args
 
-from .models import Confidence, Diagnosis, Signature, SignatureStatus
+from .models import (
+    TAG_CRITICAL,
+    TAG_FLAKY,
+    Confidence,
+    Diagnosis,
+    Signature,
+    SignatureStatus,
+)
 
 
 class TriageEngine:
@@ -35,30 +44,52 @@ class TriageEngine:
         self.min_occurrence_for_investigation = min_occurrence_for_investigation
         self.investigation_cooldown_hours = investigation_cooldown_hours
         self.high_confidence_threshold = high_confidence_threshold
-
-    def should_investigate(self, signature: Signature) -> bool:
+        # Precomputed for should_investigate(), which runs on every signature
+        self._cooldown_seconds = investigation_cooldown_hours * 3600.0
+        self._skip_statuses = frozenset(
+            {SignatureStatus.RESOLVED, SignatureStatus.MUTED}
+        )
+        # (confidence, status) pairs that are reported regardless of tags:
+        # the high-confidence threshold always, medium only for new signatures
+        self._notify_rules = frozenset(
+            (confidence, status)
+            for confidence in get_args(Confidence)
+            for status in SignatureStatus
+            if confidence == high_confidence_threshold
+            or (confidence == "medium" and status == SignatureStatus.NEW)
+        )
+
+    def should_investigate(
+        self, signature: Signature, now: datetime | None = None
+    ) -> bool:
         """Is this signature worth sending to the diagnosis engine?
 
         Considers:
-        - Status (don't re-investigate diagnosed/resolved/muted)
         - Occurrence count (need enough data)
+        - Status (don't re-investigate resolved/muted)
         - Cooldown period (don't spam LLM for same signature)
+
+        Args:
+            signature: The signature to check.
+            now: Time to measure the cooldown against. Defaults to the
+                current time; pass one reading to decide a whole batch
+                against the same instant.
         """
+        # Cheapest and most selective check first: most signatures have not
+        # yet reached the minimum occurrence count
+        if signature.occurrence_count < self.min_occurrence_for_investigation:
+            return False
+
         # Don't investigate resolved or muted signatures
-        if signature.status in {SignatureStatus.RESOLVED, SignatureStatus.MUTED}:
+        if signature.status in self._skip_statuses:
             return False
 
         # Don't investigate if already diagnosed recently
         if signature.diagnosis is not None:
-            cooldown = timedelta(hours=self.investigation_cooldown_hours)
-            now = datetime.now(UTC)
-            if now - signature.diagnosis.diagnosed_at < cooldown:
+            elapsed = (now or datetime.now(UTC)) - signature.diagnosis.diagnosed_at
+            if elapsed.total_seconds() < self._cooldown_seconds:
                 return False
 
-        # Need minimum occurrence count for meaningful investigation
-        if signature.occurrence_count < self.min_occurrence_for_investigation:
-            return False
-
         return True
 
     def should_notify(
@@ -80,26 +111,18 @@ class TriageEngine:
             original_status: The original status before diagnosis. If provided,
                             used to determine if this is a new signature diagnosis.
         """
-        # Always notify high-confidence diagnoses
-        if diagnosis.confidence == self.high_confidence_threshold:
-            return True
-
-        # Notify medium confidence if it's a new signature
         # Use original_status if provided, otherwise check current status
         status_for_check = original_status if original_status is not None else signature.status
-        if (
-            status_for_check == SignatureStatus.NEW
-            and diagnosis.confidence == "medium"
-        ):
-            return True
 
-        # Notify if tagged as critical
-        if "critical" in signature.tags:
-            return True
+        # Confidence/status rules are precomputed in __init__; critical tags
+        # are always reported
+        return (diagnosis.confidence, status_for_check) in self._notify_rules or bool(
+            signature.tag_flags & TAG_CRITICAL
+        )
 
-        return False
-
-    def calculate_priority(self, signature: Signature) -> int:
+    def calculate_priority(
+        self, signature: Signature, now: datetime | None = None
+    ) -> int:
         """Order signatures for investigation when multiple are pending.
 
         Higher score = higher priority.
@@ -116,7 +139,25 @@ class TriageEngine:
         - Recency (last seen timestamp)
         - Whether it's new
         - Tags (critical > flaky > normal)
+
+        Recency is measured from ``now``, which defaults to the current time.
         """
+        return self._priority(signature, now or datetime.now(UTC))
+
+    def calculate_priorities(
+        self, signatures: Sequence[Signature], now: datetime | None = None
+    ) -> list[int]:
+        """Score a batch of signatures, in the same order.
+
+        Equivalent to calling calculate_priority() on each signature with
+        the same ``now``, so a large queue is ranked consistently. ``now``
+        defaults to a single reading of the current time.
+        """
+        now = now or datetime.now(UTC)
+        return [self._priority(signature, now) for signature in signatures]
+
+    def _priority(self, signature: Signature, now: datetime) -> int:
+        """Priority score of a signature as of ``now``."""
         priority = 0
 
         # Frequency component (0-100 points)
@@ -124,13 +165,10 @@ class TriageEngine:
 
         # Recency component (0-50 points max)
         # Recent errors (< 1 hour) are more actionable than older ones
-        now = datetime.now(UTC)
-        hours_since_last = (
-            now - signature.last_seen
-        ).total_seconds() / 3600
-        if hours_since_last < 1:
+        seconds_since_last = (now - signature.last_seen).total_seconds()
+        if seconds_since_last < 3600:
             priority += 50
-        elif hours_since_last < 24:
+        elif seconds_since_last < 86400:
             priority += 25
 
         # New signature bonus (50 points)
@@ -139,9 +177,10 @@ class TriageEngine:
             priority += 50
 
         # Tag bonuses
-        if "critical" in signature.tags:
+        tag_flags = signature.tag_flags
+        if tag_flags & TAG_CRITICAL:
             priority += 100
-        if "flaky-test" in signature.tags:
+        if tag_flags & TAG_FLAKY:
             priority -= 20  # Lower priority for known flaky tests
 
         return priority
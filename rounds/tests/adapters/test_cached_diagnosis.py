@@ -0,0 +1,139 @@
+"""Unit tests for CachingDiagnosisAdapter."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from rounds.adapters.diagnosis.cached import CachingDiagnosisAdapter
+from rounds.core.models import (
+    ErrorEvent,
+    InvestigationContext,
+    Severity,
+    Signature,
+    SignatureStatus,
+    StackFrame,
+)
+from rounds.tests.fakes import FakeClock, FakeDiagnosisPort
+
+
+@pytest.fixture
+def signature() -> Signature:
+    """Create a sample signature for testing."""
+    now = datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC)
+    return Signature(
+        id="sig-001",
+        fingerprint="abc123def456",
+        error_type="ConnectionTimeoutError",
+        service="payment-service",
+        message_template="Failed to connect to database: timeout",
+        stack_hash="hash-stack-001",
+        first_seen=now,
+        last_seen=now,
+        occurrence_count=5,
+        status=SignatureStatus.NEW,
+    )
+
+
+def make_context(signature: Signature, trace_id: str, message: str) -> InvestigationContext:
+    """Create a context with a single recent event."""
+    event = ErrorEvent(
+        trace_id=trace_id,
+        span_id="span-1",
+        service=signature.service,
+        error_type=signature.error_type,
+        error_message=message,
+        stack_frames=(
+            StackFrame(
+                module="payment.db", function="execute", filename="db.py", lineno=15
+            ),
+        ),
+        timestamp=datetime.now(UTC),
+        attributes={},
+        severity=Severity.ERROR,
+    )
+    return InvestigationContext(
+        signature=signature,
+        recent_events=(event,),
+        trace_data=(),
+        related_logs=(),
+        codebase_path="/app",
+        historical_context=(),
+    )
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    """Create a controllable clock."""
+    return FakeClock()
+
+
+@pytest.fixture
+def inner() -> FakeDiagnosisPort:
+    """Create the wrapped diagnosis port."""
+    return FakeDiagnosisPort()
+
+
+@pytest.fixture
+def adapter(inner: FakeDiagnosisPort, clock: FakeClock) -> CachingDiagnosisAdapter:
+    """Create a caching adapter with a one-hour TTL."""
+    return CachingDiagnosisAdapter(inner, ttl_seconds=3600, max_entries=2, clock=clock)
+
+
+@pytest.mark.asyncio
+async def test_repeat_context_reuses_diagnosis_at_no_cost(
+    adapter: CachingDiagnosisAdapter, inner: FakeDiagnosisPort, signature: Signature
+) -> None:
+    """Contexts differing only in trace IDs should hit the cache."""
+    first = await adapter.diagnose(make_context(signature, "trace-1", "timeout"))
+    second = await adapter.diagnose(make_context(signature, "trace-2", "timeout"))
+
+    assert len(inner.diagnose_calls) == 1
+    assert second.root_cause == first.root_cause
+    assert first.cost_usd > 0
+    assert second.cost_usd == 0.0
+    assert await adapter.estimate_cost(make_context(signature, "trace-3", "timeout")) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_different_evidence_misses_cache(
+    adapter: CachingDiagnosisAdapter, inner: FakeDiagnosisPort, signature: Signature
+) -> None:
+    """A context with different error content should be diagnosed again."""
+    await adapter.diagnose(make_context(signature, "trace-1", "timeout"))
+    await adapter.diagnose(make_context(signature, "trace-1", "refused"))
+
+    assert len(inner.diagnose_calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_and_evicted_entries_are_not_reused(
+    adapter: CachingDiagnosisAdapter,
+    inner: FakeDiagnosisPort,
+    clock: FakeClock,
+    signature: Signature,
+) -> None:
+    """Entries past their TTL or beyond max_entries should be dropped."""
+    await adapter.diagnose(make_context(signature, "trace-1", "timeout"))
+    clock.now = 3600
+    await adapter.diagnose(make_context(signature, "trace-1", "timeout"))
+    assert len(inner.diagnose_calls) == 2
+
+    await adapter.diagnose(make_context(signature, "trace-1", "refused"))
+    await adapter.diagnose(make_context(signature, "trace-1", "reset"))
+    await adapter.diagnose(make_context(signature, "trace-1", "timeout"))
+    assert len(inner.diagnose_calls) == 5
+
+
+@pytest.mark.asyncio
+async def test_failures_are_not_cached(
+    adapter: CachingDiagnosisAdapter, inner: FakeDiagnosisPort, signature: Signature
+) -> None:
+    """A failed diagnosis should not populate the cache."""
+    inner.set_should_fail(True)
+    with pytest.raises(RuntimeError):
+        await adapter.diagnose(make_context(signature, "trace-1", "timeout"))
+
+    inner.set_should_fail(False)
+    await adapter.diagnose(make_context(signature, "trace-1", "timeout"))
+
+    assert len(inner.diagnose_calls) == 2
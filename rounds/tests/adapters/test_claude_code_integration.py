@@ -109,3 +109,23 @@ async def test_budget_exceeded_raises_error(
     # Attempt to diagnose should raise ValueError due to budget
     with pytest.raises(ValueError, match="exceeds budget"):
         await adapter.diagnose(investigation_context)
+
+
+@pytest.mark.asyncio
+async def test_oversized_prompt_rejected_without_invoking_cli(
+    investigation_context: InvestigationContext,
+) -> None:
+    """Prompts over max_prompt_tokens should fail before the CLI runs."""
+    adapter = ClaudeCodeDiagnosisAdapter(
+        model="claude-opus",
+        budget_usd=1.0,
+        max_prompt_tokens=10,
+    )
+
+    async def fail_invoke(prompt: str) -> dict:
+        raise AssertionError("CLI should not be invoked")
+
+    adapter._invoke_claude_code = fail_invoke  # type: ignore[method-assign]
+
+    with pytest.raises(ValueError, match="exceeds limit of 10"):
+        await adapter.diagnose(investigation_context)
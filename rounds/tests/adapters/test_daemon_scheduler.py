@@ -114,9 +114,9 @@ async def test_run_loop_executes_poll_cycles(
     )
     scheduler.running = True  # Start the scheduler
 
-    # Run for a short time then stop
+    # Stop as soon as the first cycle has run
     async def run_then_stop() -> None:
-        await asyncio.sleep(0.05)
+        await poll_port.poll_cycle_event.wait()
         await scheduler.stop()
 
     # Run both concurrently so stop_task can interrupt _run_loop
@@ -141,14 +141,15 @@ async def test_run_loop_exits_on_stop_called(
     )
     scheduler.running = True  # Start the scheduler
 
-    async def stop_after_delay() -> None:
-        await asyncio.sleep(0.01)
+    async def stop_after_first_cycle() -> None:
+        await poll_port.poll_cycle_event.wait()
         await scheduler.stop()
 
-    # Run both concurrently so stop_task can interrupt _run_loop
-    await asyncio.gather(
-        scheduler._run_loop(),
-        stop_after_delay(),
+    # Run both concurrently so stop_task can interrupt _run_loop; stop()
+    # must end the 10s interval wait rather than let it run out
+    await asyncio.wait_for(
+        asyncio.gather(scheduler._run_loop(), stop_after_first_cycle()),
+        timeout=1,
     )
 
     # Should exit quickly despite long poll interval
@@ -182,9 +183,9 @@ async def test_run_loop_investigation_failure_tracking(
     # Make investigation cycle fail
     poll_port.should_fail_investigation = True
 
-    # Run a few cycles
+    # Stop once the (failing) investigation cycle has run
     async def stop_after_cycles() -> None:
-        await asyncio.sleep(0.05)
+        await poll_port.investigation_cycle_event.wait()
         await scheduler.stop()
 
     # Run both concurrently so stop_task can interrupt _run_loop
@@ -8,6 +8,7 @@ from pathlib import Path
 import pytest
 
 from rounds.adapters.store.sqlite import SQLiteSignatureStore
+from rounds.core.models import Signature, SignatureStatus
 
 
 @pytest.fixture
@@ -141,3 +142,138 @@ async def test_row_parsing_with_negative_occurrence_count(
     # Attempt to load the row - should raise ValueError
     with pytest.raises(ValueError, match=r"Row parsing failed|occurrence_count"):
         await store.get_by_id("test-id")
+
+
+@pytest.mark.asyncio
+async def test_set_status_updates_once_and_returns_fingerprint(
+    temp_db: tuple[SQLiteSignatureStore, Path],
+) -> None:
+    """Test that set_status returns the fingerprint only when the row changes."""
+    store, _db_path = temp_db
+    now = datetime.now(UTC)
+    await store.save(
+        Signature(
+            id="test-id",
+            fingerprint="test-fp",
+            error_type="TestError",
+            service="test-service",
+            message_template="test message",
+            stack_hash="test-hash",
+            first_seen=now,
+            last_seen=now,
+            occurrence_count=1,
+            status=SignatureStatus.NEW,
+        )
+    )
+
+    assert await store.set_status("test-id", SignatureStatus.MUTED) == "test-fp"
+    assert await store.set_status("test-id", SignatureStatus.MUTED) is None
+    assert await store.set_status("missing-id", SignatureStatus.MUTED) is None
+
+    signature = await store.get_by_id("test-id")
+    assert signature is not None
+    assert signature.status == SignatureStatus.MUTED
+
+
+@pytest.mark.asyncio
+async def test_iter_all_streams_filtered_signatures(
+    temp_db: tuple[SQLiteSignatureStore, Path],
+) -> None:
+    """Test that iter_all yields the same rows as get_all."""
+    store, _db_path = temp_db
+    now = datetime.now(UTC)
+    for i, status in enumerate(
+        [SignatureStatus.NEW, SignatureStatus.MUTED, SignatureStatus.NEW]
+    ):
+        await store.save(
+            Signature(
+                id=f"test-id-{i}",
+                fingerprint=f"test-fp-{i}",
+                error_type="TestError",
+                service="test-service",
+                message_template="test message",
+                stack_hash="test-hash",
+                first_seen=now,
+                last_seen=now,
+                occurrence_count=i + 1,
+                status=status,
+            )
+        )
+
+    streamed = [s.id async for s in store.iter_all(SignatureStatus.NEW)]
+    listed = [s.id for s in await store.get_all(SignatureStatus.NEW)]
+
+    assert streamed == listed == ["test-id-2", "test-id-0"]
+    assert len([s async for s in store.iter_all()]) == 3
+    # Chunk size only changes how rows are fetched, not what is yielded
+    assert [s.id async for s in store.iter_all(batch_size=1)] == [
+        s.id for s in await store.get_all()
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_by_fingerprints_returns_only_known(
+    temp_db: tuple[SQLiteSignatureStore, Path],
+) -> None:
+    """Test that get_by_fingerprints batches lookups and omits misses."""
+    store, _db_path = temp_db
+    store._FINGERPRINT_BATCH_SIZE = 2
+    now = datetime.now(UTC)
+    for i in range(3):
+        await store.save(
+            Signature(
+                id=f"test-id-{i}",
+                fingerprint=f"test-fp-{i}",
+                error_type="TestError",
+                service="test-service",
+                message_template="test message",
+                stack_hash="test-hash",
+                first_seen=now,
+                last_seen=now,
+                occurrence_count=1,
+                status=SignatureStatus.NEW,
+            )
+        )
+
+    found = await store.get_by_fingerprints(
+        ["test-fp-0", "missing", "test-fp-2", "test-fp-0", "test-fp-1"]
+    )
+
+    assert sorted(found) == ["test-fp-0", "test-fp-1", "test-fp-2"]
+    assert found["test-fp-2"].id == "test-id-2"
+    assert await store.get_by_fingerprints([]) == {}
+
+
+@pytest.mark.asyncio
+async def test_save_many_inserts_and_replaces(
+    temp_db: tuple[SQLiteSignatureStore, Path],
+) -> None:
+    """Test that save_many writes new rows and replaces existing ones."""
+    store, _db_path = temp_db
+    now = datetime.now(UTC)
+    signatures = [
+        Signature(
+            id=f"test-id-{i}",
+            fingerprint=f"test-fp-{i}",
+            error_type="TestError",
+            service="test-service",
+            message_template="test message",
+            stack_hash="test-hash",
+            first_seen=now,
+            last_seen=now,
+            occurrence_count=1,
+            status=SignatureStatus.NEW,
+            tags=("flaky",),
+        )
+        for i in range(2)
+    ]
+    await store.save(signatures[0])
+    signatures[0].record_occurrence(now)
+
+    await store.save_many(signatures)
+    await store.save_many([])
+
+    found = await store.get_by_fingerprints(["test-fp-0", "test-fp-1"])
+    assert found["test-fp-0"].occurrence_count == 2
+    assert found["test-fp-1"].tags == ("flaky",)
+    assert len(await store.get_all()) == 2
@@ -0,0 +1,76 @@
+"""Unit tests for the telemetry adapters' HTTP transport."""
+
+from typing import Any
+
+import httpx
+import pytest
+
+from rounds.adapters.telemetry.signoz import SigNozTelemetryAdapter
+from rounds.adapters.telemetry.transport import retrying_transport
+
+PROXY_VARS = (
+    "HTTP_PROXY",
+    "HTTPS_PROXY",
+    "ALL_PROXY",
+    "NO_PROXY",
+    "http_proxy",
+    "https_proxy",
+    "all_proxy",
+    "no_proxy",
+)
+
+
+@pytest.fixture
+def transport_kwargs(monkeypatch: pytest.MonkeyPatch) -> list[dict[str, Any]]:
+    """Record the arguments of every AsyncHTTPTransport built, with a clean proxy env."""
+    for name in PROXY_VARS:
+        monkeypatch.delenv(name, raising=False)
+
+    calls: list[dict[str, Any]] = []
+    real_transport = httpx.AsyncHTTPTransport
+
+    def record(**kwargs: Any) -> httpx.AsyncHTTPTransport:
+        calls.append(kwargs)
+        return real_transport(**kwargs)
+
+    monkeypatch.setattr(httpx, "AsyncHTTPTransport", record)
+    return calls
+
+
+def test_no_proxy_configured(transport_kwargs: list[dict[str, Any]]) -> None:
+    """Without proxy variables requests connect directly, with retries."""
+    retrying_transport("http://signoz:4418", 3)
+
+    assert transport_kwargs == [{"retries": 3, "proxy": None}]
+
+
+def test_uses_proxy_from_environment(
+    monkeypatch: pytest.MonkeyPatch, transport_kwargs: list[dict[str, Any]]
+) -> None:
+    """The proxy for the URL's scheme should be used."""
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy:3128")
+
+    retrying_transport("https://signoz.example.com", 2)
+    retrying_transport("http://signoz.example.com", 2)
+
+    assert [call["proxy"] for call in transport_kwargs] == ["http://proxy:3128", None]
+
+
+def test_no_proxy_hosts_connect_directly(
+    monkeypatch: pytest.MonkeyPatch, transport_kwargs: list[dict[str, Any]]
+) -> None:
+    """Hosts listed in NO_PROXY should bypass ALL_PROXY."""
+    monkeypatch.setenv("ALL_PROXY", "http://proxy:3128")
+    monkeypatch.setenv("NO_PROXY", "internal")
+
+    retrying_transport("http://signoz.internal:4418", 2)
+    retrying_transport("http://signoz.example.com", 2)
+
+    assert [call["proxy"] for call in transport_kwargs] == [None, "http://proxy:3128"]
+
+
+def test_adapter_defaults_match_settings(transport_kwargs: list[dict[str, Any]]) -> None:
+    """Adapters should retry as often as Settings.telemetry_max_retries by default."""
+    SigNozTelemetryAdapter(api_url="http://signoz:4418")
+
+    assert transport_kwargs == [{"retries": 2, "proxy": None}]
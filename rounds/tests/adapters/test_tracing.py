@@ -0,0 +1,70 @@
+"""Unit tests for OpenTelemetry port instrumentation."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+
+from rounds.adapters.tracing import instrument_port
+from rounds.core.ports import TelemetryPort
+from rounds.tests.fakes import FakeTelemetryPort
+
+
+class RecordingTracer:
+    """Stands in for an OpenTelemetry tracer, recording span names."""
+
+    def __init__(self) -> None:
+        self.spans: list[tuple[str, dict[str, Any]]] = []
+
+    @contextmanager
+    def start_as_current_span(
+        self, name: str, attributes: dict[str, Any]
+    ) -> Iterator[None]:
+        self.spans.append((name, attributes))
+        yield
+
+
+@pytest.mark.asyncio
+async def test_instrumented_methods_record_spans() -> None:
+    """Public coroutine methods should run inside a named span."""
+    tracer = RecordingTracer()
+    telemetry = instrument_port(FakeTelemetryPort(), "telemetry", tracer=tracer)
+
+    await telemetry.get_recent_errors(datetime.now(UTC))
+
+    assert isinstance(telemetry, TelemetryPort)
+    assert tracer.spans == [
+        (
+            "FakeTelemetryPort.get_recent_errors",
+            {"port.name": "telemetry", "port.method": "get_recent_errors"},
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_lifecycle_and_generator_methods_are_not_traced() -> None:
+    """close() and async generators should be left as they are."""
+    tracer = RecordingTracer()
+    telemetry = instrument_port(FakeTelemetryPort(), "telemetry", tracer=tracer)
+
+    await telemetry.close()
+    errors = [e async for e in telemetry.iter_recent_errors(datetime.now(UTC))]
+
+    assert errors == []
+    # Only the get_recent_errors call made by the default iterator is traced
+    assert [name for name, _ in tracer.spans] == ["FakeTelemetryPort.get_recent_errors"]
+
+
+@pytest.mark.asyncio
+async def test_exceptions_propagate_through_span() -> None:
+    """Errors from the adapter should reach the caller unchanged."""
+    tracer = RecordingTracer()
+    telemetry = FakeTelemetryPort()
+    telemetry.set_error(ConnectionError("backend down"))
+    instrument_port(telemetry, "telemetry", tracer=tracer)
+
+    with pytest.raises(ConnectionError, match="backend down"):
+        await telemetry.get_recent_errors(datetime.now(UTC))
+    assert len(tracer.spans) == 1
@@ -0,0 +1,83 @@
+"""Tests for the consecutive-failure circuit breaker."""
+
+import pytest
+
+from rounds.core.circuit_breaker import CircuitBreaker
+from rounds.tests.fakes import FakeClock
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock: FakeClock) -> CircuitBreaker:
+    return CircuitBreaker(
+        "telemetry", failure_threshold=3, reset_timeout_seconds=30.0, clock=clock
+    )
+
+
+def test_opens_after_consecutive_failures(breaker: CircuitBreaker) -> None:
+    """The circuit should open only once the threshold is reached."""
+    breaker.record_failure()
+    breaker.record_failure()
+    assert breaker.allow()
+
+    breaker.record_failure()
+
+    assert breaker.state == "open"
+    assert not breaker.allow()
+
+
+def test_success_resets_failure_count(breaker: CircuitBreaker) -> None:
+    """Failures separated by a success should not open the circuit."""
+    breaker.record_failure()
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+
+    assert breaker.state == "closed"
+
+
+def test_half_open_allows_a_single_trial(
+    breaker: CircuitBreaker, clock: FakeClock
+) -> None:
+    """After the cool-down one trial call is allowed; its outcome decides."""
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now = 30.0
+
+    assert breaker.state == "half_open"
+    assert breaker.allow()
+    assert not breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    clock.now = 60.0
+    assert breaker.allow()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.allow()
+
+
+def test_release_frees_the_trial_without_changing_state(
+    breaker: CircuitBreaker, clock: FakeClock
+) -> None:
+    """A released trial should let the next caller probe the backend."""
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now = 30.0
+
+    assert breaker.allow()
+    breaker.release()
+
+    assert breaker.state == "half_open"
+    assert breaker.allow()
+
+
+def test_rejects_invalid_threshold() -> None:
+    """A non-positive threshold should be rejected."""
+    with pytest.raises(ValueError, match="failure_threshold"):
+        CircuitBreaker("telemetry", failure_threshold=0)
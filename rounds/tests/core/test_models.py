@@ -0,0 +1,175 @@
+"""Tests for domain model construction and normalization.
+
+Verifies the conversions performed in model __post_init__ hooks.
+"""
+
+import dataclasses
+from datetime import UTC, datetime
+from types import MappingProxyType
+
+import pytest
+
+from rounds.core import models
+from rounds.core.models import (
+    TAG_CRITICAL,
+    TAG_FLAKY,
+    InvestigationContext,
+    Signature,
+    SignatureStatus,
+    SpanNode,
+)
+
+MODEL_CLASSES = [
+    obj
+    for obj in vars(models).values()
+    if isinstance(obj, type)
+    and dataclasses.is_dataclass(obj)
+    and obj.__module__ == models.__name__
+]
+
+
+def make_span(events: tuple) -> SpanNode:
+    """Create a span with the given events."""
+    return SpanNode(
+        span_id="span-1",
+        parent_id=None,
+        service="payment-service",
+        operation="charge",
+        duration_ms=12.5,
+        status="error",
+        attributes={"http.status_code": 500},
+        events=events,
+    )
+
+
+@pytest.fixture
+def signature() -> Signature:
+    """Create a sample signature for testing."""
+    return Signature(
+        id="sig-001",
+        fingerprint="abc123def456",
+        error_type="ConnectionTimeoutError",
+        service="payment-service",
+        message_template="Failed to connect to database: timeout",
+        stack_hash="hash-stack-001",
+        first_seen=datetime(2024, 1, 1, 12, 0, 0, tzinfo=UTC),
+        last_seen=datetime(2024, 1, 1, 12, 5, 0, tzinfo=UTC),
+        occurrence_count=5,
+        status=SignatureStatus.NEW,
+    )
+
+
+class TestInvestigationContext:
+    """Tests for InvestigationContext sequence normalization."""
+
+    def test_lists_are_converted_to_tuples(self, signature: Signature) -> None:
+        """List inputs should be stored as tuples."""
+        context = InvestigationContext(
+            signature=signature,
+            recent_events=[],
+            trace_data=[],
+            related_logs=[],
+            codebase_path="/tmp",
+            historical_context=[signature],
+        )
+
+        assert context.recent_events == ()
+        assert context.trace_data == ()
+        assert context.related_logs == ()
+        assert context.historical_context == (signature,)
+
+    def test_tuples_are_not_copied(self, signature: Signature) -> None:
+        """Tuple inputs should be stored by reference."""
+        similar = (signature,)
+        context = InvestigationContext(
+            signature=signature,
+            recent_events=(),
+            trace_data=(),
+            related_logs=(),
+            codebase_path="/tmp",
+            historical_context=similar,
+        )
+
+        assert context.historical_context is similar
+
+
+class TestSpanNode:
+    """Tests for SpanNode construction."""
+
+    def test_events_and_attributes_are_stored_as_given(self) -> None:
+        """Adapters own read-only wrapping; the model must not rebuild inputs."""
+        events = (MappingProxyType({"name": "retry"}),)
+        span = make_span(events)
+
+        assert span.events is events
+        assert span.attributes == {"http.status_code": 500}
+
+
+class TestSignatureTags:
+    """Tests for Signature tag normalization."""
+
+    def test_tags_are_sorted_and_deduplicated(self, signature: Signature) -> None:
+        """Any iterable of tags should become a sorted unique tuple."""
+        signature.tags = ["flaky-test", "critical", "flaky-test"]  # type: ignore[assignment]
+        signature.__post_init__()
+
+        assert signature.tags == ("critical", "flaky-test")
+
+    def test_frozenset_tags_are_accepted(self) -> None:
+        """Frozenset tags from older call sites should still be accepted."""
+        now = datetime(2024, 1, 1, tzinfo=UTC)
+        sig = Signature(
+            id="sig-002",
+            fingerprint="fp-002",
+            error_type="ValueError",
+            service="svc",
+            message_template="bad value",
+            stack_hash="hash-002",
+            first_seen=now,
+            last_seen=now,
+            occurrence_count=1,
+            status=SignatureStatus.NEW,
+            tags=frozenset({"b", "a"}),  # type: ignore[arg-type]
+        )
+
+        assert sig.tags == ("a", "b")
+
+    def test_add_tag_keeps_order(self, signature: Signature) -> None:
+        """add_tag should insert in sorted position and ignore duplicates."""
+        signature.add_tag("m")
+        signature.add_tag("a")
+        signature.add_tag("z")
+        signature.add_tag("m")
+
+        assert signature.tags == ("a", "m", "z")
+
+    def test_tag_flags_follow_tags(self, signature: Signature) -> None:
+        """tag_flags should mirror the well-known tags however they are set."""
+        assert signature.tag_flags == 0
+
+        signature.add_tag("critical")
+        assert signature.tag_flags == TAG_CRITICAL
+
+        flaky = dataclasses.replace(signature, tags=("flaky-test", "other"))
+        assert flaky.tag_flags == TAG_FLAKY
+
+    def test_tag_flags_follow_assigned_tags(self, signature: Signature) -> None:
+        """Assigning tags directly should recompute tag_flags."""
+        signature.tags = ("critical",)
+        assert signature.tag_flags == TAG_CRITICAL
+
+        signature.tags = ()
+        assert signature.tag_flags == 0
+
+
+class TestSlots:
+    """Regression tests keeping domain models slotted."""
+
+    @pytest.mark.parametrize("cls", MODEL_CLASSES, ids=lambda c: c.__name__)
+    def test_model_declares_slots(self, cls: type) -> None:
+        """Every dataclass model should declare __slots__."""
+        assert "__slots__" in cls.__dict__
+
+    def test_signature_has_no_instance_dict(self, signature: Signature) -> None:
+        """Signature instances should not carry a __dict__."""
+        assert not hasattr(signature, "__dict__")
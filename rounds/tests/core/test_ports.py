@@ -4,7 +4,9 @@ Tests verify that port abstract base classes are properly defined
 and that implementations must satisfy the interface contract.
 """
 
+import asyncio
 import sys
+from dataclasses import replace
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
@@ -244,7 +246,7 @@ class MockTelemetryPort(TelemetryPort):
         return []
 
     async def get_events_for_signature(
-        self, fingerprint: str, limit: int = 5
+        self, fingerprint: str, limit: int = 5, services: list[str] | None = None
     ) -> list[ErrorEvent]:
         """Mock implementation."""
         return []
@@ -488,6 +490,64 @@ class TestTelemetryPort:
         assert all(isinstance(t, TraceTree) for t in traces)
         assert isinstance(partial_info, PartialResultsInfo)
 
+    @pytest.mark.asyncio
+    async def test_default_get_traces_bounds_concurrency(self) -> None:
+        """Default get_traces should fan out, cap in-flight calls, and omit failures."""
+
+        class FanOutTelemetryPort(MockTelemetryPort):
+            trace_fetch_concurrency = 2
+            get_traces = TelemetryPort.get_traces
+
+            def __init__(self) -> None:
+                self.in_flight = 0
+                self.max_in_flight = 0
+
+            async def get_trace(self, trace_id: str) -> TraceTree:
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+                try:
+                    await asyncio.sleep(0)
+                    if trace_id == "missing":
+                        raise RuntimeError("trace not found")
+                    return await super().get_trace(trace_id)
+                finally:
+                    self.in_flight -= 1
+
+        port = FanOutTelemetryPort()
+        traces, partial_info = await port.get_traces(
+            ["trace-1", "missing", "trace-2", "trace-3"]
+        )
+
+        assert [t.trace_id for t in traces] == ["trace-1", "trace-2", "trace-3"]
+        assert port.max_in_flight == 2
+        assert partial_info.is_partial
+        assert partial_info.total_returned == 3
+
+    @pytest.mark.asyncio
+    async def test_default_get_signature_evidence_follows_events(
+        self, signature: Signature, error_event: ErrorEvent
+    ) -> None:
+        """Default get_signature_evidence should fetch traces for found events."""
+        searched_services: list[list[str] | None] = []
+
+        class EventTelemetryPort(MockTelemetryPort):
+            async def get_events_for_signature(
+                self,
+                fingerprint: str,
+                limit: int = 5,
+                services: list[str] | None = None,
+            ) -> list[ErrorEvent]:
+                searched_services.append(services)
+                return [error_event]
+
+        evidence = await EventTelemetryPort().get_signature_evidence(signature)
+
+        assert searched_services == [[signature.service]]
+        assert list(evidence.events) == [error_event]
+        assert [t.trace_id for t in evidence.traces] == [error_event.trace_id]
+        assert not evidence.trace_results.is_partial
+        assert list(evidence.logs) == []
+
     @pytest.mark.asyncio
     async def test_get_correlated_logs_returns_list(self) -> None:
         """get_correlated_logs must return a list of LogEntry."""
@@ -611,6 +671,52 @@ class TestNotificationPort:
         port = MockNotificationPort()
         await port.report_summary({})
 
+    @pytest.mark.asyncio
+    async def test_async_with_closes_port(self) -> None:
+        """Leaving an async with block should close the adapter."""
+
+        class ClosingNotificationPort(MockNotificationPort):
+            closed = False
+
+            async def close(self) -> None:
+                self.closed = True
+
+        async with ClosingNotificationPort() as port:
+            assert not port.closed
+        assert port.closed
+
+    @pytest.mark.asyncio
+    async def test_default_report_many_dedupes_and_attempts_every_item(
+        self, signature: Signature, diagnosis: Diagnosis
+    ) -> None:
+        """Default report_many should report each fingerprint once and try all."""
+
+        class RecordingNotificationPort(MockNotificationPort):
+            def __init__(self) -> None:
+                self.reported: list[str] = []
+
+            async def report(self, signature: Signature, diagnosis: Diagnosis) -> None:
+                if signature.id == "sig-broken":
+                    raise RuntimeError("channel unavailable")
+                self.reported.append(signature.id)
+
+        broken = replace(signature, id="sig-broken", fingerprint="fp-broken")
+        other = replace(signature, id="sig-other", fingerprint="fp-other")
+        duplicate = replace(signature, id="sig-duplicate")
+        port = RecordingNotificationPort()
+
+        with pytest.raises(RuntimeError, match="channel unavailable"):
+            await port.report_many(
+                [
+                    (signature, diagnosis),
+                    (broken, diagnosis),
+                    (other, diagnosis),
+                    (duplicate, diagnosis),
+                ]
+            )
+
+        assert port.reported == ["sig-duplicate", "sig-other"]
+
 
 # ============================================================================
 # Test PollPort Contract
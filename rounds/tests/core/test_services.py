@@ -4,10 +4,14 @@ Tests verify that Fingerprinter, TriageEngine, Investigator, and PollService
 implement the core diagnostic logic correctly.
 """
 
+import asyncio
+import dataclasses
+from collections.abc import Sequence
 from datetime import UTC, datetime, timedelta
 
 import pytest
 
+from rounds.core.circuit_breaker import CircuitBreaker
 from rounds.core.fingerprint import Fingerprinter
 from rounds.core.investigator import Investigator
 from rounds.core.management_service import ManagementService
@@ -146,6 +150,20 @@ class PartialTraceTelemetryPort(FakeTelemetryPort):
         return await super().get_trace(trace_id)
 
 
+class BatchingNotificationPort(FakeNotificationPort):
+    """Extends FakeNotificationPort to record each report_many() batch."""
+
+    def __init__(self) -> None:
+        """Initialize with no batches."""
+        super().__init__()
+        self.batches: list[list[str]] = []
+
+    async def report_many(self, items: Sequence[tuple[Signature, Diagnosis]]) -> None:
+        """Record the signature IDs in the batch, then report it."""
+        self.batches.append([sig.id for sig, _ in items])
+        await super().report_many(items)
+
+
 # ============================================================================
 # Fingerprinter Tests
 # ============================================================================
@@ -503,6 +521,38 @@ class TestTriageEngine:
         )
         assert triage_engine.should_notify(critical_signature, diagnosis)
 
+    def test_assigned_critical_tag_affects_triage(
+        self, triage_engine: TriageEngine, signature: Signature
+    ) -> None:
+        """Tags assigned after construction should count as much as initial ones."""
+        diagnosis = Diagnosis(
+            root_cause="root",
+            evidence=(),
+            suggested_fix="fix",
+            confidence="low",
+            diagnosed_at=datetime.now(),
+            model="model",
+            cost_usd=0.0,
+        )
+        untagged_priority = triage_engine.calculate_priority(signature)
+
+        signature.tags = ("critical",)
+
+        assert triage_engine.should_notify(signature, diagnosis)
+        assert triage_engine.calculate_priority(signature) == untagged_priority + 100
+
+    def test_should_notify_medium_confidence_uses_original_status(
+        self, triage_engine: TriageEngine, signature: Signature, diagnosis: Diagnosis
+    ) -> None:
+        """Medium confidence is reported only when the signature was new."""
+        medium = dataclasses.replace(diagnosis, confidence="medium")
+        signature.status = SignatureStatus.DIAGNOSED
+
+        assert not triage_engine.should_notify(signature, medium)
+        assert triage_engine.should_notify(
+            signature, medium, original_status=SignatureStatus.NEW
+        )
+
     def test_calculate_priority_frequency_component(
         self, triage_engine: TriageEngine
     ) -> None:
@@ -604,6 +654,60 @@ class TestTriageEngine:
             sig1
         )
 
+    def test_calculate_priorities_matches_scalar_scores(
+        self, triage_engine: TriageEngine
+    ) -> None:
+        """Batch scoring should agree with calculate_priority, in input order."""
+        now = datetime.now(UTC)
+        signatures = [
+            Signature(
+                id=f"sig-{i}",
+                fingerprint=f"fp-{i}",
+                error_type="Error",
+                service="service",
+                message_template="msg",
+                stack_hash="hash",
+                first_seen=now - timedelta(days=2),
+                last_seen=now - timedelta(hours=hours_ago),
+                occurrence_count=count,
+                status=status,
+                tags=frozenset(tags),
+            )
+            for i, (hours_ago, count, status, tags) in enumerate(
+                [
+                    (0, 150, SignatureStatus.NEW, ["critical"]),
+                    (5, 10, SignatureStatus.INVESTIGATING, ["flaky-test"]),
+                    (48, 3, SignatureStatus.NEW, []),
+                ]
+            )
+        ]
+
+        assert triage_engine.calculate_priorities(signatures) == [
+            triage_engine.calculate_priority(s) for s in signatures
+        ]
+        assert triage_engine.calculate_priorities([]) == []
+
+    def test_decisions_use_the_given_time(
+        self, triage_engine: TriageEngine, signature: Signature, diagnosis: Diagnosis
+    ) -> None:
+        """An explicit now should replace the clock for cooldown and recency."""
+        sig = dataclasses.replace(signature, occurrence_count=10, diagnosis=diagnosis)
+        diagnosed_at = diagnosis.diagnosed_at
+
+        assert not triage_engine.should_investigate(
+            sig, diagnosed_at + timedelta(hours=1)
+        )
+        assert triage_engine.should_investigate(sig, diagnosed_at + timedelta(hours=25))
+
+        fresh = sig.last_seen + timedelta(minutes=1)
+        stale = sig.last_seen + timedelta(hours=2)
+        assert triage_engine.calculate_priority(sig, fresh) == (
+            triage_engine.calculate_priority(sig, stale) + 25
+        )
+        assert triage_engine.calculate_priorities([sig, sig], stale) == [
+            triage_engine.calculate_priority(sig, stale)
+        ] * 2
+
 
 # ============================================================================
 # PollService Tests
@@ -690,6 +794,73 @@ class TestPollService:
         assert result.updated_signatures == 1
         assert sig.occurrence_count == initial_count + 1
 
+    async def test_poll_cycle_batches_fingerprint_lookups(
+        self,
+        fingerprinter: Fingerprinter,
+        triage_engine: TriageEngine,
+        error_event: ErrorEvent,
+    ) -> None:
+        """Poll cycle should look up all fingerprints in one store call."""
+        telemetry = FakeTelemetryPort()
+        telemetry.add_error(error_event)
+        telemetry.add_error(error_event)
+        store = FakeSignatureStorePort()
+        investigator = Investigator(
+            telemetry,
+            store,
+            FakeDiagnosisPort(),
+            FakeNotificationPort(),
+            triage_engine,
+            "/app",
+        )
+
+        poll_service = PollService(
+            telemetry, store, fingerprinter, triage_engine, investigator
+        )
+
+        result = await poll_service.execute_poll_cycle()
+
+        assert len(store.get_by_fingerprints_calls) == 1
+        assert store.get_by_fingerprint_calls == []
+        # The duplicate updates the signature created earlier in the batch
+        assert result.new_signatures == 1
+        assert result.updated_signatures == 1
+        assert len(store.signatures) == 1
+
+    async def test_poll_cycle_writes_once_per_signature(
+        self,
+        fingerprinter: Fingerprinter,
+        triage_engine: TriageEngine,
+        error_event: ErrorEvent,
+        signature: Signature,
+    ) -> None:
+        """Identical errors in a batch should be written in one batched call."""
+        telemetry = FakeTelemetryPort()
+        for _ in range(5):
+            telemetry.add_error(error_event)
+        store = FakeSignatureStorePort()
+        signature.fingerprint = fingerprinter.fingerprint(error_event)
+        initial_count = signature.occurrence_count
+        store.signatures[signature.fingerprint] = signature
+        investigator = Investigator(
+            telemetry,
+            store,
+            FakeDiagnosisPort(),
+            FakeNotificationPort(),
+            triage_engine,
+            "/app",
+        )
+
+        poll_service = PollService(
+            telemetry, store, fingerprinter, triage_engine, investigator
+        )
+
+        result = await poll_service.execute_poll_cycle()
+
+        assert result.updated_signatures == 5
+        assert store.save_many_calls == [[signature]]
+        assert signature.occurrence_count == initial_count + 5
+
     async def test_investigation_cycle_calls_investigator(
         self,
         fingerprinter: Fingerprinter,
@@ -722,6 +893,223 @@ class TestPollService:
         assert signature.status == SignatureStatus.DIAGNOSED
         assert signature.diagnosis is not None
 
+    async def test_investigation_cycle_limits_to_highest_priority(
+        self,
+        fingerprinter: Fingerprinter,
+        triage_engine: TriageEngine,
+        signature: Signature,
+    ) -> None:
+        """Investigation batch size should keep only the top-priority signatures."""
+        telemetry = FakeTelemetryPort()
+        store = FakeSignatureStorePort()
+        investigator = Investigator(
+            telemetry,
+            store,
+            FakeDiagnosisPort(),
+            FakeNotificationPort(),
+            triage_engine,
+            "/app",
+        )
+        poll_service = PollService(
+            telemetry,
+            store,
+            fingerprinter,
+            triage_engine,
+            investigator,
+            investigation_batch_size=1,
+        )
+
+        low = dataclasses.replace(signature, id="sig-low", occurrence_count=5)
+        high = dataclasses.replace(signature, id="sig-high", occurrence_count=50)
+        store.pending_signatures = [low, high]
+
+        result = await poll_service.execute_investigation_cycle()
+
+        assert result.investigations_attempted == 1
+        assert high.status == SignatureStatus.DIAGNOSED
+        assert low.status == SignatureStatus.NEW
+
+    async def test_investigation_cycle_bounds_concurrent_diagnoses(
+        self,
+        fingerprinter: Fingerprinter,
+        triage_engine: TriageEngine,
+        signature: Signature,
+    ) -> None:
+        """Investigations should overlap up to max_concurrent_investigations."""
+
+        class SlowDiagnosisPort(FakeDiagnosisPort):
+            def __init__(self) -> None:
+                super().__init__()
+                self.in_flight = 0
+                self.max_in_flight = 0
+
+            async def diagnose(self, context: InvestigationContext) -> Diagnosis:
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+                try:
+                    await asyncio.sleep(0.01)
+                    return await super().diagnose(context)
+                finally:
+                    self.in_flight -= 1
+
+        telemetry = FakeTelemetryPort()
+        store = FakeSignatureStorePort()
+        diagnosis_engine = SlowDiagnosisPort()
+        investigator = Investigator(
+            telemetry,
+            store,
+            diagnosis_engine,
+            FakeNotificationPort(),
+            triage_engine,
+            "/app",
+        )
+        poll_service = PollService(
+            telemetry,
+            store,
+            fingerprinter,
+            triage_engine,
+            investigator,
+            max_concurrent_investigations=2,
+        )
+        store.pending_signatures = [
+            dataclasses.replace(signature, id=f"sig-{i}", fingerprint=f"fp-{i}")
+            for i in range(3)
+        ]
+
+        result = await poll_service.execute_investigation_cycle()
+
+        assert diagnosis_engine.max_in_flight == 2
+        assert result.investigations_attempted == 3
+        assert result.investigations_failed == 0
+        assert len(result.diagnoses_produced) == 3
+
+    async def test_investigation_cycle_sends_notifications_in_one_batch(
+        self,
+        fingerprinter: Fingerprinter,
+        triage_engine: TriageEngine,
+        signature: Signature,
+    ) -> None:
+        """The cycle should hand every warranted notification to report_many once."""
+        notification = BatchingNotificationPort()
+        store = FakeSignatureStorePort()
+        investigator = Investigator(
+            FakeTelemetryPort(),
+            store,
+            FakeDiagnosisPort(),
+            notification,
+            triage_engine,
+            "/app",
+        )
+        poll_service = PollService(
+            FakeTelemetryPort(),
+            store,
+            fingerprinter,
+            triage_engine,
+            investigator,
+            max_concurrent_investigations=2,
+        )
+        store.pending_signatures = [
+            dataclasses.replace(signature, id=f"sig-{i}", fingerprint=f"fp-{i}")
+            for i in range(3)
+        ]
+
+        result = await poll_service.execute_investigation_cycle()
+
+        assert len(result.diagnoses_produced) == 3
+        assert len(notification.batches) == 1
+        assert sorted(notification.batches[0]) == ["sig-0", "sig-1", "sig-2"]
+        assert notification.report_call_count == 3
+
+    async def test_cancelled_cycle_still_notifies_finished_investigations(
+        self,
+        fingerprinter: Fingerprinter,
+        triage_engine: TriageEngine,
+        signature: Signature,
+    ) -> None:
+        """Diagnoses persisted before a cancellation should still be reported."""
+        slow_started = asyncio.Event()
+
+        class SlowDiagnosisPort(FakeDiagnosisPort):
+            async def diagnose(self, context: InvestigationContext) -> Diagnosis:
+                if context.signature.id == "sig-slow":
+                    slow_started.set()
+                    await asyncio.Event().wait()
+                return await super().diagnose(context)
+
+        notification = BatchingNotificationPort()
+        store = FakeSignatureStorePort()
+        investigator = Investigator(
+            FakeTelemetryPort(),
+            store,
+            SlowDiagnosisPort(),
+            notification,
+            triage_engine,
+            "/app",
+        )
+        poll_service = PollService(
+            FakeTelemetryPort(),
+            store,
+            fingerprinter,
+            triage_engine,
+            investigator,
+            max_concurrent_investigations=2,
+        )
+        store.pending_signatures = [
+            dataclasses.replace(signature, id=sig_id, fingerprint=f"fp-{sig_id}")
+            for sig_id in ("sig-fast", "sig-slow")
+        ]
+
+        cycle = asyncio.create_task(poll_service.execute_investigation_cycle())
+        await slow_started.wait()
+        # Let the fast investigation finish and queue its notification
+        while store.signatures_by_id.get("sig-fast") is None:
+            await asyncio.sleep(0)
+        cycle.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cycle
+
+        assert notification.batches == [["sig-fast"]]
+
+    async def test_local_refusal_leaves_the_circuit_half_open(
+        self,
+        fingerprinter: Fingerprinter,
+        triage_engine: TriageEngine,
+        signature: Signature,
+    ) -> None:
+        """A ValueError refusal taken as the trial should not close the circuit."""
+
+        class RefusingDiagnosisPort(FakeDiagnosisPort):
+            async def diagnose(self, context: InvestigationContext) -> Diagnosis:
+                raise ValueError("prompt too large")
+
+        telemetry = FakeTelemetryPort()
+        store = FakeSignatureStorePort()
+        investigator = Investigator(
+            telemetry,
+            store,
+            RefusingDiagnosisPort(),
+            FakeNotificationPort(),
+            triage_engine,
+            "/app",
+        )
+        breaker = CircuitBreaker("diagnosis", failure_threshold=1, reset_timeout_seconds=0)
+        breaker.record_failure()
+        poll_service = PollService(
+            telemetry,
+            store,
+            fingerprinter,
+            triage_engine,
+            investigator,
+            investigation_breaker=breaker,
+        )
+        store.pending_signatures = [dataclasses.replace(signature, occurrence_count=10)]
+
+        result = await poll_service.execute_investigation_cycle()
+
+        assert result.investigations_failed == 1
+        assert breaker.state == "half_open"
+        assert breaker.allow()
+
     async def test_investigation_cycle_continues_after_one_fails(
         self,
         fingerprinter: Fingerprinter,
@@ -905,11 +1293,212 @@ class TestDatetimeAwareness:
         assert result.errors_found == 5  # Only 5 errors processed due to batch size limit
         assert (result.new_signatures + result.updated_signatures) == 5  # All processed are new
 
+    @pytest.mark.asyncio
+    async def test_poll_resumes_after_last_consumed_error(
+        self,
+        fingerprinter: Fingerprinter,
+        triage_engine: TriageEngine,
+    ) -> None:
+        """Overlapping lookback windows should not count an error twice."""
+        now = datetime.now(UTC)
+        errors = [
+            ErrorEvent(
+                trace_id=f"trace-{i}",
+                span_id=f"span-{i}",
+                service="service",
+                error_type="TestError",
+                error_message="Error",
+                stack_frames=(),
+                timestamp=now - timedelta(seconds=10 - i),
+                attributes={},
+                severity=Severity.ERROR,
+            )
+            for i in range(5)
+        ]
+
+        telemetry = FakeTelemetryPort()
+        telemetry.add_errors(errors)
+        store = FakeSignatureStorePort()
+        investigator = Investigator(
+            telemetry,
+            store,
+            FakeDiagnosisPort(),
+            FakeNotificationPort(),
+            triage_engine,
+            "/app",
+        )
+        poll_service = PollService(
+            telemetry, store, fingerprinter, triage_engine, investigator, batch_size=3
+        )
+
+        first = await poll_service.execute_poll_cycle()
+        second = await poll_service.execute_poll_cycle()
+        third = await poll_service.execute_poll_cycle()
+
+        assert [first.errors_found, second.errors_found, third.errors_found] == [3, 2, 0]
+        signature = store.signatures[fingerprinter.fingerprint(errors[0])]
+        assert signature.occurrence_count == 5
+        assert signature.last_seen == errors[-1].timestamp
+
+    @pytest.mark.asyncio
+    async def test_poll_records_error_ingested_after_newer_ones(
+        self,
+        fingerprinter: Fingerprinter,
+        triage_engine: TriageEngine,
+    ) -> None:
+        """An older error that shows up late should still be counted once."""
+        now = datetime.now(UTC)
+        oldest = ErrorEvent(
+            trace_id="trace-oldest",
+            span_id="span-oldest",
+            service="service",
+            error_type="TestError",
+            error_message="Error",
+            stack_frames=(),
+            timestamp=now - timedelta(seconds=90),
+            attributes={},
+            severity=Severity.ERROR,
+        )
+        recent = dataclasses.replace(
+            oldest,
+            trace_id="trace-recent",
+            span_id="span-recent",
+            timestamp=now - timedelta(seconds=5),
+        )
+        late = dataclasses.replace(
+            oldest,
+            trace_id="trace-late",
+            span_id="span-late",
+            timestamp=now - timedelta(seconds=60),
+        )
+        # Older than the signature's first_seen
+        earliest = dataclasses.replace(
+            oldest,
+            trace_id="trace-earliest",
+            span_id="span-earliest",
+            timestamp=now - timedelta(seconds=120),
+        )
+
+        telemetry = FakeTelemetryPort()
+        telemetry.add_errors([oldest, recent])
+        store = FakeSignatureStorePort()
+        investigator = Investigator(
+            telemetry,
+            store,
+            FakeDiagnosisPort(),
+            FakeNotificationPort(),
+            triage_engine,
+            "/app",
+        )
+        poll_service = PollService(
+            telemetry, store, fingerprinter, triage_engine, investigator
+        )
+
+        first = await poll_service.execute_poll_cycle()
+        # The backend ingests events older than ones already polled
+        telemetry.add_errors([late, earliest])
+        second = await poll_service.execute_poll_cycle()
+        third = await poll_service.execute_poll_cycle()
+
+        assert [first.errors_found, second.errors_found, third.errors_found] == [2, 2, 0]
+        assert second.errors_failed_to_process == 0
+        signature = store.signatures[fingerprinter.fingerprint(recent)]
+        assert signature.occurrence_count == 4
+        assert signature.first_seen == earliest.timestamp
+        assert signature.last_seen == recent.timestamp
+
 
 @pytest.mark.asyncio
 class TestPollCycleErrorHandling:
     """Tests for comprehensive error handling in poll cycle."""
 
+    async def test_poll_fails_fast_while_telemetry_circuit_is_open(
+        self,
+        fingerprinter: Fingerprinter,
+        triage_engine: TriageEngine,
+    ) -> None:
+        """After repeated telemetry failures, polls should not call the backend."""
+
+        class CountingTelemetryPort(FakeTelemetryPort):
+            calls = 0
+
+            async def get_recent_errors(self, since, services=None):
+                self.calls += 1
+                return await super().get_recent_errors(since, services)
+
+        telemetry = CountingTelemetryPort()
+        telemetry.set_error(ConnectionError("backend down"))
+        store = FakeSignatureStorePort()
+        investigator = Investigator(
+            telemetry,
+            store,
+            FakeDiagnosisPort(),
+            FakeNotificationPort(),
+            triage_engine,
+            "/app",
+        )
+        poll_service = PollService(
+            telemetry,
+            store,
+            fingerprinter,
+            triage_engine,
+            investigator,
+            telemetry_breaker=CircuitBreaker("telemetry", failure_threshold=2),
+        )
+
+        for _ in range(2):
+            with pytest.raises(ConnectionError):
+                await poll_service.execute_poll_cycle()
+        with pytest.raises(RuntimeError, match="Telemetry backend unavailable"):
+            await poll_service.execute_poll_cycle()
+
+        assert telemetry.calls == 2
+
+    async def test_cancelled_trial_poll_frees_the_circuit(
+        self,
+        fingerprinter: Fingerprinter,
+        triage_engine: TriageEngine,
+    ) -> None:
+        """A half-open trial poll that is cancelled should not wedge the breaker."""
+        fetch_started = asyncio.Event()
+
+        class HangingTelemetryPort(FakeTelemetryPort):
+            async def get_recent_errors(self, since, services=None):
+                fetch_started.set()
+                await asyncio.Event().wait()
+                return []
+
+        telemetry = HangingTelemetryPort()
+        store = FakeSignatureStorePort()
+        investigator = Investigator(
+            telemetry,
+            store,
+            FakeDiagnosisPort(),
+            FakeNotificationPort(),
+            triage_engine,
+            "/app",
+        )
+        breaker = CircuitBreaker(
+            "telemetry", failure_threshold=1, reset_timeout_seconds=0
+        )
+        breaker.record_failure()
+        poll_service = PollService(
+            telemetry,
+            store,
+            fingerprinter,
+            triage_engine,
+            investigator,
+            telemetry_breaker=breaker,
+        )
+
+        trial = asyncio.create_task(poll_service.execute_poll_cycle())
+        await fetch_started.wait()
+        trial.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await trial
+
+        assert breaker.allow()
+
     async def test_poll_continues_after_individual_error(
         self,
         fingerprinter: Fingerprinter,
@@ -972,6 +1561,59 @@ class TestPollCycleErrorHandling:
         # Only 1 should be successfully processed (the first one, second will fail)
         assert (result.new_signatures + result.updated_signatures) >= 1
 
+    async def test_poll_saves_other_signatures_when_one_row_fails(
+        self,
+        fingerprinter: Fingerprinter,
+        triage_engine: TriageEngine,
+    ) -> None:
+        """One signature the store rejects should not fail the whole poll."""
+
+        class RejectingStore(FakeSignatureStorePort):
+            async def save(self, signature: Signature) -> None:
+                if signature.error_type == "Error1":
+                    raise RuntimeError("constraint violation")
+                await super().save(signature)
+
+        error1 = ErrorEvent(
+            trace_id="trace-1",
+            span_id="span-1",
+            service="service",
+            error_type="Error1",
+            error_message="Error 1",
+            stack_frames=(),
+            timestamp=datetime.now(UTC),
+            attributes={},
+            severity=Severity.ERROR,
+        )
+        error2 = dataclasses.replace(
+            error1, trace_id="trace-2", span_id="span-2", error_type="Error2"
+        )
+
+        telemetry = FakeTelemetryPort()
+        telemetry.add_errors([error1, error2])
+        store = RejectingStore()
+        investigator = Investigator(
+            telemetry,
+            store,
+            FakeDiagnosisPort(),
+            FakeNotificationPort(),
+            triage_engine,
+            "/app",
+        )
+        poll_service = PollService(
+            telemetry, store, fingerprinter, triage_engine, investigator
+        )
+
+        result = await poll_service.execute_poll_cycle()
+
+        assert result.new_signatures == 1
+        assert result.errors_failed_to_process == 1
+        assert [s.error_type for s in store.saved_signatures] == ["Error2"]
+
+        # The rejected event is retried; the saved one is not counted again
+        retry = await poll_service.execute_poll_cycle()
+        assert retry.errors_found == 1
+
 
 class TestDiagnosisParsingValidation:
     """Tests for strict diagnosis parsing that raises on errors."""
@@ -1085,7 +1727,7 @@ class TestPartialTraceRetrieval:
         ]
 
         class PartialTelemetryForInvestigator(PartialTraceTelemetryPort):
-            async def get_events_for_signature(self, fingerprint, limit=5):
+            async def get_events_for_signature(self, fingerprint, limit=5, services=None):
                 return events
 
         telemetry = PartialTelemetryForInvestigator(fail_trace_count=2)
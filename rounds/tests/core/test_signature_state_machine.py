@@ -306,9 +306,17 @@ def test_record_occurrence_invariants(signature: Signature) -> None:
     assert signature.last_seen == new_timestamp
 
 
-def test_record_occurrence_before_first_seen_fails(signature: Signature) -> None:
-    """record_occurrence should fail if timestamp is before first_seen."""
+def test_record_occurrence_before_first_seen_moves_first_seen(
+    signature: Signature,
+) -> None:
+    """An occurrence older than first_seen should be counted and extend it."""
     from datetime import timedelta
+    original_count = signature.occurrence_count
+    last_seen = signature.last_seen
     early_timestamp = signature.first_seen - timedelta(seconds=1)
-    with pytest.raises(ValueError, match="cannot be before first_seen"):
-        signature.record_occurrence(early_timestamp)
+
+    signature.record_occurrence(early_timestamp)
+
+    assert signature.occurrence_count == original_count + 1
+    assert signature.first_seen == early_timestamp
+    assert signature.last_seen == last_seen
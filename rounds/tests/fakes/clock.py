@@ -0,0 +1,15 @@
+"""Fake monotonic clock for testing."""
+
+
+class FakeClock:
+    """Manually advanced monotonic clock.
+
+    Pass an instance wherever a ``clock: Callable[[], float]`` is accepted
+    and set ``now`` to move time forward.
+    """
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
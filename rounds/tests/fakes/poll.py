@@ -1,5 +1,6 @@
 """Fake PollPort implementation for testing."""
 
+import asyncio
 from datetime import UTC, datetime
 
 from rounds.core.models import InvestigationResult, PollResult
@@ -23,6 +24,9 @@ class FakePollPort(PollPort):
         self.should_fail: bool = False
         self.fail_message: str = "Poll failed"
         self.should_fail_investigation: bool = False
+        # Set when a cycle starts, so tests can wait for one instead of sleeping
+        self.poll_cycle_event = asyncio.Event()
+        self.investigation_cycle_event = asyncio.Event()
 
     def set_default_poll_result(self, result: PollResult) -> None:
         """Set the default poll result to return."""
@@ -51,6 +55,7 @@ class FakePollPort(PollPort):
         Returns queued results or the default result.
         """
         self.execute_poll_cycle_call_count += 1
+        self.poll_cycle_event.set()
 
         if self.should_fail:
             raise RuntimeError(self.fail_message)
@@ -76,6 +81,7 @@ class FakePollPort(PollPort):
         Returns queued results or the default result.
         """
         self.execute_investigation_cycle_call_count += 1
+        self.investigation_cycle_event.set()
 
         if self.should_fail or self.should_fail_investigation:
             raise RuntimeError(self.fail_message)
@@ -109,3 +115,5 @@ class FakePollPort(PollPort):
         self.should_fail = False
         self.should_fail_investigation = False
         self.fail_message = "Poll failed"
+        self.poll_cycle_event.clear()
+        self.investigation_cycle_event.clear()
@@ -1,5 +1,6 @@
 """Fake SignatureStorePort implementation for testing."""
 
+from collections.abc import Sequence
 from datetime import datetime
 
 from rounds.core.models import Signature, SignatureStatus, StoreStats
@@ -20,8 +21,10 @@ class FakeSignatureStorePort(SignatureStorePort):
         self.pending_signatures: list[Signature] = []
         self.saved_signatures: list[Signature] = []
         self.updated_signatures: list[Signature] = []
+        self.save_many_calls: list[list[Signature]] = []
         self.get_by_id_calls: list[str] = []
         self.get_by_fingerprint_calls: list[str] = []
+        self.get_by_fingerprints_calls: list[list[str]] = []
         self.get_pending_investigation_call_count = 0
         self.get_similar_calls: list[tuple[Signature, int]] = []
 
@@ -41,6 +44,18 @@ class FakeSignatureStorePort(SignatureStorePort):
         self.get_by_fingerprint_calls.append(fingerprint)
         return self.signatures.get(fingerprint)
 
+    async def get_by_fingerprints(
+        self, fingerprints: Sequence[str]
+    ) -> dict[str, Signature]:
+        """Get several signatures by fingerprint.
+
+        Returns a mapping containing only the fingerprints that are found.
+        """
+        self.get_by_fingerprints_calls.append(list(fingerprints))
+        return {
+            fp: self.signatures[fp] for fp in fingerprints if fp in self.signatures
+        }
+
     async def save(self, signature: Signature) -> None:
         """Save a new signature.
 
@@ -50,6 +65,14 @@ class FakeSignatureStorePort(SignatureStorePort):
         self.signatures_by_id[signature.id] = signature
         self.saved_signatures.append(signature)
 
+    async def save_many(self, signatures: Sequence[Signature]) -> None:
+        """Save several signatures.
+
+        Records the batch, then saves each signature individually.
+        """
+        self.save_many_calls.append(list(signatures))
+        await super().save_many(signatures)
+
     async def update(self, signature: Signature) -> None:
         """Update an existing signature.
 
@@ -150,7 +173,9 @@ class FakeSignatureStorePort(SignatureStorePort):
         self.pending_signatures.clear()
         self.saved_signatures.clear()
         self.updated_signatures.clear()
+        self.save_many_calls.clear()
         self.get_by_id_calls.clear()
         self.get_by_fingerprint_calls.clear()
+        self.get_by_fingerprints_calls.clear()
         self.get_pending_investigation_call_count = 0
         self.get_similar_calls.clear()
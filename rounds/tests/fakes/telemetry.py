@@ -146,7 +146,7 @@ class FakeTelemetryPort(TelemetryPort):
         return result
 
     async def get_events_for_signature(
-        self, fingerprint: str, limit: int = 5
+        self, fingerprint: str, limit: int = 5, services: list[str] | None = None
     ) -> list[ErrorEvent]:
         """Get events for a specific error signature.
 
@@ -167,6 +167,24 @@ class TestInteractiveCLILoop:
                           if any("error" in str(arg).lower() for arg in call[0])]
             assert len(error_calls) > 0
 
+    async def test_cli_logs_input_errors_without_traceback(
+        self, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Invalid input should be logged as a warning with no traceback."""
+        management = FakeManagementPort()
+        handler = CLICommandHandler(management)
+
+        commands = ["details {}", "exit"]
+
+        with patch("builtins.input", side_effect=commands):
+            with patch("builtins.print"):
+                await _run_cli_interactive(handler)
+
+        records = [r for r in caplog.records if "signature_id" in r.getMessage()]
+        assert len(records) == 1
+        assert records[0].levelname == "WARNING"
+        assert records[0].exc_info is None
+
     @pytest.mark.parametrize(
         "critical_error",
         [
@@ -5,10 +5,13 @@ instantiates adapters, initializes core services, and wires dependencies.
 """
 
 import asyncio
+import json
 import os
 import tempfile
+from datetime import UTC, datetime
 from pathlib import Path
-from unittest.mock import AsyncMock, patch
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from pydantic import ValidationError
@@ -92,6 +95,36 @@ class TestBootstrapErrorHandling:
             assert "ERROR: Configuration validation failed" in captured.out
             assert "Invalid telemetry backend" in captured.out
 
+    @pytest.mark.asyncio
+    async def test_bootstrap_closes_built_adapters_when_later_one_fails(self) -> None:
+        """Adapters built before a failing one should still be closed."""
+        from rounds.adapters.store.sqlite import SQLiteSignatureStore
+        from rounds.adapters.telemetry.signoz import SigNozTelemetryAdapter
+        from rounds.main import bootstrap
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            env = {
+                "TELEMETRY_BACKEND": "signoz",
+                "STORE_BACKEND": "sqlite",
+                "STORE_SQLITE_PATH": str(Path(tmpdir) / "test.db"),
+                "DIAGNOSIS_BACKEND": "claude_code",
+            }
+            with (
+                patch.dict(os.environ, env),
+                patch.object(SigNozTelemetryAdapter, "close", AsyncMock()) as close,
+                patch.object(
+                    SQLiteSignatureStore, "close_pool", AsyncMock()
+                ) as close_pool,
+                patch(
+                    "rounds.adapters.diagnosis.claude_code.ClaudeCodeDiagnosisAdapter",
+                    side_effect=RuntimeError("claude CLI missing"),
+                ),
+            ):
+                with pytest.raises(RuntimeError, match="claude CLI missing"):
+                    await bootstrap()
+
+        close.assert_awaited_once()
+        close_pool.assert_awaited_once()
 
 class TestAdapterInstantiation:
     """Test that adapters are correctly instantiated with configuration."""
@@ -296,6 +329,89 @@ class TestDependencyWiring:
             assert investigator.diagnosis_engine is diagnosis
             assert investigator.notification is notification
 
+    @pytest.mark.asyncio
+    async def test_management_service_bypasses_diagnosis_cache(self) -> None:
+        """Reinvestigation should reach the diagnosis engine, not the cache."""
+        from rounds.adapters.diagnosis.cached import CachingDiagnosisAdapter
+        from rounds.main import bootstrap
+
+        engine = AsyncMock()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            env = {
+                "TELEMETRY_BACKEND": "signoz",
+                "STORE_BACKEND": "sqlite",
+                "STORE_SQLITE_PATH": str(Path(tmpdir) / "test.db"),
+                "DIAGNOSIS_BACKEND": "claude_code",
+                "DIAGNOSIS_CACHE_TTL_SECONDS": "3600",
+            }
+            with (
+                patch.dict(os.environ, env),
+                patch(
+                    "rounds.adapters.diagnosis.claude_code.ClaudeCodeDiagnosisAdapter",
+                    return_value=engine,
+                ),
+                patch("rounds.main.Investigator") as investigator,
+                patch(
+                    "rounds.main.ManagementService",
+                    side_effect=RuntimeError("stop after wiring"),
+                ) as management_service,
+            ):
+                with pytest.raises(RuntimeError, match="stop after wiring"):
+                    await bootstrap()
+
+        assert isinstance(
+            investigator.call_args.kwargs["diagnosis_engine"], CachingDiagnosisAdapter
+        )
+        assert management_service.call_args.kwargs["diagnosis_engine"] is engine
+
+    @pytest.mark.asyncio
+    async def test_diagnosis_engine_is_traced_once_without_cache(self) -> None:
+        """With tracing on and no cache, each diagnosis call gets one span."""
+        from rounds.adapters.tracing import instrument_port
+        from rounds.main import bootstrap
+        from rounds.tests.fakes import FakeDiagnosisPort
+
+        tracer = MagicMock()
+
+        def instrument(port: Any, port_name: str) -> Any:
+            return instrument_port(port, port_name, tracer=tracer)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            env = {
+                "TELEMETRY_BACKEND": "signoz",
+                "STORE_BACKEND": "sqlite",
+                "STORE_SQLITE_PATH": str(Path(tmpdir) / "test.db"),
+                "DIAGNOSIS_BACKEND": "claude_code",
+                "DIAGNOSIS_CACHE_TTL_SECONDS": "0",
+                "TRACING_ENABLED": "true",
+            }
+            with (
+                patch.dict(os.environ, env),
+                patch(
+                    "rounds.adapters.diagnosis.claude_code.ClaudeCodeDiagnosisAdapter",
+                    return_value=FakeDiagnosisPort(),
+                ),
+                patch("rounds.adapters.tracing.instrument_port", side_effect=instrument),
+                patch("rounds.main.Investigator") as investigator,
+                patch(
+                    "rounds.main.ManagementService",
+                    side_effect=RuntimeError("stop after wiring"),
+                ) as management_service,
+            ):
+                with pytest.raises(RuntimeError, match="stop after wiring"):
+                    await bootstrap()
+
+        engine = management_service.call_args.kwargs["diagnosis_engine"]
+        assert investigator.call_args.kwargs["diagnosis_engine"] is engine
+
+        await engine.estimate_cost(MagicMock())
+
+        span_names = [
+            call.args[0]
+            for call in tracer.start_as_current_span.call_args_list
+            if call.args[0].endswith(".estimate_cost")
+        ]
+        assert span_names == ["FakeDiagnosisPort.estimate_cost"]
 
 class TestBootstrapFunction:
     """Test the bootstrap function (composition root)."""
@@ -356,12 +472,29 @@ class TestLoggingConfiguration:
         assert root_logger.level == logging.DEBUG
         # Check that at least one handler exists
         assert len(root_logger.handlers) > 0
-        # Verify the format string contains JSON structure
-        handler = root_logger.handlers[0]
-        if isinstance(handler, logging.StreamHandler):
-            formatter = handler.formatter
-            if formatter and hasattr(formatter, '_fmt') and formatter._fmt:
-                assert "time" in formatter._fmt
+        # Verify records are rendered as valid JSON, even with quotes in them
+        formatter = root_logger.handlers[0].formatter
+        assert formatter is not None
+        record = logging.LogRecord(
+            "rounds", logging.ERROR, __file__, 1, 'bad "value" %s', ("x",), None
+        )
+        record.signature_id = "sig-1"
+        record.started = datetime(2026, 1, 1, tzinfo=UTC)
+        entry = json.loads(formatter.format(record))
+        assert entry["level"] == "ERROR"
+        assert entry["logger"] == "rounds"
+        assert entry["message"] == 'bad "value" x'
+        assert entry["signature_id"] == "sig-1"
+        assert entry["started"] == "2026-01-01 00:00:00+00:00"
+        assert "time" in entry
+        assert "args" not in entry
+
+    def test_configure_logging_rejects_unknown_level(self) -> None:
+        """An unknown level name should raise instead of falling back to INFO."""
+        from rounds.main import configure_logging
+
+        with pytest.raises(ValueError, match="Unknown log level"):
+            configure_logging(log_level="VERBOSE", log_format="text")
 
 
 class TestConfigurationDefaults:
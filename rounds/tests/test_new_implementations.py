@@ -312,6 +312,9 @@ class TestManagementService:
         assert updated.status == SignatureStatus.DIAGNOSED
         assert updated.diagnosis is not None
 
+        # Only the terminal state is written; the NEW reset stays in memory
+        assert store.updated_signatures == [sample_signature]
+
     async def test_reinvestigate_nonexistent_signature(
         self, service: ManagementService
     ) -> None:
@@ -5,7 +5,8 @@ Investigator, PollService) work together correctly using fake adapters.
 """
 
 import sys
-from datetime import UTC, datetime
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 import pytest
@@ -187,9 +188,15 @@ class TestPollCycleWorkflow:
         assert result1.updated_signatures == 0
         initial_count = store_port.saved_signatures[0].occurrence_count
 
-        # Setup: add more of the same error
+        # Setup: a later occurrence of the same error
         telemetry_port.reset()
-        telemetry_port.add_error(error_event)
+        telemetry_port.add_error(
+            replace(
+                error_event,
+                span_id="span-repeat",
+                timestamp=error_event.timestamp + timedelta(seconds=1),
+            )
+        )
 
         # Execute: second poll
         result2 = await poll_service.execute_poll_cycle()